@@ -9,6 +9,7 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -22,6 +23,7 @@ from typing import (
 from http import HTTPStatus
 
 import pandas as pd
+import pyarrow as pa
 from bson.objectid import ObjectId
 from pydantic import Field, root_validator
 from typeguard import typechecked
@@ -1201,6 +1203,70 @@ class FeatureList(BaseFeatureGroup, DeletableApiObject, SavableApiObject, Featur
         finally:
             temp_historical_feature_table.delete()
 
+    @typechecked
+    def iter_historical_features(
+        self,
+        observation_set: Union[ObservationTable, pd.DataFrame],
+        serving_names_mapping: Optional[Dict[str, str]] = None,
+        batch_size: int = 100000,
+        as_arrow: bool = False,
+    ) -> Iterator[Union[pd.DataFrame, pa.RecordBatch]]:
+        """
+        Computes historical feature values and iterates over them in batches as they are streamed
+        from the materialized historical feature table. Unlike compute_historical_features, the
+        whole result is never held in memory, so large training sets can be consumed incrementally.
+
+        The historical features are materialized into a temporary historical feature table when the
+        iteration starts. The temporary table is deleted when the iteration is completed or the
+        iterator is closed.
+
+        **Note**: The rows are not guaranteed to follow the order of the observation set. Include
+        a column that identifies the rows in the observation set if the order is required.
+
+        Parameters
+        ----------
+        observation_set : Union[ObservationTable, pd.DataFrame]
+            Observation set DataFrame or ObservationTable object, which combines historical
+            points-in-time and values of the feature primary entity or its descendant (serving
+            entities).
+        serving_names_mapping : Optional[Dict[str, str]]
+            Optional serving names mapping if the training events table has different serving name
+            columns than those defined in Entities, mapping from original serving name to new name.
+        batch_size: int
+            Number of rows in each batch (the last batch can be smaller).
+        as_arrow: bool
+            Whether to yield pyarrow RecordBatch objects instead of pandas DataFrames.
+
+        Yields
+        ------
+        Union[pd.DataFrame, pa.RecordBatch]
+            Batches of materialized historical features.
+
+        Examples
+        --------
+        >>> for historical_features in feature_list.iter_historical_features(  # doctest: +SKIP
+        ...     observation_set, batch_size=10000
+        ... ):
+        ...     model.partial_fit(historical_features)
+
+        See Also
+        --------
+        - [FeatureList.compute_historical_features](/reference/featurebyte.api.feature_list.FeatureList.compute_historical_features/):
+          Compute historical features as a single DataFrame.
+        """
+        temp_historical_feature_table_name = f"__TEMPORARY_HISTORICAL_FEATURE_TABLE_{ObjectId()}"
+        temp_historical_feature_table = self.compute_historical_feature_table(
+            observation_table=observation_set,
+            historical_feature_table_name=temp_historical_feature_table_name,
+            serving_names_mapping=serving_names_mapping,
+        )
+        try:
+            yield from temp_historical_feature_table.iter_batches(
+                batch_size=batch_size, as_arrow=as_arrow
+            )
+        finally:
+            temp_historical_feature_table.delete()
+
     @typechecked
     def compute_historical_feature_table(
         self,
@@ -1,7 +1,7 @@
 """
 Materialized Table Mixin
 """
-from typing import Any, Callable, ClassVar, Optional, Tuple, Union
+from typing import Any, Callable, ClassVar, Iterator, Optional, Tuple, Union
 
 import os
 import tempfile
@@ -9,11 +9,12 @@ from http import HTTPStatus
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
 from typeguard import typechecked
 
 from featurebyte.api.feature_store import FeatureStore
 from featurebyte.api.source_table import SourceTable
-from featurebyte.common.utils import parquet_from_arrow_stream
+from featurebyte.common.utils import parquet_from_arrow_stream, record_batches_from_arrow_stream
 from featurebyte.config import Configurations
 from featurebyte.exception import RecordDeletionException, RecordRetrievalException
 from featurebyte.models.materialized_table import MaterializedTableModel
@@ -75,6 +76,51 @@ class MaterializedTableMixin(MaterializedTableModel):
             self.download(output_path=output_path)
             return pd.read_parquet(output_path)
 
+    @typechecked
+    def iter_batches(
+        self, batch_size: int = 100000, as_arrow: bool = False
+    ) -> Iterator[Union[pd.DataFrame, pa.RecordBatch]]:
+        """
+        Iterates over the rows of the table in batches as they are streamed from the database,
+        without downloading the whole table first.
+
+        Parameters
+        ----------
+        batch_size: int
+            Number of rows in each batch (the last batch can be smaller).
+        as_arrow: bool
+            Whether to yield pyarrow RecordBatch objects instead of pandas DataFrames.
+
+        Yields
+        ------
+        Union[pd.DataFrame, pa.RecordBatch]
+            Batches of rows of the table.
+
+        Raises
+        ------
+        ValueError
+            Invalid batch size.
+        RecordRetrievalException
+            Error retrieving record from API.
+
+        Examples
+        --------
+        >>> for batch in table.iter_batches(batch_size=10000):  # doctest: +SKIP
+        ...     process(batch)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        client = Configurations().get_client()
+        response = client.get(f"{self._route}/pyarrow_table/{self.id}", stream=True)
+        if response.status_code != HTTPStatus.OK:
+            raise RecordRetrievalException(response)
+        try:
+            for batch in record_batches_from_arrow_stream(response, batch_size=batch_size):
+                yield batch if as_arrow else batch.to_pandas()
+        finally:
+            response.close()
+
     def delete(self) -> None:
         """
         Deletes the materialized table.
@@ -412,6 +412,7 @@ def _get_feature_list_layout() -> List[DocLayoutItem]:
         DocLayoutItem([FEATURE_LIST, MANAGE, "FeatureList.update_status"]),
         DocLayoutItem([FEATURE_LIST, SERVE, "FeatureList.compute_historical_features"]),
         DocLayoutItem([FEATURE_LIST, SERVE, "FeatureList.compute_historical_feature_table"]),
+        DocLayoutItem([FEATURE_LIST, SERVE, "FeatureList.iter_historical_features"]),
     ]
 
 
@@ -906,6 +907,7 @@ def _get_materialized_table_layout(table_type: str) -> List[DocLayoutItem]:
         DocLayoutItem([table_type, INFO, f"{table_type}.updated_at"]),
         DocLayoutItem([table_type, LINEAGE, f"{table_type}.id"]),
         DocLayoutItem([table_type, MANAGE, f"{table_type}.download"]),
+        DocLayoutItem([table_type, MANAGE, f"{table_type}.iter_batches"]),
         DocLayoutItem([table_type, MANAGE, f"{table_type}.delete"]),
     ]
 
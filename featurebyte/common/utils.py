@@ -304,6 +304,43 @@ def parquet_from_arrow_stream(response: Response, output_path: Path, num_rows: i
             pass
 
 
+def record_batches_from_arrow_stream(
+    response: Response, batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    """
+    Read record batches from arrow byte stream incrementally, regrouping the rows into record
+    batches with batch_size rows (except for the last batch)
+
+    Parameters
+    ----------
+    response: Response
+        Streamed http response
+    batch_size: int
+        Number of rows in each record batch
+
+    Yields
+    ------
+    pa.RecordBatch
+        Record batches of the arrow stream
+    """
+    reader = pa.ipc.open_stream(ResponseStream(response.iter_content(1024)))
+    pending_batches: List[pa.RecordBatch] = []
+    num_pending_rows = 0
+    for batch in reader:
+        if batch.num_rows == 0:
+            continue
+        pending_batches.append(batch)
+        num_pending_rows += batch.num_rows
+        while num_pending_rows >= batch_size:
+            table = pa.Table.from_batches(pending_batches)
+            yield table.slice(0, batch_size).combine_chunks().to_batches()[0]
+            remaining_table = table.slice(batch_size)
+            pending_batches = remaining_table.to_batches()
+            num_pending_rows = remaining_table.num_rows
+    if num_pending_rows:
+        yield pa.Table.from_batches(pending_batches).combine_chunks().to_batches()[0]
+
+
 def validate_datetime_input(value: Union[datetime, str]) -> str:
     """
     Validate datetime input value
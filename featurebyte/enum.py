@@ -226,6 +226,7 @@ class SourceType(StrEnum):
     SQLITE = "sqlite", "SQLite connection details."
     DATABRICKS = "databricks", "DataBricks connection details."
     SPARK = "spark", "Spark connection details."
+    DUCKDB = "duckdb", "DuckDB connection details."
 
     # TEST source type should only be used for mocking in unit tests.
     TEST = "test", "For testing only."
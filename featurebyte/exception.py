@@ -234,6 +234,12 @@ class DocumentDeletionError(DocumentError):
     """
 
 
+class InvalidCursorError(DocumentError):
+    """
+    Raise when the cursor used for keyset pagination is invalid
+    """
+
+
 class DocumentInconsistencyError(DocumentError):
     """
     Raise when the document consistency issue is detected
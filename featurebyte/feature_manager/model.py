@@ -54,6 +54,7 @@ class ExtendedFeatureModel(FeatureModel):
                 aggregation_id=info.aggregation_id,
                 category_column_name=info.value_by_column,
                 feature_store_id=self.tabular_source.feature_store_id,
+                cumulative_value_column_names=info.cumulative_tile_value_columns,
             )
             out.append(tile_spec)
         return out
@@ -91,19 +91,20 @@ class BaseMigrationServiceMixin:
         logger.info(
             f'Start migrating all records (collection: "{self.delegate_service.collection_name}")'
         )
-        to_iterate, page = True, 1
-        while to_iterate:
-            docs, total = await self.persistent.find(
+        start_after = None
+        while True:
+            docs = await self.persistent.find_after(
                 collection_name=self.delegate_service.collection_name,
                 query_filter=query_filter,
-                page=page,
                 page_size=page_size,
+                start_after=start_after,
             )
             for doc in docs:
                 await self.migrate_record(doc, version)
 
-            to_iterate = bool(total > (page * page_size))
-            page += 1
+            if len(docs) < page_size:
+                break
+            start_after = docs[-1]
 
         logger.info(f'Complete migration (collection: "{self.delegate_service.collection_name}")')
 
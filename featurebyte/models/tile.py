@@ -37,6 +37,8 @@ class TileSpec(FeatureByteBaseModel):
         tile value column names for the tile table
     category_column_name: Optional[str]
         optional category column name when the groupby operation specifies a category
+    cumulative_value_column_names: List[str]
+        tile value column names to be maintained in a cumulative tile table
     """
 
     time_modulo_frequency_second: int = Field(ge=0)
@@ -50,6 +52,7 @@ class TileSpec(FeatureByteBaseModel):
     aggregation_id: str
     category_column_name: Optional[str]
     feature_store_id: Optional[ObjectId]
+    cumulative_value_column_names: List[str] = Field(default_factory=list)
 
     class Config:
         """
@@ -131,6 +134,7 @@ class TileCommonParameters(FeatureByteBaseModel):
     entity_column_names: List[str]
     value_column_names: List[str]
     value_column_types: List[str]
+    cumulative_value_column_names: List[str] = Field(default_factory=list)
 
     class Config(FeatureByteBaseModel.Config):
         """Model configuration"""
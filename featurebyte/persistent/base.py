@@ -44,6 +44,69 @@ class DuplicateDocumentError(Exception):
     """
 
 
+def get_document_value(document: Document, key: str) -> Any:
+    """
+    Get the value of a (possibly dotted) key from a document
+
+    Parameters
+    ----------
+    document: Document
+        Document to get the value from
+    key: str
+        Key of the value, nested keys are separated by "."
+
+    Returns
+    -------
+    Any
+        Value of the key, or None if the key does not exist
+    """
+    value: Any = document
+    for part in key.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def get_keyset_query_filter(
+    sort_by: str, sort_dir: Optional[Literal["asc", "desc"]], start_after: Document
+) -> QueryFilter:
+    """
+    Get the query filter that selects records sorted after a record. Records are sorted by
+    `sort_by` with ties broken by `_id` in descending order. Missing & null values are sorted
+    before any other value (MongoDB sort order).
+
+    Parameters
+    ----------
+    sort_by: str
+        Column to sort by
+    sort_dir: Optional[Literal["asc", "desc"]]
+        Direction to sort
+    start_after: Document
+        Record to start after
+
+    Returns
+    -------
+    QueryFilter
+    """
+    is_ascending = sort_dir == "asc"
+    last_id = start_after["_id"]
+    if sort_by == "_id":
+        return {"_id": {"$gt" if is_ascending else "$lt": last_id}}
+
+    last_value = get_document_value(start_after, sort_by)
+    tie_filter = {sort_by: last_value, "_id": {"$lt": last_id}}
+    if last_value is None:
+        if is_ascending:
+            return {"$or": [tie_filter, {sort_by: {"$ne": None}}]}
+        return tie_filter
+
+    after_filter = {sort_by: {"$gt" if is_ascending else "$lt": last_value}}
+    if is_ascending:
+        return {"$or": [after_filter, tie_filter]}
+    return {"$or": [after_filter, tie_filter, {sort_by: None}]}
+
+
 class Persistent(ABC):
     """
     Persistent base class
@@ -188,6 +251,59 @@ class Persistent(ABC):
             page_size=page_size,
         )
 
+    async def find_after(
+        self,
+        collection_name: str,
+        query_filter: QueryFilter,
+        sort_by: Optional[str] = None,
+        sort_dir: Optional[Literal["asc", "desc"]] = "asc",
+        page_size: int = 100,
+        start_after: Optional[Document] = None,
+        user_id: Optional[ObjectId] = None,  # pylint: disable=unused-argument
+    ) -> List[Document]:
+        """
+        Find a page of records from collection using keyset pagination. Unlike `find`, the records
+        are not counted and previous pages are not skipped over: the page resumes right after the
+        last record of the previous page, so iterating over a collection scans each record once.
+        Records are sorted by `sort_by` and ties are broken by `_id` in descending order (same as
+        `find`).
+
+        Parameters
+        ----------
+        collection_name: str
+            Name of collection to use
+        query_filter: QueryFilter
+            Conditions to filter on
+        sort_by: Optional[str]
+            Column to sort by (sort by `_id` if not provided)
+        sort_dir: Optional[Literal["asc", "desc"]]
+            Direction to sort
+        page_size: int
+            Maximum number of records to return
+        start_after: Optional[Document]
+            Last record of the previous page (start from the first record if not provided)
+        user_id: Optional[ObjectId]
+            ID of user who performed this operation
+
+        Returns
+        -------
+        List[Document]
+            Retrieved documents
+        """
+        sort_by = sort_by or "_id"
+        if start_after is not None:
+            keyset_filter = get_keyset_query_filter(
+                sort_by=sort_by, sort_dir=sort_dir, start_after=start_after
+            )
+            query_filter = {**query_filter, "$and": [*query_filter.get("$and", []), keyset_filter]}
+        return await self._find_after(
+            collection_name=collection_name,
+            query_filter=query_filter,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            page_size=page_size,
+        )
+
     @audit_transaction(mode=AuditTransactionMode.SINGLE, action_type=AuditActionType.UPDATE)
     async def update_one(
         self,
@@ -642,6 +758,17 @@ class Persistent(ABC):
     ) -> Tuple[Iterable[Document], int]:
         pass
 
+    @abstractmethod
+    async def _find_after(
+        self,
+        collection_name: str,
+        query_filter: QueryFilter,
+        sort_by: str,
+        sort_dir: Optional[Literal["asc", "desc"]],
+        page_size: int,
+    ) -> List[Document]:
+        pass
+
     @abstractmethod
     async def _update_one(
         self,
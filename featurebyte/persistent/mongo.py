@@ -178,6 +178,48 @@ class MongoDB(Persistent):
         result: List[Document] = await cursor.to_list(total)
         return result, total
 
+    async def _find_after(
+        self,
+        collection_name: str,
+        query_filter: QueryFilter,
+        sort_by: str,
+        sort_dir: Optional[Literal["asc", "desc"]],
+        page_size: int,
+    ) -> List[Document]:
+        """
+        Find a page of records from collection without counting or skipping records
+
+        Parameters
+        ----------
+        collection_name: str
+            Name of collection to use
+        query_filter: QueryFilter
+            Conditions to filter on (including the keyset condition)
+        sort_by: str
+            Column to sort by
+        sort_dir: Optional[Literal["asc", "desc"]]
+            Direction to sort
+        page_size: int
+            Maximum number of records to return
+
+        Returns
+        -------
+        List[Document]
+            Retrieved documents
+        """
+        direction = pymongo.ASCENDING if sort_dir == "asc" else pymongo.DESCENDING
+        sort_keys = [(sort_by, direction)]
+        if sort_by != "_id":
+            sort_keys.append(("_id", pymongo.DESCENDING))  # break ties using _id
+        cursor = (
+            self._db[collection_name]
+            .find(query_filter, session=self._session)
+            .sort(sort_keys)
+            .limit(page_size)
+        )
+        result: List[Document] = await cursor.to_list(page_size)
+        return result
+
     async def _update_one(
         self,
         collection_name: str,
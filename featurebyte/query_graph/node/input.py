@@ -48,6 +48,7 @@ class BaseInputNodeParameters(BaseModel):
         SourceType.DATABRICKS: ClassEnum.DATABRICK_DETAILS,
         SourceType.SPARK: ClassEnum.SPARK_DETAILS,
         SourceType.SQLITE: ClassEnum.SQLITE_DETAILS,
+        SourceType.DUCKDB: ClassEnum.DUCKDB_DETAILS,
         SourceType.TEST: ClassEnum.TESTDB_DETAILS,
     }
 
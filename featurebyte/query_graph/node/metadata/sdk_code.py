@@ -212,6 +212,7 @@ class ClassEnum(Enum):
     DATABRICK_DETAILS = ("featurebyte", "DatabricksDetails")
     SPARK_DETAILS = ("featurebyte", "SparkDetails")
     SQLITE_DETAILS = ("featurebyte.query_graph.node.schema", "SQLiteDetails")
+    DUCKDB_DETAILS = ("featurebyte.query_graph.node.schema", "DuckDBDetails")
     TESTDB_DETAILS = ("featurebyte.query_graph.node.schema", "TestDatabaseDetails")
 
     # table details & tabular source
@@ -59,6 +59,14 @@ class SQLiteDetails(BaseDatabaseDetails):
     is_local_source: ClassVar[bool] = True
 
 
+class DuckDBDetails(BaseDatabaseDetails):
+    """Model for DuckDB data source information"""
+
+    database_path: StrictStr
+    featurebyte_schema: StrictStr = Field(default="main")
+    is_local_source: ClassVar[bool] = True
+
+
 class DatabricksDetails(BaseDatabaseDetails):
     """
     Model for details used to connect to a Databricks data source.
@@ -155,7 +163,12 @@ class TestDatabaseDetails(BaseDatabaseDetails):
 
 
 DatabaseDetails = Union[
-    SnowflakeDetails, SparkDetails, SQLiteDetails, DatabricksDetails, TestDatabaseDetails
+    SnowflakeDetails,
+    SparkDetails,
+    SQLiteDetails,
+    DatabricksDetails,
+    DuckDBDetails,
+    TestDatabaseDetails,
 ]
 
 
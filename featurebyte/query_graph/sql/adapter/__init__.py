@@ -6,12 +6,14 @@ from __future__ import annotations
 from featurebyte.enum import SourceType
 from featurebyte.query_graph.sql.adapter.base import BaseAdapter
 from featurebyte.query_graph.sql.adapter.databricks import DatabricksAdapter
+from featurebyte.query_graph.sql.adapter.duckdb import DuckDBAdapter
 from featurebyte.query_graph.sql.adapter.snowflake import SnowflakeAdapter
 from featurebyte.query_graph.sql.adapter.spark import SparkAdapter
 
 __all__ = [
     "BaseAdapter",
     "DatabricksAdapter",
+    "DuckDBAdapter",
     "SnowflakeAdapter",
     "SparkAdapter",
     "get_sql_adapter",
@@ -36,4 +38,6 @@ def get_sql_adapter(source_type: SourceType) -> BaseAdapter:
         return DatabricksAdapter()
     if source_type == SourceType.SPARK:
         return SparkAdapter()
+    if source_type == SourceType.DUCKDB:
+        return DuckDBAdapter()
     return SnowflakeAdapter()
@@ -0,0 +1,187 @@
+"""
+DuckDBAdapter class for generating DuckDB specific SQL expressions
+"""
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+import re
+
+from sqlglot import expressions
+from sqlglot.expressions import Expression, Select
+
+from featurebyte.enum import DBVarType, StrEnum
+from featurebyte.query_graph.node.schema import TableDetails
+from featurebyte.query_graph.sql.adapter.base import BaseAdapter
+from featurebyte.query_graph.sql.ast.literal import make_literal_value
+from featurebyte.query_graph.sql.common import get_fully_qualified_table_name
+
+
+class DuckDBAdapter(BaseAdapter):
+    """
+    Helper class to generate DuckDB specific SQL expressions
+
+    Dictionaries (e.g. count dict features) are represented as JSON strings, similar to how
+    Snowflake represents them as OBJECT values.
+    """
+
+    class DataType(StrEnum):
+        """
+        Possible column types in DuckDB
+        """
+
+        FLOAT = "DOUBLE"
+        TIMESTAMP = "TIMESTAMP"
+        TIMESTAMP_TZ = "TIMESTAMPTZ"
+        VARCHAR = "VARCHAR"
+        JSON = "JSON"
+
+    @classmethod
+    def _add_microseconds(cls, quantity_expr: Expression, timestamp_expr: Expression) -> Expression:
+        interval_expr = expressions.Anonymous(
+            this="TO_MICROSECONDS",
+            expressions=[
+                expressions.Cast(this=quantity_expr, to=expressions.DataType.build("BIGINT"))
+            ],
+        )
+        return expressions.Add(this=timestamp_expr, expression=interval_expr)
+
+    @classmethod
+    def to_epoch_seconds(cls, timestamp_expr: Expression) -> Expression:
+        return expressions.Anonymous(this="EPOCH", expressions=[timestamp_expr])
+
+    @classmethod
+    def str_trim(
+        cls, expr: Expression, character: Optional[str], side: Literal["left", "right", "both"]
+    ) -> Expression:
+        function_name = {"left": "LTRIM", "right": "RTRIM", "both": "TRIM"}[side]
+        if character is None:
+            return expressions.Anonymous(this=function_name, expressions=[expr])
+        return expressions.Anonymous(
+            this=function_name, expressions=[expr, make_literal_value(character)]
+        )
+
+    @classmethod
+    def adjust_dayofweek(cls, extracted_expr: Expression) -> Expression:
+        # pandas: Monday=0, Sunday=6; duckdb: Sunday=0, Saturday=6
+        return expressions.Mod(
+            this=expressions.Paren(
+                this=expressions.Add(this=extracted_expr, expression=make_literal_value(6))
+            ),
+            expression=make_literal_value(7),
+        )
+
+    @classmethod
+    def dateadd_second(cls, quantity_expr: Expression, timestamp_expr: Expression) -> Expression:
+        quantity_expr = expressions.Mul(this=quantity_expr, expression=make_literal_value(1e6))
+        return cls._add_microseconds(quantity_expr, timestamp_expr)
+
+    @classmethod
+    def dateadd_microsecond(
+        cls, quantity_expr: Expression, timestamp_expr: Expression
+    ) -> Expression:
+        return cls._add_microseconds(quantity_expr, timestamp_expr)
+
+    @classmethod
+    def datediff_microsecond(
+        cls, timestamp_expr_1: Expression, timestamp_expr_2: Expression
+    ) -> Expression:
+        return expressions.Anonymous(
+            this="DATE_DIFF",
+            expressions=[make_literal_value("microsecond"), timestamp_expr_1, timestamp_expr_2],
+        )
+
+    @classmethod
+    def object_agg(cls, key_column: str | Expression, value_column: str | Expression) -> Expression:
+        return expressions.Anonymous(
+            this="JSON_GROUP_OBJECT", expressions=[key_column, value_column]
+        )
+
+    @classmethod
+    def get_physical_type_from_dtype(cls, dtype: DBVarType) -> str:
+        mapping = {
+            DBVarType.INT: cls.DataType.FLOAT,
+            DBVarType.FLOAT: cls.DataType.FLOAT,
+            DBVarType.VARCHAR: cls.DataType.VARCHAR,
+            DBVarType.OBJECT: cls.DataType.JSON,
+            DBVarType.TIMESTAMP: cls.DataType.TIMESTAMP,
+            DBVarType.TIMESTAMP_TZ: cls.DataType.TIMESTAMP_TZ,
+        }
+        if dtype in mapping:
+            return mapping[dtype]
+        return cls.DataType.VARCHAR
+
+    @classmethod
+    def object_keys(cls, dictionary_expression: Expression) -> Expression:
+        return expressions.Anonymous(this="JSON_KEYS", expressions=[dictionary_expression])
+
+    @classmethod
+    def in_array(cls, input_expression: Expression, array_expression: Expression) -> Expression:
+        return expressions.Anonymous(
+            this="LIST_CONTAINS", expressions=[array_expression, input_expression]
+        )
+
+    @classmethod
+    def is_string_type(cls, column_expr: Expression) -> Expression:
+        return expressions.EQ(
+            this=expressions.Anonymous(this="TYPEOF", expressions=[column_expr]),
+            expression=make_literal_value("VARCHAR"),
+        )
+
+    @classmethod
+    def get_value_from_dictionary(
+        cls, dictionary_expression: Expression, key_expression: Expression
+    ) -> Expression:
+        # quote the key so that it is not interpreted as a json path
+        json_path_expr = expressions.DPipe(
+            this=expressions.DPipe(this=make_literal_value('$."'), expression=key_expression),
+            expression=make_literal_value('"'),
+        )
+        return expressions.Anonymous(
+            this="JSON_EXTRACT", expressions=[dictionary_expression, json_path_expr]
+        )
+
+    @classmethod
+    def convert_to_utc_timestamp(cls, timestamp_expr: Expression) -> Expression:
+        # The session timezone is UTC, so casting converts timestamps with timezone to UTC
+        return expressions.Cast(this=timestamp_expr, to=expressions.DataType.build("TIMESTAMP"))
+
+    @classmethod
+    def current_timestamp(cls) -> Expression:
+        return expressions.Cast(
+            this=expressions.Anonymous(this="NOW"), to=expressions.DataType.build("TIMESTAMP")
+        )
+
+    @classmethod
+    def escape_quote_char(cls, query: str) -> str:
+        # DuckDB escapes ' with ''. Use regex to make it safe to call this more than once.
+        return re.sub("(?<!')'(?!')", "''", query)
+
+    @classmethod
+    def create_table_as(cls, table_details: TableDetails, select_expr: Select) -> Expression:
+        """
+        Construct query to create a table using a select statement
+
+        Parameters
+        ----------
+        table_details: TableDetails
+            TableDetails of the table to be created
+        select_expr: Select
+            Select expression
+
+        Returns
+        -------
+        Expression
+        """
+        destination_expr = get_fully_qualified_table_name(table_details.dict())
+        return expressions.Create(
+            this=expressions.Table(this=destination_expr),
+            kind="TABLE",
+            expression=select_expr,
+        )
+
+    @classmethod
+    def get_percentile_expr(cls, input_expr: Expression, quantile: float) -> Expression:
+        return expressions.Anonymous(
+            this="QUANTILE_CONT", expressions=[input_expr, make_literal_value(quantile)]
+        )
@@ -5,7 +5,10 @@ from __future__ import annotations
 
 from typing import Any, Iterable, Optional, Tuple, cast
 
-from sqlglot import expressions
+import os
+from dataclasses import dataclass
+
+from sqlglot import expressions, parse_one
 from sqlglot.expressions import Expression, Select, alias_, select
 
 from featurebyte.enum import InternalName, SourceType, SpecialColumnName
@@ -21,8 +24,14 @@ from featurebyte.query_graph.sql.common import (
     get_qualified_column_identifier,
     quoted_identifier,
 )
+from featurebyte.query_graph.sql.scd_helper import Table, get_scd_join_expr
 from featurebyte.query_graph.sql.specs import TileBasedAggregationSpec
 from featurebyte.query_graph.sql.tile_util import calculate_first_and_last_tile_indices
+from featurebyte.query_graph.sql.tiling import (
+    CUMULATIVE_TILE_COUNT_COLUMN,
+    CUMULATIVE_TILES,
+    get_cumulative_tile_table_name,
+)
 
 Window = Optional[int]
 Frequency = int
@@ -35,6 +44,46 @@ IsOrderDependent = bool
 AggregationSpecIdType = Tuple[TileIdType, Window, AggSpecEntityIDs, IsOrderDependent]
 
 ROW_NUMBER = "__FB_ROW_NUMBER"
+CUMULATIVE_LAST_PREFIX = "__FB_CUMULATIVE_LAST_"
+CUMULATIVE_FIRST_PREFIX = "__FB_CUMULATIVE_FIRST_"
+
+# Coarser tile resolutions in seconds (e.g. "3600,86400" for hourly and daily) that tiles of order
+# independent aggregations are rolled up into when computing long window aggregations. Disabled
+# when empty.
+TILE_ROLLUP_RESOLUTIONS = [
+    int(resolution)
+    for resolution in os.environ.get("FEATUREBYTE_TILE_ROLLUP_RESOLUTIONS", "").split(",")
+    if resolution.strip()
+]
+
+# Whether to aggregate windows of different sizes on the same tile table with a single range join
+SHARED_WINDOW_RANGE_JOIN = (
+    os.environ.get("FEATUREBYTE_SHARED_WINDOW_RANGE_JOIN", "false").lower() == "true"
+)
+
+
+@dataclass
+class RangeJoinSegment:
+    """
+    A range of tiles to be joined with the expanded request table. The range is expressed in terms
+    of tile indices of the table being joined.
+
+    Parameters
+    ----------
+    table_name: str
+        Name of the tile table (or rolled up tile table) to join with
+    first_index_expr: str
+        Expression for the first tile index (inclusive)
+    last_index_expr: str
+        Expression for the last tile index (exclusive)
+    max_num_tiles: int
+        Upper bound of the number of tiles in the range
+    """
+
+    table_name: str
+    first_index_expr: str
+    last_index_expr: str
+    max_num_tiles: int
 
 
 class TileBasedRequestTablePlan:
@@ -141,6 +190,7 @@ class TileBasedRequestTablePlan:
     def construct_request_tile_indices_ctes(
         self,
         request_table_name: str,
+        required_table_names: Optional[set[str]] = None,
     ) -> CteStatements:
         """
         Construct SQL statements that build the expanded request tables
@@ -149,6 +199,8 @@ class TileBasedRequestTablePlan:
         ----------
         request_table_name : str
             Name of request table to use
+        required_table_names : Optional[set[str]]
+            Names of the expanded request tables to build. Build all of them if not provided.
 
         Returns
         -------
@@ -156,6 +208,8 @@ class TileBasedRequestTablePlan:
         """
         expanded_request_ctes = []
         for unique_tile_indices_id, table_name in self.expanded_request_table_names.items():
+            if required_table_names is not None and table_name not in required_table_names:
+                continue
             (
                 window_size,
                 frequency,
@@ -302,12 +356,28 @@ class WindowAggregator(TileBasedAggregator):
         Source type information
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        tile_rollup_resolutions: Optional[list[int]] = None,
+        shared_window_range_join: Optional[bool] = None,
+        cumulative_tiles: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self.window_aggregation_spec_set = TileBasedAggregationSpecSet()
         self.request_table_plan: TileBasedRequestTablePlan = TileBasedRequestTablePlan(
             source_type=self.source_type
         )
+        self.tile_rollup_resolutions = sorted(
+            TILE_ROLLUP_RESOLUTIONS if tile_rollup_resolutions is None else tile_rollup_resolutions
+        )
+        self.shared_window_range_join = (
+            SHARED_WINDOW_RANGE_JOIN
+            if shared_window_range_join is None
+            else shared_window_range_join
+        )
+        self.cumulative_tiles = CUMULATIVE_TILES if cumulative_tiles is None else cumulative_tiles
 
     def additional_update(self, aggregation_spec: TileBasedAggregationSpec) -> None:
         """
@@ -324,8 +394,252 @@ class WindowAggregator(TileBasedAggregator):
         self.window_aggregation_spec_set.add_aggregation_spec(aggregation_spec)
         self.request_table_plan.add_aggregation_spec(aggregation_spec)
 
+    def get_grouped_aggregation_specs(self) -> list[list[TileBasedAggregationSpec]]:
+        """
+        Get groups of TileBasedAggregationSpec, each group to be aggregated with one range join
+
+        When shared window range join is enabled, groups of order independent aggregations on the
+        same tile table but with different window sizes are combined into one group. The range join
+        is done with the largest window and the smaller windows are derived using conditional
+        aggregation.
+
+        Returns
+        -------
+        list[list[TileBasedAggregationSpec]]
+        """
+        grouped_agg_specs: list[list[TileBasedAggregationSpec]] = []
+        shared_groups: dict[tuple[Any, ...], list[TileBasedAggregationSpec]] = {}
+        for agg_specs in self.window_aggregation_spec_set.get_grouped_aggregation_specs():
+            agg_spec = agg_specs[0]
+            is_shareable = (
+                self.shared_window_range_join
+                and not agg_spec.is_order_dependent
+                and agg_spec.value_by is None
+                and not self.get_tile_rollup_factors(agg_specs)
+                and not self.is_cumulative_tiles_applicable(agg_specs)
+            )
+            if not is_shareable:
+                grouped_agg_specs.append(list(agg_specs))
+                continue
+            shared_key = (
+                agg_spec.tile_table_id,
+                agg_spec.frequency,
+                agg_spec.time_modulo_frequency,
+                tuple(agg_spec.serving_names),
+            )
+            if shared_key not in shared_groups:
+                shared_groups[shared_key] = []
+                grouped_agg_specs.append(shared_groups[shared_key])
+            shared_groups[shared_key].extend(agg_specs)
+        return grouped_agg_specs
+
+    @staticmethod
+    def get_largest_window_aggregation_spec(
+        agg_specs: list[TileBasedAggregationSpec],
+    ) -> TileBasedAggregationSpec:
+        """
+        Get the aggregation spec with the largest window in a group of aggregation specs
+
+        Parameters
+        ----------
+        agg_specs: list[TileBasedAggregationSpec]
+            Group of aggregation specs
+
+        Returns
+        -------
+        TileBasedAggregationSpec
+        """
+        return max(agg_specs, key=lambda agg_spec: cast(int, agg_spec.window))
+
+    @staticmethod
+    def construct_window_conditional_merge_expr(agg_spec: TileBasedAggregationSpec) -> str:
+        """
+        Construct a merge expression that only aggregates tiles within the window of the given
+        aggregation spec, to be used when the tiles are joined using a larger window
+
+        Parameters
+        ----------
+        agg_spec: TileBasedAggregationSpec
+            Aggregation specification
+
+        Returns
+        -------
+        str
+        """
+        assert agg_spec.window is not None
+        num_tiles = agg_spec.window // agg_spec.frequency
+        tile_value_columns = set(agg_spec.tile_value_columns)
+        condition = expressions.GTE(
+            this=expressions.Identifier(this="INDEX"),
+            expression=expressions.Sub(
+                this=quoted_identifier(InternalName.LAST_TILE_INDEX),
+                expression=make_literal_value(num_tiles),
+            ),
+        )
+
+        def _make_conditional(node: Expression) -> Expression:
+            if isinstance(node, expressions.Column) and node.name in tile_value_columns:
+                return expressions.Case(ifs=[expressions.If(this=condition, true=node.copy())])
+            return node
+
+        return cast(str, parse_one(agg_spec.merge_expr).transform(_make_conditional).sql())
+
+    def get_tile_rollup_factors(self, agg_specs: list[TileBasedAggregationSpec]) -> list[int]:
+        """
+        Get the factors (number of tiles combined into one coarser tile) of the rolled up tile
+        tables to be used to aggregate a group of TileBasedAggregationSpec
+
+        Parameters
+        ----------
+        agg_specs: list[TileBasedAggregationSpec]
+            Group of aggregation specs sharing the same tile table and window
+
+        Returns
+        -------
+        list[int]
+            Rollup factors in increasing order. Empty if tiles should not be rolled up.
+        """
+        agg_spec = agg_specs[0]
+        if agg_spec.is_order_dependent or agg_spec.window is None:
+            return []
+        if any(spec.tile_value_rollup_funcs is None for spec in agg_specs):
+            return []
+        if self.is_cumulative_tiles_applicable(agg_specs):
+            return []
+        num_tiles = agg_spec.window // agg_spec.frequency
+        factors: list[int] = []
+        prev_factor = 1
+        for resolution in self.tile_rollup_resolutions:
+            if resolution % agg_spec.frequency != 0:
+                continue
+            factor = resolution // agg_spec.frequency
+            if factor <= prev_factor or factor % prev_factor != 0:
+                continue
+            if num_tiles < 2 * factor:
+                # window is too short to benefit from this and coarser resolutions
+                break
+            factors.append(factor)
+            prev_factor = factor
+        return factors
+
+    def is_cumulative_tiles_applicable(self, agg_specs: list[TileBasedAggregationSpec]) -> bool:
+        """
+        Check whether a group of TileBasedAggregationSpec can be aggregated using the cumulative
+        tile tables, which is the case when all the tile values are additive
+
+        Parameters
+        ----------
+        agg_specs: list[TileBasedAggregationSpec]
+            Group of aggregation specs sharing the same tile table and window
+
+        Returns
+        -------
+        bool
+        """
+        if not self.cumulative_tiles:
+            return False
+        for agg_spec in agg_specs:
+            if agg_spec.is_order_dependent or agg_spec.value_by is not None:
+                return False
+            if agg_spec.tile_value_rollup_funcs is None or any(
+                func != "SUM" for func in agg_spec.tile_value_rollup_funcs.values()
+            ):
+                return False
+        return True
+
     @staticmethod
+    def get_tile_rollup_table_name(tile_table_id: str, factor: int) -> str:
+        """
+        Get the name of the table with tiles rolled up by the given factor
+
+        Parameters
+        ----------
+        tile_table_id: str
+            Tile table name
+        factor: int
+            Number of tiles combined into one coarser tile
+
+        Returns
+        -------
+        str
+        """
+        return f"{tile_table_id}_ROLLUP_{factor}"
+
+    @classmethod
+    def get_range_join_segments(
+        cls, tile_table_id: str, num_tiles: int, rollup_factors: list[int]
+    ) -> list[RangeJoinSegment]:
+        """
+        Get the ranges of tiles to join with the expanded request table
+
+        Without rollup, the range is the window itself. With rollup, the window is covered by the
+        coarsest tiles fully contained in the window, and the edges not covered by them are covered
+        by successively finer tiles.
+
+        Parameters
+        ----------
+        tile_table_id: str
+            Tile table name
+        num_tiles: int
+            Feature window size in terms of number of tiles
+        rollup_factors: list[int]
+            Rollup factors in increasing order
+
+        Returns
+        -------
+        list[RangeJoinSegment]
+        """
+        first_tile_index = f"REQ.{InternalName.FIRST_TILE_INDEX}"
+        last_tile_index = f"REQ.{InternalName.LAST_TILE_INDEX}"
+
+        def _get_first_index(factor: int) -> str:
+            if factor == 1:
+                return first_tile_index
+            return f"CEIL({first_tile_index} / {factor})"
+
+        def _get_last_index(factor: int) -> str:
+            if factor == 1:
+                return last_tile_index
+            return f"FLOOR({last_tile_index} / {factor})"
+
+        def _get_table_name(factor: int) -> str:
+            if factor == 1:
+                return tile_table_id
+            return quoted_identifier(cls.get_tile_rollup_table_name(tile_table_id, factor)).sql()
+
+        factors = [1] + rollup_factors
+        top_factor = factors[-1]
+        segments = [
+            RangeJoinSegment(
+                table_name=_get_table_name(top_factor),
+                first_index_expr=_get_first_index(top_factor),
+                last_index_expr=_get_last_index(top_factor),
+                max_num_tiles=max(1, num_tiles // top_factor),
+            )
+        ]
+        for factor, coarser_factor in zip(factors[:-1], factors[1:]):
+            ratio = coarser_factor // factor
+            segments.append(
+                RangeJoinSegment(
+                    table_name=_get_table_name(factor),
+                    first_index_expr=_get_first_index(factor),
+                    last_index_expr=f"{_get_first_index(coarser_factor)} * {ratio}",
+                    max_num_tiles=ratio,
+                )
+            )
+            segments.append(
+                RangeJoinSegment(
+                    table_name=_get_table_name(factor),
+                    first_index_expr=f"{_get_last_index(coarser_factor)} * {ratio}",
+                    last_index_expr=_get_last_index(factor),
+                    max_num_tiles=ratio,
+                )
+            )
+        return segments
+
+    @classmethod
     def _range_join_request_table_and_tile_table(
+        cls,
         expanded_request_table_name: str,
         tile_table_id: str,
         point_in_time_column: str,
@@ -334,19 +648,28 @@ class WindowAggregator(TileBasedAggregator):
         value_by: str | None,
         num_tiles: int,
         tile_value_columns: list[str],
+        rollup_factors: Optional[list[int]] = None,
+        select_last_tile_index: bool = False,
     ) -> Select:
         # Join two tables with range join: REQ (processed request table) and TILE (tile table). For
         # each row in the REQ table, we want to join with rows in the TILE table with tile index
-        # between REQ.FIRST_TILE_INDEX and REQ.LAST_TILE_INDEX.
-        range_join_where_conditions = [
-            f"TILE.INDEX >= REQ.{InternalName.FIRST_TILE_INDEX}",
-            f"TILE.INDEX < REQ.{InternalName.LAST_TILE_INDEX}",
-        ]
+        # between REQ.FIRST_TILE_INDEX and REQ.LAST_TILE_INDEX. When tiles are rolled up, the range
+        # is split into segments each joined with the tile table of the corresponding resolution.
+        segments = cls.get_range_join_segments(
+            tile_table_id=tile_table_id,
+            num_tiles=num_tiles,
+            rollup_factors=rollup_factors or [],
+        )
 
         # Required columns from the request table
         selected_from_request_table = [get_qualified_column_identifier(point_in_time_column, "REQ")]
         for serving_name in serving_names:
             selected_from_request_table.append(get_qualified_column_identifier(serving_name, "REQ"))
+        if select_last_tile_index:
+            # Required to derive aggregations of smaller windows using conditional aggregation
+            selected_from_request_table.append(
+                get_qualified_column_identifier(InternalName.LAST_TILE_INDEX, "REQ")
+            )
 
         # Required columns from the tile table
         selected_from_tile_table = [
@@ -358,45 +681,155 @@ class WindowAggregator(TileBasedAggregator):
         if value_by is not None:
             selected_from_tile_table.append(get_qualified_column_identifier(value_by, "TILE"))
 
-        # Narrow down matches using these conditions before filtering by range_join_where_conditions
-        range_join_conditions = [
-            f"FLOOR(REQ.{InternalName.LAST_TILE_INDEX} / {num_tiles}) = FLOOR(TILE.INDEX / {num_tiles})",
-            f"FLOOR(REQ.{InternalName.LAST_TILE_INDEX} / {num_tiles}) - 1 = FLOOR(TILE.INDEX / {num_tiles})",
-        ]
         req_joined_with_tiles = None
-        for range_join_condition in range_join_conditions:
-            join_conditions_lst: Any = [range_join_condition]
-            for serving_name, key in zip(serving_names, keys):
-                join_conditions_lst.append(
-                    f"REQ.{quoted_identifier(serving_name).sql()} = TILE.{quoted_identifier(key).sql()}"
-                )
-            joined_expr = (
-                select(
-                    *selected_from_request_table,
-                    *selected_from_tile_table,
-                )
-                .from_(f"{quoted_identifier(expanded_request_table_name).sql()} AS REQ")
-                .join(
-                    tile_table_id,
-                    join_alias="TILE",
-                    join_type="inner",
-                    on=expressions.and_(*join_conditions_lst),
-                )
-                .where(*range_join_where_conditions)
-            )
-            # Use UNION ALL with two separate joins to avoid non-exact join condition with OR which
-            # has significant performance impact.
-            if req_joined_with_tiles is None:
-                req_joined_with_tiles = joined_expr
-            else:
-                req_joined_with_tiles = expressions.Union(  # type: ignore[unreachable]
-                    this=req_joined_with_tiles,
-                    distinct=False,
-                    expression=joined_expr,
+        for segment in segments:
+            range_join_where_conditions = [
+                f"TILE.INDEX >= {segment.first_index_expr}",
+                f"TILE.INDEX < {segment.last_index_expr}",
+            ]
+
+            # Narrow down matches using these conditions before filtering by
+            # range_join_where_conditions
+            bucket_size = segment.max_num_tiles
+            range_join_conditions = [
+                f"FLOOR({segment.last_index_expr} / {bucket_size}) = FLOOR(TILE.INDEX / {bucket_size})",
+                f"FLOOR({segment.last_index_expr} / {bucket_size}) - 1 = FLOOR(TILE.INDEX / {bucket_size})",
+            ]
+            for range_join_condition in range_join_conditions:
+                join_conditions_lst: Any = [range_join_condition]
+                for serving_name, key in zip(serving_names, keys):
+                    join_conditions_lst.append(
+                        f"REQ.{quoted_identifier(serving_name).sql()} = TILE.{quoted_identifier(key).sql()}"
+                    )
+                joined_expr = (
+                    select(
+                        *selected_from_request_table,
+                        *selected_from_tile_table,
+                    )
+                    .from_(f"{quoted_identifier(expanded_request_table_name).sql()} AS REQ")
+                    .join(
+                        segment.table_name,
+                        join_alias="TILE",
+                        join_type="inner",
+                        on=expressions.and_(*join_conditions_lst),
+                    )
+                    .where(*range_join_where_conditions)
                 )
+                # Use UNION ALL with two separate joins to avoid non-exact join condition with OR
+                # which has significant performance impact.
+                if req_joined_with_tiles is None:
+                    req_joined_with_tiles = joined_expr
+                else:
+                    req_joined_with_tiles = expressions.Union(
+                        this=req_joined_with_tiles,
+                        distinct=False,
+                        expression=joined_expr,
+                    )
         assert req_joined_with_tiles is not None
         return select().from_(req_joined_with_tiles.subquery())
 
+    def construct_tile_rollup_sql(
+        self,
+        source_table_name: str,
+        keys: list[str],
+        value_by: str | None,
+        tile_value_rollup_funcs: dict[str, str],
+        ratio: int,
+    ) -> Select:
+        """
+        Construct SQL that rolls up tiles into coarser tiles, each combining ratio number of
+        consecutive tiles
+
+        Parameters
+        ----------
+        source_table_name: str
+            Name of the table with the tiles to be rolled up
+        keys: list[str]
+            List of entity columns in the tile table
+        value_by: str | None
+            Optional category column in the tile table
+        tile_value_rollup_funcs: dict[str, str]
+            Mapping from tile column name to the aggregate function that combines the tile values
+        ratio: int
+            Number of tiles combined into one coarser tile
+
+        Returns
+        -------
+        Select
+        """
+        group_by_keys: list[Expression] = [quoted_identifier(key) for key in keys]
+        if value_by is not None:
+            group_by_keys.append(quoted_identifier(value_by))
+        rollup_index_expr = expressions.Floor(
+            this=expressions.Div(
+                this=expressions.Identifier(this="INDEX"), expression=make_literal_value(ratio)
+            )
+        )
+        return (
+            select(
+                *group_by_keys,
+                alias_(rollup_index_expr, "INDEX", quoted=False),
+                *[
+                    alias_(
+                        expressions.Anonymous(
+                            this=func, expressions=[expressions.Identifier(this=column)]
+                        ),
+                        column,
+                        quoted=False,
+                    )
+                    for column, func in sorted(tile_value_rollup_funcs.items())
+                ],
+            )
+            .from_(source_table_name)
+            .group_by(*group_by_keys, rollup_index_expr)
+        )
+
+    def construct_tile_rollup_ctes(self) -> CteStatements:
+        """
+        Construct SQL statements that build the rolled up tile tables required by the window
+        aggregations. Each rolled up tile table is built from the next finer one.
+
+        Returns
+        -------
+        CteStatements
+        """
+        rollup_factors_by_tile_table: dict[str, list[int]] = {}
+        rollup_funcs_by_tile_table: dict[str, dict[str, str]] = {}
+        agg_spec_by_tile_table: dict[str, TileBasedAggregationSpec] = {}
+        for agg_specs in self.window_aggregation_spec_set.get_grouped_aggregation_specs():
+            rollup_factors = self.get_tile_rollup_factors(agg_specs)
+            if not rollup_factors:
+                continue
+            tile_table_id = agg_specs[0].tile_table_id
+            if len(rollup_factors) > len(rollup_factors_by_tile_table.get(tile_table_id, [])):
+                rollup_factors_by_tile_table[tile_table_id] = rollup_factors
+            rollup_funcs = rollup_funcs_by_tile_table.setdefault(tile_table_id, {})
+            for agg_spec in agg_specs:
+                assert agg_spec.tile_value_rollup_funcs is not None
+                rollup_funcs.update(agg_spec.tile_value_rollup_funcs)
+            agg_spec_by_tile_table[tile_table_id] = agg_specs[0]
+
+        rollup_ctes = []
+        for tile_table_id, rollup_factors in rollup_factors_by_tile_table.items():
+            agg_spec = agg_spec_by_tile_table[tile_table_id]
+            source_table_name = tile_table_id
+            prev_factor = 1
+            for factor in rollup_factors:
+                table_name = quoted_identifier(
+                    self.get_tile_rollup_table_name(tile_table_id, factor)
+                )
+                rollup_expr = self.construct_tile_rollup_sql(
+                    source_table_name=source_table_name,
+                    keys=agg_spec.keys,
+                    value_by=agg_spec.value_by,
+                    tile_value_rollup_funcs=rollup_funcs_by_tile_table[tile_table_id],
+                    ratio=factor // prev_factor,
+                )
+                rollup_ctes.append((table_name, rollup_expr))
+                source_table_name = table_name.sql()
+                prev_factor = factor
+        return cast(CteStatements, rollup_ctes)
+
     def construct_aggregation_sql(  # pylint: disable=too-many-arguments
         self,
         expanded_request_table_name: str,
@@ -410,6 +843,8 @@ class WindowAggregator(TileBasedAggregator):
         num_tiles: int,
         is_order_dependent: bool,
         tile_value_columns: list[str],
+        rollup_factors: Optional[list[int]] = None,
+        select_last_tile_index: bool = False,
     ) -> expressions.Select:
         """
         Construct SQL code for one specific aggregation
@@ -466,6 +901,11 @@ class WindowAggregator(TileBasedAggregator):
             Whether the aggregation depends on the ordering of data
         tile_value_columns : list[str]
             List of column names referenced in the tile table
+        rollup_factors : Optional[list[int]]
+            Factors of the rolled up tile tables to use in addition to the tile table
+        select_last_tile_index : bool
+            Whether to include the last tile index of the request in the joined result, required
+            when merge_exprs aggregate conditionally on the tile index
 
         Returns
         -------
@@ -481,6 +921,8 @@ class WindowAggregator(TileBasedAggregator):
             value_by=value_by,
             num_tiles=num_tiles,
             tile_value_columns=tile_value_columns,
+            rollup_factors=rollup_factors,
+            select_last_tile_index=select_last_tile_index,
         )
 
         group_by_keys = [quoted_identifier(point_in_time_column)]
@@ -525,6 +967,193 @@ class WindowAggregator(TileBasedAggregator):
 
         return agg_expr
 
+    def construct_cumulative_aggregation_sql(  # pylint: disable=too-many-arguments
+        self,
+        expanded_request_table_name: str,
+        cumulative_table_name: str,
+        point_in_time_column: str,
+        keys: list[str],
+        serving_names: list[str],
+        merge_exprs: list[str],
+        agg_result_names: list[str],
+        tile_value_columns: list[str],
+    ) -> expressions.Select:
+        """
+        Construct SQL code for aggregations using a cumulative tile table
+
+        Instead of joining with all the tiles within the window, the cumulative tile values just
+        before __FB_LAST_TILE_INDEX and just before __FB_FIRST_TILE_INDEX are looked up for each
+        row in the expanded request table. Their difference is the sum of the tile values within
+        the window, which is then merged as if it was a single tile. Request rows without any
+        tiles within the window are excluded, same as when using range join.
+
+        Parameters
+        ----------
+        expanded_request_table_name : str
+            Expanded request table name
+        cumulative_table_name: str
+            Cumulative tile table name
+        point_in_time_column : str
+            Point in time column name
+        keys : list[str]
+            List of join key columns
+        serving_names : list[str]
+            List of serving name columns
+        merge_exprs : list[str]
+            SQL expressions that aggregates intermediate values stored in tile table
+        agg_result_names : list[str]
+            Column names of the aggregated results
+        tile_value_columns : list[str]
+            List of column names referenced in the tile table
+
+        Returns
+        -------
+        expressions.Select
+        """
+        request_columns = [point_in_time_column] + serving_names
+        cumulative_columns = tile_value_columns + [CUMULATIVE_TILE_COUNT_COLUMN]
+        last_columns = [f"{CUMULATIVE_LAST_PREFIX}{col}" for col in cumulative_columns]
+        first_columns = [f"{CUMULATIVE_FIRST_PREFIX}{col}" for col in cumulative_columns]
+
+        # Cumulative values of tiles before __FB_LAST_TILE_INDEX
+        expanded_request_table_expr = select(
+            *[quoted_identifier(col) for col in request_columns],
+            quoted_identifier(InternalName.LAST_TILE_INDEX),
+            quoted_identifier(InternalName.FIRST_TILE_INDEX),
+        ).from_(quoted_identifier(expanded_request_table_name).sql())
+        request_with_last_expr = get_scd_join_expr(
+            left_table=Table(
+                expr=expanded_request_table_expr,
+                timestamp_column=InternalName.LAST_TILE_INDEX,
+                join_keys=serving_names,
+                input_columns=request_columns + [InternalName.FIRST_TILE_INDEX],
+                output_columns=request_columns + [InternalName.FIRST_TILE_INDEX],
+            ),
+            right_table=Table(
+                expr=cumulative_table_name,
+                timestamp_column="INDEX",
+                join_keys=keys,
+                input_columns=cumulative_columns,
+                output_columns=last_columns,
+            ),
+            join_type="left",
+            adapter=self.adapter,
+            allow_exact_match=False,
+            quote_right_input_columns=False,
+            convert_timestamps_to_utc=False,
+        )
+
+        # Cumulative values of tiles before __FB_FIRST_TILE_INDEX
+        request_with_last_and_first_expr = get_scd_join_expr(
+            left_table=Table(
+                expr=request_with_last_expr,
+                timestamp_column=InternalName.FIRST_TILE_INDEX,
+                join_keys=serving_names,
+                input_columns=request_columns + last_columns,
+                output_columns=request_columns + last_columns,
+            ),
+            right_table=Table(
+                expr=cumulative_table_name,
+                timestamp_column="INDEX",
+                join_keys=keys,
+                input_columns=cumulative_columns,
+                output_columns=first_columns,
+            ),
+            join_type="left",
+            adapter=self.adapter,
+            allow_exact_match=False,
+            quote_right_input_columns=False,
+            convert_timestamps_to_utc=False,
+        )
+
+        def _make_difference_expr(last_column: str, first_column: str) -> Expression:
+            return expressions.Sub(
+                this=expressions.Coalesce(
+                    this=quoted_identifier(last_column), expressions=[make_literal_value(0)]
+                ),
+                expression=expressions.Coalesce(
+                    this=quoted_identifier(first_column), expressions=[make_literal_value(0)]
+                ),
+            )
+
+        window_tile_values_expr = (
+            select(
+                *[quoted_identifier(col) for col in request_columns],
+                *[
+                    alias_(_make_difference_expr(last_col, first_col), col, quoted=False)
+                    for col, last_col, first_col in zip(
+                        tile_value_columns, last_columns, first_columns
+                    )
+                ],
+            )
+            .from_(request_with_last_and_first_expr.subquery())
+            .where(
+                expressions.GT(
+                    this=_make_difference_expr(last_columns[-1], first_columns[-1]),
+                    expression=make_literal_value(0),
+                )
+            )
+        )
+        return self.merge_tiles_order_independent(
+            req_joined_with_tiles=select().from_(window_tile_values_expr.subquery()),
+            inner_group_by_keys=[quoted_identifier(col) for col in request_columns],
+            merge_exprs=merge_exprs,
+            inner_agg_result_names=agg_result_names,
+        )
+
+    def get_cumulative_window_aggregations(
+        self, agg_specs: list[TileBasedAggregationSpec], point_in_time_column: str
+    ) -> list[LeftJoinableSubquery]:
+        """
+        Get window aggregation queries using cumulative tile tables for a group of aggregation
+        specs sharing the same tile table and window. Each aggregation has its own cumulative tile
+        table and is aggregated separately.
+
+        Parameters
+        ----------
+        agg_specs: list[TileBasedAggregationSpec]
+            Group of aggregation specs
+        point_in_time_column: str
+            Point in time column name
+
+        Returns
+        -------
+        list[LeftJoinableSubquery]
+        """
+        agg_specs_by_aggregation_id: dict[str, list[TileBasedAggregationSpec]] = {}
+        for agg_spec in agg_specs:
+            agg_specs_by_aggregation_id.setdefault(agg_spec.aggregation_id, []).append(agg_spec)
+
+        results = []
+        for aggregation_id, specs in agg_specs_by_aggregation_id.items():
+            agg_spec = specs[0]
+            agg_result_names = [spec.agg_result_name for spec in specs]
+            tile_value_columns_set = set()
+            for spec in specs:
+                tile_value_columns_set.update(spec.tile_value_columns)
+            agg_expr = self.construct_cumulative_aggregation_sql(
+                expanded_request_table_name=self.request_table_plan.get_expanded_request_table_name(
+                    agg_spec
+                ),
+                cumulative_table_name=get_cumulative_tile_table_name(
+                    agg_spec.tile_table_id, aggregation_id
+                ),
+                point_in_time_column=point_in_time_column,
+                keys=agg_spec.keys,
+                serving_names=agg_spec.serving_names,
+                merge_exprs=[spec.merge_expr for spec in specs],
+                agg_result_names=agg_result_names,
+                tile_value_columns=sorted(tile_value_columns_set),
+            )
+            results.append(
+                LeftJoinableSubquery(
+                    expr=agg_expr,
+                    column_names=agg_result_names,
+                    join_keys=[point_in_time_column] + agg_spec.serving_names,
+                )
+            )
+        return results
+
     @staticmethod
     def merge_tiles_order_independent(
         req_joined_with_tiles: Select,
@@ -637,19 +1266,31 @@ class WindowAggregator(TileBasedAggregator):
         """
         results = []
 
-        for agg_specs in self.window_aggregation_spec_set.get_grouped_aggregation_specs():
+        for agg_specs in self.get_grouped_aggregation_specs():
+            if self.is_cumulative_tiles_applicable(agg_specs):
+                results.extend(
+                    self.get_cumulative_window_aggregations(agg_specs, point_in_time_column)
+                )
+                continue
+
             # All TileBasedAggregationSpec in agg_specs share common attributes such as
-            # tile_table_id, keys, etc. Get the first one to access them.
-            agg_spec = agg_specs[0]
-            is_order_dependent = agg_specs[0].is_order_dependent
+            # tile_table_id, keys, etc. The range join is done using the largest window.
+            agg_spec = self.get_largest_window_aggregation_spec(agg_specs)
+            is_order_dependent = agg_spec.is_order_dependent
             expanded_request_table_name = self.request_table_plan.get_expanded_request_table_name(
                 agg_spec
             )
-            merge_exprs = [agg_spec.merge_expr for agg_spec in agg_specs]
-            agg_result_names = [agg_spec.agg_result_name for agg_spec in agg_specs]
+            is_shared = any(spec.window != agg_spec.window for spec in agg_specs)
+            merge_exprs = [
+                spec.merge_expr
+                if spec.window == agg_spec.window
+                else self.construct_window_conditional_merge_expr(spec)
+                for spec in agg_specs
+            ]
+            agg_result_names = [spec.agg_result_name for spec in agg_specs]
             tile_value_columns_set = set()
-            for agg_spec in agg_specs:
-                tile_value_columns_set.update(agg_spec.tile_value_columns)
+            for spec in agg_specs:
+                tile_value_columns_set.update(spec.tile_value_columns)
 
             assert agg_spec.window is not None
             agg_expr = self.construct_aggregation_sql(
@@ -664,6 +1305,8 @@ class WindowAggregator(TileBasedAggregator):
                 num_tiles=agg_spec.window // agg_spec.frequency,
                 is_order_dependent=is_order_dependent,
                 tile_value_columns=sorted(tile_value_columns_set),
+                rollup_factors=[] if is_shared else self.get_tile_rollup_factors(agg_specs),
+                select_last_tile_index=is_shared,
             )
             agg_result = LeftJoinableSubquery(
                 expr=agg_expr,
@@ -688,4 +1331,16 @@ class WindowAggregator(TileBasedAggregator):
         )
 
     def get_common_table_expressions(self, request_table_name: str) -> CteStatements:
-        return self.request_table_plan.construct_request_tile_indices_ctes(request_table_name)
+        required_table_names = {
+            self.request_table_plan.get_expanded_request_table_name(
+                self.get_largest_window_aggregation_spec(agg_specs)
+            )
+            for agg_specs in self.get_grouped_aggregation_specs()
+        }
+        return cast(
+            CteStatements,
+            self.request_table_plan.construct_request_tile_indices_ctes(
+                request_table_name, required_table_names=required_table_names
+            )
+            + self.construct_tile_rollup_ctes(),
+        )
@@ -3,10 +3,14 @@ Module for SQL syntax tree builder
 """
 from __future__ import annotations
 
-from typing import Any, Iterable, Type
+from typing import Any, Hashable, Iterable, Type
 
+import os
+import threading
 from collections import defaultdict
 
+from cachetools import LRUCache
+
 from featurebyte.common.path_util import import_submodules
 from featurebyte.enum import SourceType
 from featurebyte.query_graph.enum import NodeType
@@ -93,6 +97,40 @@ class NodeRegistry:
 
 NODE_REGISTRY = NodeRegistry()
 
+# Process level cache of constructed SQLNode objects. Constructed SQLNode objects are treated as
+# immutable (operations such as assign and filter always work on copies), so the same SQLNode can
+# be safely reused across different SQLOperationGraph instances (e.g. when the same deployed
+# feature list is used to generate SQL repeatedly for preview, historical and online serving).
+SQL_NODE_CACHE_SIZE = int(os.environ.get("FEATUREBYTE_SQL_NODE_CACHE_SIZE", 4096))
+SQL_NODE_CACHE: LRUCache[Hashable, Any] = LRUCache(maxsize=SQL_NODE_CACHE_SIZE)
+SQL_NODE_CACHE_LOCK = threading.Lock()
+
+# Placeholder graph used to release references to the full query graph from cached SQLNode objects
+EMPTY_QUERY_GRAPH = QueryGraphModel()
+
+
+def clear_sql_node_cache() -> None:
+    """
+    Clear the process level cache of constructed SQLNode objects
+    """
+    with SQL_NODE_CACHE_LOCK:
+        SQL_NODE_CACHE.clear()
+
+
+def set_sql_node_cache_size(maxsize: int) -> None:
+    """
+    Set the maximum number of SQLNode objects kept in the process level cache. Existing cache
+    entries are discarded.
+
+    Parameters
+    ----------
+    maxsize: int
+        Maximum number of cached SQLNode objects
+    """
+    global SQL_NODE_CACHE  # pylint: disable=global-statement
+    with SQL_NODE_CACHE_LOCK:
+        SQL_NODE_CACHE = LRUCache(maxsize=maxsize)
+
 
 class SQLOperationGraph:
     """Construct a tree of SQL operations given a QueryGraph
@@ -103,6 +141,12 @@ class SQLOperationGraph:
         Query Graph representing user's intention
     sql_type : SQLType
         Type of SQL to generate
+    source_type : SourceType
+        Type of the data warehouse that the SQL will run on
+    to_filter_scd_by_current_flag : bool
+        Whether to filter SCD table with current flag
+    use_cache : bool
+        Whether to reuse SQLNode objects constructed previously for identical nodes
     """
 
     def __init__(
@@ -111,12 +155,14 @@ class SQLOperationGraph:
         sql_type: SQLType,
         source_type: SourceType,
         to_filter_scd_by_current_flag: bool = False,
+        use_cache: bool = True,
     ) -> None:
         self.sql_nodes: dict[str, SQLNode | TableNode] = {}
         self.query_graph = query_graph
         self.sql_type = sql_type
         self.source_type = source_type
         self.to_filter_scd_by_current_flag = to_filter_scd_by_current_flag
+        self.use_cache = use_cache
 
     def build(self, target_node: Node) -> Any:
         """Build the graph from a given query Node, working backwards
@@ -134,6 +180,50 @@ class SQLOperationGraph:
         sql_node = self._construct_sql_nodes(target_node)
         return sql_node
 
+    def _get_cache_key(
+        self, cur_node: Node, input_node_names: list[str]
+    ) -> tuple[str, str, tuple[str, ...], SQLType, SourceType, bool]:
+        """
+        Get the key that identifies the SQLNode to be constructed for a query graph node
+
+        The node hash (node_name_to_ref) captures the definition of the node and all its ancestors.
+        Node names are included as well since some SQLNode objects keep track of the name of the
+        query graph node they are constructed from (e.g. AggregationSource.query_node_name).
+
+        Parameters
+        ----------
+        cur_node : Node
+            Query graph node
+        input_node_names : list[str]
+            Names of the input nodes of cur_node
+
+        Returns
+        -------
+        tuple[str, str, tuple[str, ...], SQLType, SourceType, bool]
+        """
+        return (
+            cur_node.name,
+            self.query_graph.node_name_to_ref[cur_node.name],
+            tuple(input_node_names),
+            self.sql_type,
+            self.source_type,
+            self.to_filter_scd_by_current_flag,
+        )
+
+    @staticmethod
+    def _release_context_references(context: SQLNodeContext) -> None:
+        """
+        Release references to objects only required while building the SQLNode so that cached
+        SQLNode objects do not keep entire query graphs alive
+
+        Parameters
+        ----------
+        context : SQLNodeContext
+            Context used to build the SQLNode
+        """
+        context.graph = EMPTY_QUERY_GRAPH
+        context.input_sql_nodes = []
+
     def _construct_sql_nodes(self, cur_node: Node) -> Any:
         """Recursively construct the nodes
 
@@ -170,6 +260,15 @@ class SQLOperationGraph:
         node_id = cur_node.name
         node_type = cur_node.type
 
+        # Reuse previously constructed SQLNode for an identical node if available
+        if self.use_cache:
+            cache_key = self._get_cache_key(cur_node, inputs)
+            with SQL_NODE_CACHE_LOCK:
+                cached_sql_node = SQL_NODE_CACHE.get(cache_key)
+            if cached_sql_node is not None:
+                self.sql_nodes[node_id] = cached_sql_node
+                return cached_sql_node
+
         sql_node: Any = None
         sql_node_classes = NODE_REGISTRY.get_sql_node_classes(node_type)
         context = SQLNodeContext(
@@ -204,4 +303,8 @@ class SQLOperationGraph:
                 raise NotImplementedError(f"SQLNode not implemented for {cur_node}")
 
         self.sql_nodes[node_id] = sql_node
+        if self.use_cache:
+            self._release_context_references(context)
+            with SQL_NODE_CACHE_LOCK:
+                SQL_NODE_CACHE[cache_key] = sql_node
         return sql_node
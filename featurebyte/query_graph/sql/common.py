@@ -130,27 +130,35 @@ def get_dialect_from_source_type(source_type: SourceType) -> str:
     """
     if source_type in [SourceType.DATABRICKS, SourceType.SPARK]:
         dialect = "spark"
+    elif source_type == SourceType.DUCKDB:
+        dialect = "duckdb"
     else:
         assert source_type == SourceType.SNOWFLAKE
         dialect = "snowflake"
     return dialect
 
 
-def sql_to_string(sql_expr: Expression, source_type: SourceType) -> str:
+def sql_to_string(sql_expr: Expression, source_type: SourceType, pretty: bool = True) -> str:
     """Convert a SQL expression to text given the source type
 
+    Pretty formatting is expensive for large expressions and inflates the size of the query text.
+    Queries that are executed by the system rather than shown to users (e.g. historical features,
+    online serving and tile computation) should be rendered with pretty=False.
+
     Parameters
     ----------
     sql_expr : Expression
         SQL expression object
     source_type : SourceType
         The type of the database engine which will be used to determine the SQL dialect
+    pretty : bool
+        Whether to format the SQL with indentation and line breaks for readability
 
     Returns
     -------
     str
     """
-    return sql_expr.sql(dialect=get_dialect_from_source_type(source_type), pretty=True)
+    return sql_expr.sql(dialect=get_dialect_from_source_type(source_type), pretty=pretty)
 
 
 def apply_serving_names_mapping(serving_names: list[str], mapping: dict[str, str]) -> list[str]:
@@ -149,6 +149,7 @@ class MaterializedTableObservationSet(ObservationSet):
                 get_fully_qualified_table_name(self.observation_table.location.table_details.dict())
             ),
             source_type=session.source_type,
+            pretty=False,
         )
         await session.register_table_with_query(request_table_name, query)
 
@@ -532,6 +533,7 @@ def get_historical_features_query_set(  # pylint: disable=too-many-locals
                 select_expr=sql_expr,
             ),
             source_type=source_type,
+            pretty=False,
         )
         return HistoricalFeatureQuerySet(feature_queries=[], output_query=output_query)
 
@@ -555,6 +557,7 @@ def get_historical_features_query_set(  # pylint: disable=too-many-locals
                 select_expr=feature_set_expr,
             ),
             source_type,
+            pretty=False,
         )
         feature_queries.append(
             FeatureQuery(
@@ -575,6 +578,7 @@ def get_historical_features_query_set(  # pylint: disable=too-many-locals
             select_expr=output_expr,
         ),
         source_type=source_type,
+        pretty=False,
     )
     return HistoricalFeatureQuerySet(feature_queries=feature_queries, output_query=output_query)
 
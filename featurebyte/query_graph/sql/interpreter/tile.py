@@ -5,17 +5,19 @@ from __future__ import annotations
 
 from typing import cast
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from featurebyte.enum import SourceType
 from featurebyte.query_graph.enum import NodeType
 from featurebyte.query_graph.model.graph import QueryGraphModel
 from featurebyte.query_graph.node import Node
 from featurebyte.query_graph.node.generic import GroupByNode
+from featurebyte.query_graph.sql.adapter import get_sql_adapter
 from featurebyte.query_graph.sql.builder import SQLOperationGraph
 from featurebyte.query_graph.sql.common import SQLType
 from featurebyte.query_graph.sql.interpreter.base import BaseGraphInterpreter
 from featurebyte.query_graph.sql.template import SqlExpressionTemplate
+from featurebyte.query_graph.sql.tiling import CUMULATIVE_TILES, get_aggregator
 
 
 @dataclass
@@ -40,6 +42,9 @@ class TileGenSql:
     windows : list[str | None]
         List of window sizes. Not needed for job scheduling, but can be used for other purposes such
         as determining the required tiles to build on demand during preview.
+    cumulative_tile_value_columns : list[str]
+        List of tile value columns to be maintained in a cumulative tile table. Empty if cumulative
+        tiles are disabled or not supported by the aggregation.
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -56,6 +61,7 @@ class TileGenSql:
     frequency: int
     blind_spot: int
     windows: list[str | None]
+    cumulative_tile_value_columns: list[str] = field(default_factory=list)
 
     @property
     def sql(self) -> str:
@@ -139,6 +145,12 @@ class TileSQLGenerator:
         assert tile_table_id is not None
         assert aggregation_id is not None
         sql_template = SqlExpressionTemplate(sql_expr=sql, source_type=self.source_type)
+        cumulative_tile_value_columns = []
+        if CUMULATIVE_TILES and groupby_node.parameters.value_by is None:
+            aggregator = get_aggregator(
+                groupby_node.parameters.agg_func, adapter=get_sql_adapter(self.source_type)
+            )
+            cumulative_tile_value_columns = aggregator.cumulative(aggregation_id)
         info = TileGenSql(
             tile_table_id=tile_table_id,
             aggregation_id=aggregation_id,
@@ -153,6 +165,7 @@ class TileSQLGenerator:
             windows=groupby_node.parameters.windows,
             serving_names=groupby_node.parameters.serving_names,
             value_by_column=groupby_node.parameters.value_by,
+            cumulative_tile_value_columns=cumulative_tile_value_columns,
         )
         return info
 
@@ -237,7 +237,7 @@ async def get_online_features(
 
     tic = time.time()
     if output_table_details is None:
-        retrieval_sql = sql_to_string(retrieval_expr, source_type=source_type)
+        retrieval_sql = sql_to_string(retrieval_expr, source_type=source_type, pretty=False)
         df_features = await session.execute_query(retrieval_sql)
         assert df_features is not None
 
@@ -252,7 +252,7 @@ async def get_online_features(
     expression = get_sql_adapter(session.source_type).create_table_as(
         table_details=output_table_details, select_expr=retrieval_expr
     )
-    query = sql_to_string(expression, source_type=session.source_type)
+    query = sql_to_string(expression, source_type=session.source_type, pretty=False)
     await session.execute_query_long_running(query)
     logger.debug(f"OnlineServingService sql execution elapsed: {time.time() - tic:.6f}s")
     return None
@@ -140,6 +140,7 @@ class TileBasedAggregationSpec(AggregationSpec):
     dtype: DBVarType
     pruned_graph: QueryGraphModel
     pruned_node: Node
+    tile_value_rollup_funcs: Optional[dict[str, str]] = None
 
     @property
     def agg_result_name(self) -> str:
@@ -237,6 +238,7 @@ class TileBasedAggregationSpec(AggregationSpec):
                 dtype=dtype,
                 pruned_graph=pruned_graph,
                 pruned_node=pruned_node,
+                tile_value_rollup_funcs=aggregator.rollup(aggregation_id),
             )
             aggregation_specs.append(agg_spec)
 
@@ -29,7 +29,9 @@ class SqlExpressionTemplate:
         self.sql_expr = sql_expr
         self.source_type = source_type
 
-    def render(self, data: dict[str, Any] | None = None, as_str: bool = True) -> str | Expression:
+    def render(
+        self, data: dict[str, Any] | None = None, as_str: bool = True, pretty: bool = True
+    ) -> str | Expression:
         """
         Render the template by replacing placeholders with actual values
 
@@ -39,6 +41,8 @@ class SqlExpressionTemplate:
             Mapping from placeholder names to replacement values
         as_str : bool
             Whether to return the output as an Expression or convert it to string
+        pretty : bool
+            Whether to format the SQL for readability (only applicable when as_str is True)
 
         Returns
         -------
@@ -54,7 +58,7 @@ class SqlExpressionTemplate:
                 )
             )
         if as_str:
-            return sql_to_string(rendered_expr, source_type=self.source_type)
+            return sql_to_string(rendered_expr, source_type=self.source_type, pretty=pretty)
         return rendered_expr
 
     @classmethod
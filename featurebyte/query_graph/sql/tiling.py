@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -15,6 +16,31 @@ from featurebyte.enum import AggFunc, DBVarType
 from featurebyte.query_graph.sql.adapter import BaseAdapter
 from featurebyte.query_graph.sql.common import quoted_identifier
 
+# Whether to maintain cumulative tile tables for additive aggregations and use them to compute
+# window aggregations with point lookups instead of range joins
+CUMULATIVE_TILES = os.environ.get("FEATUREBYTE_CUMULATIVE_TILES", "false").lower() == "true"
+
+# Column in the cumulative tile tables with the cumulative number of tiles
+CUMULATIVE_TILE_COUNT_COLUMN = "CUMULATIVE_TILE_COUNT"
+
+
+def get_cumulative_tile_table_name(tile_table_id: str, aggregation_id: str) -> str:
+    """
+    Get the name of the table with the cumulative tile values of an aggregation
+
+    Parameters
+    ----------
+    tile_table_id: str
+        Tile table name
+    aggregation_id: str
+        Aggregation id
+
+    Returns
+    -------
+    str
+    """
+    return f"{tile_table_id}_CUMULATIVE_{aggregation_id}"
+
 
 @dataclass
 class InputColumn:
@@ -98,6 +124,49 @@ class TilingAggregator(ABC):
         str
         """
 
+    @staticmethod
+    def rollup(agg_id: str) -> Optional[dict[str, str]]:
+        """Construct the functions required to roll up tiles into coarser tiles
+
+        Rolling up multiple tiles must produce the same tile values as if the coarser tile was
+        computed from the source data directly. This is only possible for some order independent
+        aggregations.
+
+        Parameters
+        ----------
+        agg_id : str
+            Aggregation id. To be used to construct the tile column name.
+
+        Returns
+        -------
+        Optional[dict[str, str]]
+            Mapping from tile column name to the aggregate function that combines the tile values,
+            or None if the tiles cannot be rolled up
+        """
+        _ = agg_id
+        return None
+
+    def cumulative(self, agg_id: str) -> list[str]:
+        """Get the tile columns that can be stored as cumulative values
+
+        A window aggregate over such tile columns is the difference between the cumulative values
+        at both ends of the window. This is only possible when the tile values are additive.
+
+        Parameters
+        ----------
+        agg_id : str
+            Aggregation id. To be used to construct the tile column name.
+
+        Returns
+        -------
+        list[str]
+            Tile column names, or an empty list if the tile values are not additive
+        """
+        rollup_funcs = self.rollup(agg_id)
+        if rollup_funcs is None or any(func != "SUM" for func in rollup_funcs.values()):
+            return []
+        return sorted(rollup_funcs)
+
     def construct_numeric_tile_spec(self, tile_expr: Expression, tile_column_name: str) -> TileSpec:
         """
         Construct a TileSpec for a numeric tile
@@ -151,6 +220,10 @@ class CountAggregator(OrderIndependentAggregator):
     def merge(agg_id: str) -> str:
         return f"SUM(value_{agg_id})"
 
+    @staticmethod
+    def rollup(agg_id: str) -> Optional[dict[str, str]]:
+        return {f"value_{agg_id}": "SUM"}
+
 
 class AvgAggregator(OrderIndependentAggregator):
     """Aggregator that computes the average"""
@@ -172,6 +245,10 @@ class AvgAggregator(OrderIndependentAggregator):
     def merge(agg_id: str) -> str:
         return f"SUM(sum_value_{agg_id}) / SUM(count_value_{agg_id})"
 
+    @staticmethod
+    def rollup(agg_id: str) -> Optional[dict[str, str]]:
+        return {f"sum_value_{agg_id}": "SUM", f"count_value_{agg_id}": "SUM"}
+
 
 class SumAggregator(OrderIndependentAggregator):
     """Aggregator that computes the sum"""
@@ -188,6 +265,10 @@ class SumAggregator(OrderIndependentAggregator):
     def merge(agg_id: str) -> str:
         return f"SUM(value_{agg_id})"
 
+    @staticmethod
+    def rollup(agg_id: str) -> Optional[dict[str, str]]:
+        return {f"value_{agg_id}": "SUM"}
+
 
 class MinAggregator(OrderIndependentAggregator):
     """Aggregator that computes the minimum value"""
@@ -204,6 +285,10 @@ class MinAggregator(OrderIndependentAggregator):
     def merge(agg_id: str) -> str:
         return f"MIN(value_{agg_id})"
 
+    @staticmethod
+    def rollup(agg_id: str) -> Optional[dict[str, str]]:
+        return {f"value_{agg_id}": "MIN"}
+
 
 class MaxAggregator(OrderIndependentAggregator):
     """Aggregator that computes the maximum value"""
@@ -220,6 +305,10 @@ class MaxAggregator(OrderIndependentAggregator):
     def merge(agg_id: str) -> str:
         return f"MAX(value_{agg_id})"
 
+    @staticmethod
+    def rollup(agg_id: str) -> Optional[dict[str, str]]:
+        return {f"value_{agg_id}": "MAX"}
+
 
 class NACountAggregator(OrderIndependentAggregator):
     """Aggregator that counts the number of missing values"""
@@ -240,6 +329,10 @@ class NACountAggregator(OrderIndependentAggregator):
     def merge(agg_id: str) -> str:
         return f"SUM(value_{agg_id})"
 
+    @staticmethod
+    def rollup(agg_id: str) -> Optional[dict[str, str]]:
+        return {f"value_{agg_id}": "SUM"}
+
 
 class StdAggregator(OrderIndependentAggregator):
     """Aggregator that computes the standard deviation"""
@@ -267,6 +360,14 @@ class StdAggregator(OrderIndependentAggregator):
         stddev = f"SQRT({variance})"
         return stddev
 
+    @staticmethod
+    def rollup(agg_id: str) -> Optional[dict[str, str]]:
+        return {
+            f"sum_value_squared_{agg_id}": "SUM",
+            f"sum_value_{agg_id}": "SUM",
+            f"count_value_{agg_id}": "SUM",
+        }
+
 
 class LatestValueAggregator(OrderDependentAggregator):
     """Aggregator that computes the latest value"""
@@ -15,6 +15,7 @@ from featurebyte.models.batch_request_table import BatchRequestTableModel
 from featurebyte.models.persistent import AuditDocumentList
 from featurebyte.routes.common.schema import (
     AuditLogSortByQuery,
+    CursorQuery,
     NameQuery,
     PageQuery,
     PageSizeQuery,
@@ -81,6 +82,7 @@ async def list_batch_request_tables(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = NameQuery,
 ) -> BatchRequestTableList:
@@ -93,6 +95,7 @@ async def list_batch_request_tables(
         page_size=page_size,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
         search=search,
         name=name,
     )
@@ -14,6 +14,7 @@ from featurebyte.models.catalog import CatalogModel, CatalogNameHistoryEntry
 from featurebyte.models.persistent import AuditDocumentList
 from featurebyte.routes.common.schema import (
     AuditLogSortByQuery,
+    CursorQuery,
     NameQuery,
     PageQuery,
     PageSizeQuery,
@@ -56,6 +57,7 @@ async def list_catalogs(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = NameQuery,
 ) -> CatalogList:
@@ -68,6 +70,7 @@ async def list_catalogs(
         page_size=page_size,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
         search=search,
         name=name,
     )
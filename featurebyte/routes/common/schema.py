@@ -23,3 +23,5 @@ AuditLogSortByQuery = Query(
     default="_id", min_length=COLUMN_STR_MIN_LENGTH, max_length=COLUMN_STR_MAX_LENGTH
 )
 VerboseQuery = Query(default=False)
+# keyset pagination cursor (empty string for the first page, next_cursor of a response for the next page)
+CursorQuery = Query(default=None, max_length=1024)
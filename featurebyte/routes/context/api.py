@@ -14,6 +14,7 @@ from featurebyte.models.context import ContextModel
 from featurebyte.models.persistent import AuditDocumentList
 from featurebyte.routes.common.schema import (
     AuditLogSortByQuery,
+    CursorQuery,
     NameQuery,
     PageQuery,
     PageSizeQuery,
@@ -54,6 +55,7 @@ async def list_contexts(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = NameQuery,
 ) -> ContextList:
@@ -66,6 +68,7 @@ async def list_contexts(
         page_size=page_size,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
         search=search,
         name=name,
     )
@@ -13,6 +13,7 @@ from featurebyte.models.base import PydanticObjectId
 from featurebyte.models.persistent import AuditDocumentList
 from featurebyte.routes.common.schema import (
     AuditLogSortByQuery,
+    CursorQuery,
     NameQuery,
     PageQuery,
     PageSizeQuery,
@@ -73,6 +74,7 @@ async def list_credential(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = NameQuery,
     feature_store_id: Optional[PydanticObjectId] = None,
@@ -88,6 +90,7 @@ async def list_credential(
             page_size=page_size,
             sort_by=sort_by,
             sort_dir=sort_dir,
+            cursor=cursor,
             search=search,
             name=name,
             query_filter={} if feature_store_id is None else {"feature_store_id": feature_store_id},
@@ -38,6 +38,8 @@ from featurebyte.service.deployment import AllDeploymentService, DeploymentServi
 from featurebyte.service.feature_list import AllFeatureListService, FeatureListService
 from featurebyte.service.mixin import DEFAULT_PAGE_SIZE
 from featurebyte.service.online_serving import OnlineServingService
+from featurebyte.session.enum import QueryPriority
+from featurebyte.session.query_scheduler import query_priority
 
 
 class DeploymentController(
@@ -190,11 +192,12 @@ class DeploymentController(
         document = await self.service.get_document(deployment_id)
         feature_list = await self.feature_list_service.get_document(document.feature_list_id)
         try:
-            result = await self.online_serving_service.get_online_features_from_feature_list(
-                feature_list=feature_list,
-                request_data=data.entity_serving_names,
-                get_credential=get_credential,
-            )
+            with query_priority(QueryPriority.ONLINE_SERVING):
+                result = await self.online_serving_service.get_online_features_from_feature_list(
+                    feature_list=feature_list,
+                    request_data=data.entity_serving_names,
+                    get_credential=get_credential,
+                )
         except (FeatureListNotOnlineEnabledError, RuntimeError) as exc:
             raise HTTPException(
                 status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail=exc.args[0]
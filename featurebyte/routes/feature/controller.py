@@ -355,6 +355,7 @@ class FeatureController(
         version: str | None = None,
         feature_list_id: ObjectId | None = None,
         feature_namespace_id: ObjectId | None = None,
+        cursor: str | None = None,
     ) -> FeaturePaginatedList:
         """
         List documents stored at persistent (GitDB or MongoDB)
@@ -379,6 +380,8 @@ class FeatureController(
             Feature list ID to be used in filtering
         feature_namespace_id: ObjectId | None
             Feature namespace ID to be used in filtering
+        cursor: str | None
+            Cursor used for keyset pagination (page is ignored if provided)
 
         Returns
         -------
@@ -407,6 +410,7 @@ class FeatureController(
             page_size=page_size,
             sort_by=sort_by,
             sort_dir=sort_dir,
+            cursor=cursor,
             **params,
         )
 
@@ -15,6 +15,7 @@ from featurebyte.models.feature_job_setting_analysis import FeatureJobSettingAna
 from featurebyte.models.persistent import AuditDocumentList
 from featurebyte.routes.common.schema import (
     AuditLogSortByQuery,
+    CursorQuery,
     NameQuery,
     PageQuery,
     PageSizeQuery,
@@ -57,6 +58,7 @@ async def list_feature_job_setting_analysis(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = NameQuery,
     event_table_id: Optional[PydanticObjectId] = None,
@@ -74,6 +76,7 @@ async def list_feature_job_setting_analysis(
         page_size=page_size,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
         search=search,
         name=name,
         **params,
@@ -241,6 +241,7 @@ class FeatureListController(
         name: str | None = None,
         version: str | None = None,
         feature_list_namespace_id: ObjectId | None = None,
+        cursor: str | None = None,
     ) -> FeatureListPaginatedList:
         """
         List documents stored at persistent (GitDB or MongoDB)
@@ -263,6 +264,8 @@ class FeatureListController(
             Feature version to be used in filtering
         feature_list_namespace_id: ObjectId | None
             Feature list namespace ID to be used in filtering
+        cursor: str | None
+            Cursor used for keyset pagination (page is ignored if provided)
 
         Returns
         -------
@@ -285,6 +288,7 @@ class FeatureListController(
             page_size=page_size,
             sort_by=sort_by,
             sort_dir=sort_dir,
+            cursor=cursor,
             **params,
         )
 
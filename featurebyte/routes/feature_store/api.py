@@ -15,6 +15,7 @@ from featurebyte.models.persistent import AuditDocumentList
 from featurebyte.query_graph.node.schema import ColumnSpec
 from featurebyte.routes.common.schema import (
     AuditLogSortByQuery,
+    CursorQuery,
     NameQuery,
     PageQuery,
     PageSizeQuery,
@@ -67,6 +68,7 @@ async def list_feature_stores(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = NameQuery,
 ) -> FeatureStoreList:
@@ -79,6 +81,7 @@ async def list_feature_stores(
         page_size=page_size,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
         search=search,
         name=name,
     )
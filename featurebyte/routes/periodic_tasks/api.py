@@ -10,6 +10,7 @@ from fastapi import APIRouter, Request
 from featurebyte.models.base import PydanticObjectId
 from featurebyte.models.periodic_task import PeriodicTask
 from featurebyte.routes.common.schema import (
+    CursorQuery,
     NameQuery,
     PageQuery,
     PageSizeQuery,
@@ -40,6 +41,7 @@ async def list_periodic_tasks(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = NameQuery,
 ) -> PeriodicTaskList:
@@ -52,6 +54,7 @@ async def list_periodic_tasks(
         page_size=page_size,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
         search=search,
         name=name,
     )
@@ -99,6 +99,7 @@ class RelationshipInfoController(
         sort_dir: Literal["asc", "desc"] = "desc",
         search: Optional[str] = None,
         name: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> RelationshipInfoList:
         """
         List RelationshipInfo at persistent
@@ -117,6 +118,8 @@ class RelationshipInfoController(
             Search token to be used in filtering
         name: str | None
             Feature name to be used in filtering
+        cursor: str | None
+            Cursor used for keyset pagination (page is ignored if provided)
 
         Returns
         -------
@@ -125,7 +128,12 @@ class RelationshipInfoController(
         """
         params: Dict[str, Any] = {"search": search, "name": name}
         return await self.list(
-            page=page, page_size=page_size, sort_by=sort_by, sort_dir=sort_dir, **params
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            cursor=cursor,
+            **params,
         )
 
     async def get_info(
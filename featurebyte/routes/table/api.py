@@ -10,6 +10,7 @@ from fastapi import APIRouter, Request
 from featurebyte.models.base import PydanticObjectId
 from featurebyte.models.proxy_table import ProxyTableModel
 from featurebyte.routes.common.schema import (
+    CursorQuery,
     NameQuery,
     PageQuery,
     PageSizeQuery,
@@ -29,6 +30,7 @@ async def list_table(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = NameQuery,
 ) -> TableList:
@@ -41,6 +43,7 @@ async def list_table(
         page_size=page_size,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
         search=search,
         name=name,
     )
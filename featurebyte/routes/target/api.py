@@ -14,6 +14,7 @@ from featurebyte.models.persistent import AuditDocumentList
 from featurebyte.models.target import TargetModel
 from featurebyte.routes.common.schema import (
     AuditLogSortByQuery,
+    CursorQuery,
     PageQuery,
     PageSizeQuery,
     SearchQuery,
@@ -45,6 +46,7 @@ async def list_target(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = SearchQuery,
 ) -> TargetList:
@@ -53,7 +55,13 @@ async def list_target(
     """
     controller = request.state.app_container.target_controller
     target_list: TargetList = await controller.list_target(
-        page=page, page_size=page_size, sort_by=sort_by, sort_dir=sort_dir, search=search, name=name
+        page=page,
+        page_size=page_size,
+        sort_by=sort_by,
+        sort_dir=sort_dir,
+        cursor=cursor,
+        search=search,
+        name=name,
     )
     return target_list
 
@@ -74,6 +74,7 @@ class TargetController(BaseDocumentController[TargetModel, TargetService, Target
         sort_dir: Literal["asc", "desc"] = "desc",
         search: Optional[str] = None,
         name: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> TargetList:
         """
         List Target at persistent
@@ -92,6 +93,8 @@ class TargetController(BaseDocumentController[TargetModel, TargetService, Target
             Search token to be used in filtering
         name: str | None
             Name token to be used in filtering
+        cursor: str | None
+            Cursor used for keyset pagination (page is ignored if provided)
 
         Returns
         -------
@@ -100,7 +103,12 @@ class TargetController(BaseDocumentController[TargetModel, TargetService, Target
         """
         params: Dict[str, Any] = {"search": search, "name": name}
         return await self.list(
-            page=page, page_size=page_size, sort_by=sort_by, sort_dir=sort_dir, **params
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            cursor=cursor,
+            **params,
         )
 
     async def get_info(
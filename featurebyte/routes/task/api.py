@@ -8,7 +8,7 @@ from typing import Optional
 from fastapi import APIRouter, Request
 
 from featurebyte.routes.common.schema import PageQuery, PageSizeQuery, SortDirQuery
-from featurebyte.schema.task import Task, TaskList
+from featurebyte.schema.task import Task, TaskList, TaskUpdate
 
 router = APIRouter(prefix="/task")
 
@@ -23,6 +23,16 @@ async def get_task(request: Request, task_id: str) -> Task:
     return task
 
 
+@router.patch("/{task_id}", response_model=Task)
+async def update_task(request: Request, task_id: str, update: TaskUpdate) -> Task:
+    """
+    Update TaskStatus (e.g. revoke a running task)
+    """
+    controller = request.state.app_container.task_controller
+    task: Task = await controller.update_task(task_id=task_id, update=update)
+    return task
+
+
 @router.get("", response_model=TaskList)
 async def list_tasks(
     request: Request,
@@ -9,7 +9,7 @@ from http import HTTPStatus
 
 from fastapi import HTTPException
 
-from featurebyte.schema.task import Task, TaskList
+from featurebyte.schema.task import Task, TaskList, TaskUpdate
 from featurebyte.service.mixin import DEFAULT_PAGE_SIZE
 from featurebyte.service.task_manager import TaskManager
 
@@ -48,6 +48,26 @@ class TaskController:
             )
         return task_status
 
+    async def update_task(self, task_id: str, update: TaskUpdate) -> Task:
+        """
+        Update task (e.g. revoke a running task)
+
+        Parameters
+        ----------
+        task_id: str
+            Task ID
+        update: TaskUpdate
+            Task update
+
+        Returns
+        -------
+        Task
+        """
+        await self.get_task(task_id=task_id)
+        if update.revoke:
+            await self.task_manager.revoke_task(task_id=task_id)
+        return await self.get_task(task_id=task_id)
+
     async def list_tasks(
         self,
         page: int = 1,
@@ -12,6 +12,7 @@ from featurebyte.models.persistent import AuditDocumentList
 from featurebyte.models.user_defined_function import UserDefinedFunctionModel
 from featurebyte.routes.common.schema import (
     AuditLogSortByQuery,
+    CursorQuery,
     NameQuery,
     PageQuery,
     PageSizeQuery,
@@ -92,6 +93,7 @@ async def list_user_defined_functions(
     page_size: int = PageSizeQuery,
     sort_by: Optional[str] = SortByQuery,
     sort_dir: Optional[str] = SortDirQuery,
+    cursor: Optional[str] = CursorQuery,
     search: Optional[str] = SearchQuery,
     name: Optional[str] = NameQuery,
     feature_store_id: Optional[PydanticObjectId] = None,
@@ -105,6 +107,7 @@ async def list_user_defined_functions(
         page_size=page_size,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
         search=search,
         name=name,
         feature_store_id=feature_store_id,
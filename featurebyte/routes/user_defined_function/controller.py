@@ -216,6 +216,7 @@ class UserDefinedFunctionController(
         search: str | None = None,
         name: str | None = None,
         feature_store_id: PydanticObjectId | None = None,
+        cursor: str | None = None,
     ) -> UserDefinedFunctionList:
         """
         List UserDefinedFunction stored in persistent
@@ -236,6 +237,8 @@ class UserDefinedFunctionController(
             Feature name to be used in filtering
         feature_store_id: PydanticObjectId | None
             FeatureStore id to be used in filtering
+        cursor: str | None
+            Cursor used for keyset pagination (page is ignored if provided)
 
         Returns
         -------
@@ -250,6 +253,7 @@ class UserDefinedFunctionController(
             page_size=page_size,
             sort_by=sort_by,
             sort_dir=sort_dir,
+            cursor=cursor,
             **params,
         )
 
@@ -45,13 +45,14 @@ class BaseDocumentServiceUpdateSchema(FeatureByteBaseModel):
 
 class PaginationMixin(FeatureByteBaseModel):
     """
-    Add page and page_size
+    Add page and page_size (total is not provided & next_cursor is provided in keyset mode)
     """
 
     page: int = Field(default=1, gt=0)
     page_size: int = Field(default=10, gt=0, le=100)
-    total: int
+    total: Optional[int]
     data: List[Any]
+    next_cursor: Optional[str] = Field(default=None)
 
 
 class DeleteResponse(FeatureByteBaseModel):
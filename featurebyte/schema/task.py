@@ -42,6 +42,14 @@ class Task(FeatureByteBaseModel):
     traceback: Optional[str]
 
 
+class TaskUpdate(FeatureByteBaseModel):
+    """
+    Task update schema
+    """
+
+    revoke: bool
+
+
 class TaskList(PaginationMixin):
     """
     Paginated list of TaskStatus
@@ -6,11 +6,15 @@ from __future__ import annotations
 
 from typing import Any, AsyncIterator, Dict, Generic, Iterator, List, Optional, Type, TypeVar, Union
 
+import base64
+import binascii
 import copy
 from contextlib import contextmanager
 
 import numpy as np
 import pandas as pd
+from bson import json_util
+from bson.errors import InvalidId
 from bson.objectid import ObjectId
 
 from featurebyte.common.dict_util import get_field_path_value
@@ -19,6 +23,7 @@ from featurebyte.exception import (
     DocumentConflictError,
     DocumentModificationBlockedError,
     DocumentNotFoundError,
+    InvalidCursorError,
     QueryNotSupportedError,
 )
 from featurebyte.logging import get_logger
@@ -35,7 +40,7 @@ from featurebyte.models.persistent import (
     FieldValueHistory,
     QueryFilter,
 )
-from featurebyte.persistent.base import Persistent
+from featurebyte.persistent.base import Persistent, get_document_value
 from featurebyte.schema.common.base import BaseDocumentServiceUpdateSchema, BaseInfo
 from featurebyte.service.mixin import (
     DEFAULT_PAGE_SIZE,
@@ -75,6 +80,70 @@ def as_object_id(object_id: Any) -> ObjectId:
     return ObjectId(object_id)
 
 
+def encode_cursor(document: Dict[str, Any], sort_by: str) -> str:
+    """
+    Encode the position of a document in a sorted list as an opaque cursor string
+
+    Parameters
+    ----------
+    document: Dict[str, Any]
+        Last document of a page
+    sort_by: str
+        Key used to sort the documents
+
+    Returns
+    -------
+    str
+    """
+    position = {
+        "_id": document["_id"],
+        "sort_by": sort_by,
+        "value": get_document_value(document, sort_by),
+    }
+    return base64.urlsafe_b64encode(json_util.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_by: str) -> Dict[str, Any]:
+    """
+    Decode a cursor string into a document that only contains the sort key & _id
+
+    Parameters
+    ----------
+    cursor: str
+        Cursor string returned by encode_cursor
+    sort_by: str
+        Key used to sort the documents
+
+    Returns
+    -------
+    Dict[str, Any]
+
+    Raises
+    ------
+    InvalidCursorError
+        If the cursor is malformed or was created for a different sort key
+    """
+    try:
+        position = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+        object_id = as_object_id(position["_id"])
+        cursor_sort_by, value = position["sort_by"], position["value"]
+    except (binascii.Error, ValueError, TypeError, KeyError, InvalidId) as exc:
+        raise InvalidCursorError(f'Invalid cursor "{cursor}".') from exc
+    if cursor_sort_by != sort_by:
+        raise InvalidCursorError(
+            f'Cursor was created for sort_by "{cursor_sort_by}" but sort_by is "{sort_by}".'
+        )
+
+    document: Dict[str, Any] = {"_id": object_id}
+    if sort_by != "_id":
+        *parent_keys, last_key = sort_by.split(".")
+        parent = document
+        for key in parent_keys:
+            parent = parent.setdefault(key, {})
+        parent[last_key] = value
+    return document
+
+
 class BaseDocumentService(
     Generic[Document, DocumentCreateSchema, DocumentUpdateSchema], OpsServiceMixin
 ):
@@ -402,6 +471,7 @@ class BaseDocumentService(
         sort_by: str | None = "created_at",
         sort_dir: SortDir = "desc",
         use_raw_query_filter: bool = False,
+        cursor: Optional[str] = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """
@@ -419,6 +489,10 @@ class BaseDocumentService(
             Sorting the returning documents in ascending order or descending order
         use_raw_query_filter: bool
             Use only provided query filter
+        cursor: Optional[str]
+            Use keyset pagination if provided: the page starts after the position encoded in the
+            cursor (an empty string starts from the first document), `page` is ignored and the
+            documents are not counted. The cursor of the next page is returned as `next_cursor`.
         kwargs: Any
             Additional keyword arguments
 
@@ -435,6 +509,15 @@ class BaseDocumentService(
         query_filter = self.construct_list_query_filter(
             use_raw_query_filter=use_raw_query_filter, **kwargs
         )
+        if cursor is not None:
+            return await self._list_documents_as_dict_after_cursor(
+                query_filter=query_filter,
+                page_size=page_size,
+                sort_by=sort_by or "_id",
+                sort_dir=sort_dir,
+                cursor=cursor,
+            )
+
         try:
             docs, total = await self.persistent.find(
                 collection_name=self.collection_name,
@@ -449,6 +532,41 @@ class BaseDocumentService(
             raise QueryNotSupportedError from exc
         return {"page": page, "page_size": page_size, "total": total, "data": list(docs)}
 
+    async def _list_documents_as_dict_after_cursor(
+        self,
+        query_filter: QueryFilter,
+        page_size: int,
+        sort_by: str,
+        sort_dir: SortDir,
+        cursor: str,
+    ) -> dict[str, Any]:
+        start_after = decode_cursor(cursor, sort_by=sort_by) if cursor else None
+        try:
+            # fetch one more document to find out whether there is a next page
+            docs = await self.persistent.find_after(
+                collection_name=self.collection_name,
+                query_filter=query_filter,
+                sort_by=sort_by,
+                sort_dir=sort_dir,
+                page_size=page_size + 1,
+                start_after=start_after,
+                user_id=self.user.id,
+            )
+        except NotImplementedError as exc:
+            raise QueryNotSupportedError from exc
+
+        next_cursor = None
+        if len(docs) > page_size:
+            docs = docs[:page_size]
+            next_cursor = encode_cursor(docs[-1], sort_by=sort_by)
+        return {
+            "page": 1,
+            "page_size": page_size,
+            "total": None,
+            "data": docs,
+            "next_cursor": next_cursor,
+        }
+
     async def list_documents_as_dict_iterator(
         self,
         query_filter: QueryFilter,
@@ -456,7 +574,9 @@ class BaseDocumentService(
         use_raw_query_filter: bool = False,
     ) -> AsyncIterator[Dict[str, Any]]:
         """
-        List documents iterator to retrieve all the results based on given document service & query filter
+        List documents iterator to retrieve all the results based on given document service & query filter.
+        Documents are retrieved using keyset pagination (each page resumes after the last document of the
+        previous page) so that every document is only scanned once.
 
         Parameters
         ----------
@@ -472,20 +592,26 @@ class BaseDocumentService(
         AsyncIterator[Dict[str, Any]]
             List query output
         """
-        to_iterate, page = True, 1
-
-        while to_iterate:
-            list_results = await self.list_documents_as_dict(
-                page=page,
-                page_size=page_size,
+        query_filter = self.construct_list_query_filter(
+            query_filter=query_filter, use_raw_query_filter=use_raw_query_filter
+        )
+        start_after = None
+        while True:
+            docs = await self.persistent.find_after(
+                collection_name=self.collection_name,
                 query_filter=query_filter,
-                use_raw_query_filter=use_raw_query_filter,
+                sort_by="created_at",
+                sort_dir="desc",
+                page_size=page_size,
+                start_after=start_after,
+                user_id=self.user.id,
             )
-            for doc in list_results["data"]:
+            for doc in docs:
                 yield doc
 
-            to_iterate = bool(list_results["total"] > (page * page_size))
-            page += 1
+            if len(docs) < page_size:
+                break
+            start_after = docs[-1]
 
     async def list_documents_iterator(
         self,
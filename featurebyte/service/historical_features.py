@@ -47,6 +47,8 @@ from featurebyte.service.target_helper.base_feature_or_target_computer import (
 )
 from featurebyte.service.tile_cache import TileCacheService
 from featurebyte.session.base import BaseSession
+from featurebyte.session.enum import QueryPriority
+from featurebyte.session.query_scheduler import query_priority
 
 logger = get_logger(__name__)
 
@@ -104,7 +106,9 @@ async def compute_tiles_on_demand(  # pylint: disable=too-many-arguments
             join_steps=parent_serving_preparation.join_steps,
             feature_store_details=parent_serving_preparation.feature_store_details,
         )
-        request_table_query = sql_to_string(parent_serving_result.table_expr, session.source_type)
+        request_table_query = sql_to_string(
+            parent_serving_result.table_expr, session.source_type, pretty=False
+        )
         effective_request_table_name = parent_serving_result.new_request_table_name
         await session.register_table_with_query(
             effective_request_table_name,
@@ -274,19 +278,20 @@ class HistoricalFeatureExecutor(QueryExecutor[HistoricalFeatureExecutorParams]):
         self.tile_cache_service = tile_cache_service
 
     async def execute(self, executor_params: HistoricalFeatureExecutorParams) -> None:
-        await get_historical_features(
-            session=executor_params.session,
-            tile_cache_service=self.tile_cache_service,
-            graph=executor_params.graph,
-            nodes=executor_params.nodes,
-            observation_set=executor_params.observation_set,
-            serving_names_mapping=executor_params.serving_names_mapping,
-            feature_store=executor_params.feature_store,
-            is_feature_list_deployed=executor_params.is_feature_list_deployed,
-            parent_serving_preparation=executor_params.parent_serving_preparation,
-            output_table_details=executor_params.output_table_details,
-            progress_callback=executor_params.progress_callback,
-        )
+        with query_priority(QueryPriority.BATCH_HISTORICAL):
+            await get_historical_features(
+                session=executor_params.session,
+                tile_cache_service=self.tile_cache_service,
+                graph=executor_params.graph,
+                nodes=executor_params.nodes,
+                observation_set=executor_params.observation_set,
+                serving_names_mapping=executor_params.serving_names_mapping,
+                feature_store=executor_params.feature_store,
+                is_feature_list_deployed=executor_params.is_feature_list_deployed,
+                parent_serving_preparation=executor_params.parent_serving_preparation,
+                output_table_details=executor_params.output_table_details,
+                progress_callback=executor_params.progress_callback,
+            )
 
 
 class HistoricalFeaturesService(
@@ -100,6 +100,19 @@ class TaskManager:
             traceback=traceback,
         )
 
+    async def revoke_task(self, task_id: str) -> None:
+        """
+        Revoke a task. A running task is terminated and the queries it is executing are cancelled
+        in the data warehouse.
+
+        Parameters
+        ----------
+        task_id: str
+            Task ID
+        """
+        # SIGUSR1 raises SoftTimeLimitExceeded in the worker, which cancels the running coroutine
+        self.celery.control.revoke(str(task_id), terminate=True, signal="SIGUSR1")
+
     async def list_tasks(
         self,
         page: int = 1,
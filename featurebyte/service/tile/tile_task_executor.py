@@ -177,6 +177,7 @@ class TileTaskExecutor:
             entity_column_names=params.entity_column_names,
             value_column_names=params.value_column_names,
             value_column_types=params.value_column_types,
+            cumulative_value_column_names=params.cumulative_value_column_names,
             tile_type=params.tile_type,
             last_tile_start_str=tile_end_ts_str,
             aggregation_id=params.aggregation_id,
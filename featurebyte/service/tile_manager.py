@@ -192,6 +192,7 @@ class TileManagerService:
             entity_column_names=tile_spec.entity_column_names,
             value_column_names=tile_spec.value_column_names,
             value_column_types=tile_spec.value_column_types,
+            cumulative_value_column_names=tile_spec.cumulative_value_column_names,
             tile_type=tile_type,
             last_tile_start_str=last_tile_start_ts_str,
             aggregation_id=tile_spec.aggregation_id,
@@ -334,6 +335,7 @@ class TileManagerService:
                 entity_column_names=tile_spec.entity_column_names,
                 value_column_names=tile_spec.value_column_names,
                 value_column_types=tile_spec.value_column_types,
+                cumulative_value_column_names=tile_spec.cumulative_value_column_names,
                 tile_type=tile_type,
                 offline_period_minute=offline_minutes,
                 monitor_periods=monitor_periods,
@@ -12,6 +12,7 @@ import os
 import time
 from abc import ABC, abstractmethod
 from asyncio import events
+from concurrent.futures import Executor
 from io import BytesIO
 
 import aiofiles
@@ -41,17 +42,23 @@ from featurebyte.query_graph.sql.common import (
     quoted_identifier,
     sql_to_string,
 )
+from featurebyte.session.executor import get_session_executor
+from featurebyte.session.metadata_cache import MetadataCache
+from featurebyte.session.query_scheduler import QueryScheduler
 
 MINUTES_IN_SECONDS = 60
 HOUR_IN_SECONDS = 60 * MINUTES_IN_SECONDS
 DEFAULT_EXECUTE_QUERY_TIMEOUT_SECONDS = 10 * MINUTES_IN_SECONDS
 LONG_RUNNING_EXECUTE_QUERY_TIMEOUT_SECONDS = 24 * HOUR_IN_SECONDS
+CANCEL_QUERY_TIMEOUT_SECONDS = 30
 
 
 logger = get_logger(__name__)
 
 
-async def to_thread(func: Any, timeout: float, /, *args: Any, **kwargs: Any) -> Any:
+async def to_thread(
+    func: Any, timeout: float, /, *args: Any, executor: Optional[Executor] = None, **kwargs: Any
+) -> Any:
     """
     Run blocking function in a thread pool and wait for the result.
     From asyncio.to_thread implementation which is only available in Python 3.9
@@ -64,6 +71,9 @@ async def to_thread(func: Any, timeout: float, /, *args: Any, **kwargs: Any) ->
         Timeout in seconds.
     *args : Any
         Positional arguments to `func`.
+    executor : Optional[Executor]
+        Executor used to run the function. Use the default executor of the event loop if not
+        provided.
     **kwargs : Any
         Keyword arguments to `func`.
 
@@ -74,7 +84,7 @@ async def to_thread(func: Any, timeout: float, /, *args: Any, **kwargs: Any) ->
     loop = events.get_running_loop()
     ctx = contextvars.copy_context()
     func_call = functools.partial(ctx.run, func, *args, **kwargs)
-    return await asyncio.wait_for(loop.run_in_executor(None, func_call), timeout)
+    return await asyncio.wait_for(loop.run_in_executor(executor, func_call), timeout)
 
 
 class BaseSession(BaseModel):
@@ -87,12 +97,25 @@ class BaseSession(BaseModel):
     source_type: SourceType
     _connection: Any = PrivateAttr(default=None)
     _unique_id: int = PrivateAttr(default=0)
+    _query_scheduler: Optional[QueryScheduler] = PrivateAttr(default=None)
+    _metadata_cache: Optional[MetadataCache] = PrivateAttr(default=None)
     _no_schema_error: ClassVar[Any] = Exception
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         # close connection
         self._connection.close()
 
+    @property
+    def executor(self) -> Executor:
+        """
+        Bounded executor used to run blocking driver calls, shared by sessions of the same type
+
+        Returns
+        -------
+        Executor
+        """
+        return get_session_executor(self.source_type)
+
     async def initialize(self) -> None:
         """
         Initialize session
@@ -118,6 +141,28 @@ class BaseSession(BaseModel):
         """
         return self._connection
 
+    def set_query_scheduler(self, query_scheduler: Optional[QueryScheduler]) -> None:
+        """
+        Set the scheduler used to limit the number of concurrent queries on the feature store
+
+        Parameters
+        ----------
+        query_scheduler: Optional[QueryScheduler]
+            Query scheduler of the feature store. Queries are not scheduled if not provided.
+        """
+        self._query_scheduler = query_scheduler
+
+    def set_metadata_cache(self, metadata_cache: Optional[MetadataCache]) -> None:
+        """
+        Set the cache of table metadata shared by sessions of the same feature store
+
+        Parameters
+        ----------
+        metadata_cache: Optional[MetadataCache]
+            Metadata cache of the feature store. Table metadata is not cached if not provided.
+        """
+        self._metadata_cache = metadata_cache
+
     def generate_session_unique_id(self) -> str:
         """Generate unique id within the session
 
@@ -153,9 +198,71 @@ class BaseSession(BaseModel):
         list[str]
         """
 
-    @abstractmethod
     async def list_tables(
         self, database_name: str | None = None, schema_name: str | None = None
+    ) -> list[str]:
+        """
+        Retrieve table names, using the metadata cache of the feature store if available
+
+        Parameters
+        ----------
+        database_name: str | None
+            Database name
+        schema_name: str | None
+            Schema name
+
+        Returns
+        -------
+        list[str]
+        """
+        if self._metadata_cache is None:
+            return await self._list_tables(database_name=database_name, schema_name=schema_name)
+        key = MetadataCache.tables_key(database_name, schema_name)
+        tables: Optional[list[str]] = self._metadata_cache.get(key)
+        if tables is None:
+            tables = await self._list_tables(database_name=database_name, schema_name=schema_name)
+            self._metadata_cache.set(key, tables)
+        return tables
+
+    async def list_table_schema(
+        self,
+        table_name: str | None,
+        database_name: str | None = None,
+        schema_name: str | None = None,
+    ) -> OrderedDict[str, DBVarType]:
+        """
+        Retrieve table schema of a given table name, using the metadata cache of the feature store
+        if available
+
+        Parameters
+        ----------
+        table_name: str | None
+            Table name
+        database_name: str | None
+            Database name
+        schema_name: str | None
+            Schema name
+
+        Returns
+        -------
+        OrderedDict[str, DBVarType]
+        """
+        if self._metadata_cache is None:
+            return await self._list_table_schema(
+                table_name=table_name, database_name=database_name, schema_name=schema_name
+            )
+        key = MetadataCache.table_schema_key(database_name, schema_name, table_name)
+        table_schema: Optional[OrderedDict[str, DBVarType]] = self._metadata_cache.get(key)
+        if table_schema is None:
+            table_schema = await self._list_table_schema(
+                table_name=table_name, database_name=database_name, schema_name=schema_name
+            )
+            self._metadata_cache.set(key, table_schema)
+        return table_schema
+
+    @abstractmethod
+    async def _list_tables(
+        self, database_name: str | None = None, schema_name: str | None = None
     ) -> list[str]:
         """
         Execute SQL query to retrieve table names
@@ -173,7 +280,7 @@ class BaseSession(BaseModel):
         """
 
     @abstractmethod
-    async def list_table_schema(
+    async def _list_table_schema(
         self,
         table_name: str | None,
         database_name: str | None = None,
@@ -185,12 +292,12 @@ class BaseSession(BaseModel):
 
         Parameters
         ----------
+        table_name: str | None
+            Table name
         database_name: str | None
             Database name
         schema_name: str | None
             Schema name
-        table_name: str
-            Table name
 
         Returns
         -------
@@ -243,6 +350,37 @@ class BaseSession(BaseModel):
         """
         Stream results from asynchronous query as compressed arrow bytestream
 
+        Parameters
+        ----------
+        query: str
+            sql query to execute
+        timeout: float
+            timeout in seconds
+
+        Yields
+        ------
+        bytes
+            Byte chunk
+        """
+        try:
+            if self._query_scheduler is None:
+                async for chunk in self._get_async_query_stream(query=query, timeout=timeout):
+                    yield chunk
+            else:
+                async with self._query_scheduler.acquire():
+                    async for chunk in self._get_async_query_stream(query=query, timeout=timeout):
+                        yield chunk
+        finally:
+            # table metadata may have changed even if the DDL query failed or was cancelled
+            if self._metadata_cache is not None:
+                self._metadata_cache.invalidate_by_query(query)
+
+    async def _get_async_query_stream(
+        self, query: str, timeout: float
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Execute the query and stream the results as compressed arrow bytestream
+
         Parameters
         ----------
         query: str
@@ -266,7 +404,13 @@ class BaseSession(BaseModel):
         writer = None
         try:
             # execute in separate thread
-            await to_thread(cursor.execute, timeout, query)
+            try:
+                await to_thread(cursor.execute, timeout, query, executor=self.executor)
+            except (asyncio.exceptions.TimeoutError, asyncio.CancelledError):
+                # the thread executing the query cannot be interrupted, cancel the query in the
+                # data warehouse so that it does not keep running after the caller gave up
+                await self._cancel_running_query(cursor, query)
+                raise
             if not cursor.description:
                 return
 
@@ -305,6 +449,55 @@ class BaseSession(BaseModel):
                 },
             )
 
+    async def _cancel_running_query(self, cursor: Any, query: str) -> None:
+        """
+        Cancel a query that is still running in the data warehouse (best effort)
+
+        Parameters
+        ----------
+        cursor: Any
+            The connection cursor used to execute the query
+        query: str
+            sql query being cancelled
+        """
+        # not submitted to the session executor since it could be saturated by running queries
+        loop = events.get_running_loop()
+        try:
+            is_cancelled = await asyncio.wait_for(
+                loop.run_in_executor(None, self.cancel_query, cursor, query),
+                CANCEL_QUERY_TIMEOUT_SECONDS,
+            )
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Failed to cancel query", exc_info=True)
+            return
+        logger.info(
+            "Query cancelled" if is_cancelled else "Query cancellation not supported",
+            extra={"query": query.strip()[:50].replace("\n", " ")},
+        )
+
+    def cancel_query(self, cursor: Any, query: str) -> bool:
+        """
+        Cancel the query executed by the cursor using the driver's cancel API. This is a blocking
+        call that is expected to be invoked from a thread other than the one executing the query.
+
+        Parameters
+        ----------
+        cursor: Any
+            The connection cursor used to execute the query
+        query: str
+            sql query being cancelled
+
+        Returns
+        -------
+        bool
+            Whether the cancellation request was sent
+        """
+        _ = query
+        if not hasattr(cursor, "cancel"):
+            return False
+        cursor.cancel()
+        return True
+
     async def get_working_schema_metadata(self) -> dict[str, Any]:
         """Retrieves the working schema version from the table registered in the
         working schema.
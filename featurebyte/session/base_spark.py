@@ -3,12 +3,15 @@ BaseSparkSession class
 """
 from __future__ import annotations
 
-from typing import Any, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
+import asyncio
 import os
 from abc import ABC
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from bson import ObjectId
 from pydantic import PrivateAttr
 
@@ -22,7 +25,13 @@ from featurebyte.models.credential import (
     S3StorageCredential,
     StorageCredential,
 )
-from featurebyte.session.base import BaseSchemaInitializer, BaseSession, MetadataSchemaInitializer
+from featurebyte.session.base import (
+    LONG_RUNNING_EXECUTE_QUERY_TIMEOUT_SECONDS,
+    BaseSchemaInitializer,
+    BaseSession,
+    MetadataSchemaInitializer,
+    to_thread,
+)
 from featurebyte.session.simple_storage import (
     AzureBlobStorage,
     FileMode,
@@ -34,6 +43,16 @@ from featurebyte.session.simple_storage import (
 
 logger = get_logger(__name__)
 
+# Maximum number of rows in each parquet file staged by register_table
+REGISTER_TABLE_PART_NUM_ROWS = int(
+    os.environ.get("FEATUREBYTE_SPARK_REGISTER_TABLE_PART_NUM_ROWS", 1000000)
+)
+
+# Maximum number of parquet files uploaded concurrently by register_table
+REGISTER_TABLE_UPLOAD_CONCURRENCY = int(
+    os.environ.get("FEATUREBYTE_SPARK_REGISTER_TABLE_UPLOAD_CONCURRENCY", 4)
+)
+
 
 class BaseSparkSession(BaseSession, ABC):
     """
@@ -41,6 +60,7 @@ class BaseSparkSession(BaseSession, ABC):
     """
 
     _storage: SimpleStorage = PrivateAttr()
+    _staged_files: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
 
     host: str
     http_path: str
@@ -196,39 +216,125 @@ class BaseSparkSession(BaseSession, ABC):
             create_command = "CREATE OR REPLACE VIEW"
         await self.execute_query_long_running(f"{create_command} `{table_name}` AS {query}")
 
+    def _write_parquet_part(self, table: pa.Table, path: str) -> None:
+        """
+        Write an Arrow table to a parquet file in the storage
+
+        Parameters
+        ----------
+        table: pa.Table
+            Arrow table to write
+        path: str
+            Remote file path
+        """
+        with self._storage.open(path=path, mode="wb") as out_file_obj:
+            # truncate timestamps to microseconds to avoid parquet and Spark issues
+            pq.write_table(
+                table,
+                out_file_obj,
+                coerce_timestamps="us",
+                allow_truncated_timestamps=True,
+            )
+
+    async def _stage_dataframe(self, dataframe: pd.DataFrame) -> Tuple[str, List[str]]:
+        """
+        Write a dataframe to the storage as parquet files of at most REGISTER_TABLE_PART_NUM_ROWS
+        rows each. The parts are zero-copy slices of an Arrow table and are written concurrently.
+
+        Parameters
+        ----------
+        dataframe: pd.DataFrame
+            Dataframe to stage
+
+        Returns
+        -------
+        Tuple[str, List[str]]
+            Spark path pattern matching the staged files and the paths of the staged files
+        """
+        staging_prefix = f"temp_{ObjectId()}"
+        arrow_table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        part_num_rows = max(REGISTER_TABLE_PART_NUM_ROWS, 1)
+        parts = [
+            arrow_table.slice(offset, part_num_rows)
+            for offset in range(0, max(arrow_table.num_rows, 1), part_num_rows)
+        ]
+        semaphore = asyncio.Semaphore(max(REGISTER_TABLE_UPLOAD_CONCURRENCY, 1))
+        paths = []
+
+        async def _write_part(part_index: int, part: pa.Table) -> None:
+            path = f"{staging_prefix}_part_{part_index:05d}.parquet"
+            paths.append(path)
+            async with semaphore:
+                await to_thread(
+                    self._write_parquet_part,
+                    LONG_RUNNING_EXECUTE_QUERY_TIMEOUT_SECONDS,
+                    part,
+                    path,
+                    executor=self.executor,
+                )
+
+        results = await asyncio.gather(
+            *[_write_part(i, part) for i, part in enumerate(parts)], return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                self._delete_staged_files(paths)
+                raise result
+        return f"{self.storage_spark_url}/{staging_prefix}_part_*.parquet", paths
+
+    def _delete_staged_files(self, paths: List[str]) -> None:
+        for path in paths:
+            try:
+                self._storage.delete_object(path=path)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.error(f"Exception while deleting temp file {path}: {exc}")
+
     async def register_table(
-        self, table_name: str, dataframe: pd.DataFrame, temporary: bool = True
+        self,
+        table_name: str,
+        dataframe: pd.DataFrame,
+        temporary: bool = True,
+        cache: bool = True,
     ) -> None:
-        # truncate timestamps to microseconds to avoid parquet and Spark issues
-        if dataframe.shape[0] > 0:
-            for colname in dataframe.columns:
-                if pd.api.types.is_datetime64_any_dtype(
-                    dataframe[colname]
-                ) or pd.api.types.is_datetime64tz_dtype(dataframe[colname]):
-                    dataframe[colname] = dataframe[colname].dt.floor("us")
-
-        # write to parquet file
-        temp_filename = f"temp_{ObjectId()}.parquet"
-        with self._storage.open(path=temp_filename, mode="wb") as out_file_obj:
-            dataframe.to_parquet(out_file_obj)
-            out_file_obj.flush()
+        """
+        Register a table
 
+        Parameters
+        ----------
+        table_name : str
+            Temp table name
+        dataframe : pd.DataFrame
+            DataFrame to register
+        temporary : bool
+            If True, register a temporary table
+        cache : bool
+            Whether to cache a temporary table so that its staging files can be removed
+            immediately. Temporary tables that will be consumed once can skip caching, in which
+            case the staging files are removed when the table is dropped using drop_table.
+        """
+        spark_path, staged_paths = await self._stage_dataframe(dataframe)
+        keep_staged_files = False
         try:
             if temporary:
-                # create cached temp view
+                # create temp view
                 await self.execute_query(
                     f"CREATE OR REPLACE TEMPORARY VIEW `{table_name}` USING parquet OPTIONS "
-                    f"(path '{self.storage_spark_url}/{temp_filename}')"
+                    f"(path '{spark_path}')"
                 )
-                # cache table so we can remove the temp file
-                await self.execute_query(f"CACHE TABLE `{table_name}`")
+                if cache:
+                    # cache table so we can remove the temp files
+                    await self.execute_query(f"CACHE TABLE `{table_name}`")
+                else:
+                    keep_staged_files = True
+                    self._delete_staged_files(self._staged_files.pop(table_name, []))
+                    self._staged_files[table_name] = staged_paths
             else:
                 # register a permanent table from uncached temp view
                 request_id = self.generate_session_unique_id()
                 temp_view_name = f"__TEMP_TABLE_{request_id}"
                 await self.execute_query(
                     f"CREATE OR REPLACE TEMPORARY VIEW `{temp_view_name}` USING parquet OPTIONS "
-                    f"(path '{self.storage_spark_url}/{temp_filename}')"
+                    f"(path '{spark_path}')"
                 )
 
                 await self.execute_query(
@@ -237,11 +343,27 @@ class BaseSparkSession(BaseSession, ABC):
                     f"AS SELECT * FROM `{temp_view_name}`"
                 )
         finally:
-            # clean up staging file
-            try:
-                self._storage.delete_object(path=temp_filename)
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                logger.error(f"Exception while deleting temp file {temp_filename}: {exc}")
+            # clean up staging files
+            if not keep_staged_files:
+                self._delete_staged_files(staged_paths)
+
+    async def drop_table(
+        self,
+        table_name: str,
+        schema_name: str,
+        database_name: str,
+        if_exists: bool = False,
+    ) -> None:
+        try:
+            await super().drop_table(
+                table_name=table_name,
+                schema_name=schema_name,
+                database_name=database_name,
+                if_exists=if_exists,
+            )
+        finally:
+            # clean up staging files of uncached temporary table
+            self._delete_staged_files(self._staged_files.pop(table_name, []))
 
 
 class BaseSparkMetadataSchemaInitializer(MetadataSchemaInitializer):
@@ -4,13 +4,15 @@ DatabricksSession class
 # pylint: disable=duplicate-code
 from __future__ import annotations
 
-from typing import Any, AsyncGenerator, Dict, OrderedDict
+from typing import Any, AsyncGenerator, Dict, Optional, OrderedDict
 
 import collections
 import json
+import os
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 from pydantic import Field
 
 from featurebyte import AccessTokenCredential
@@ -26,17 +28,180 @@ except ImportError:
     HAS_DATABRICKS_SQL_CONNECTOR = False
 
 
+# Whether to keep MAP columns as native Arrow map arrays in query result streams instead of
+# converting them to JSON strings
+DATABRICKS_STREAM_NATIVE_MAP_COLUMNS = (
+    os.environ.get("FEATUREBYTE_DATABRICKS_STREAM_NATIVE_MAP_COLUMNS", "false").lower() == "true"
+)
+
+# Escape sequences used when encoding strings as JSON string literals. Strings with other control
+# characters or non-ASCII characters (escaped by json.dumps) are handled by falling back to
+# json.dumps.
+_JSON_STRING_ESCAPES = [
+    ("\\", "\\\\"),
+    ('"', '\\"'),
+    ("\n", "\\n"),
+    ("\r", "\\r"),
+    ("\t", "\\t"),
+]
+_UNSUPPORTED_CHARACTERS_PATTERN = "[^\\t\\n\\r\\x20-\\x7f]"
+
+
+def _to_json_string_literals(array: pa.Array) -> Optional[pa.Array]:
+    """
+    Encode a string array as JSON string literals
+
+    Parameters
+    ----------
+    array: pa.Array
+        String array
+
+    Returns
+    -------
+    Optional[pa.Array]
+        Array of JSON string literals, or None if some values cannot be encoded
+    """
+    if pc.any(pc.match_substring_regex(array, _UNSUPPORTED_CHARACTERS_PATTERN)).as_py():
+        return None
+    for pattern, replacement in _JSON_STRING_ESCAPES:
+        array = pc.replace_substring(array, pattern=pattern, replacement=replacement)
+    return pc.binary_join_element_wise('"', array, '"', "")
+
+
+def _to_json_values(array: pa.Array) -> Optional[pa.Array]:
+    """
+    Encode an array of map keys or values as JSON values
+
+    Parameters
+    ----------
+    array: pa.Array
+        Array of map keys or values
+
+    Returns
+    -------
+    Optional[pa.Array]
+        Array of JSON values (null values encoded as "null"), or None if the array type is not
+        supported
+    """
+    if pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+        encoded = _to_json_string_literals(array)
+    elif pa.types.is_boolean(array.type) or pa.types.is_integer(array.type):
+        encoded = pc.cast(array, pa.string())
+    elif pa.types.is_floating(array.type):
+        encoded = pc.cast(array, pa.string())
+        # match json.dumps formatting of whole numbers and non-finite values
+        encoded = pc.replace_substring_regex(encoded, pattern=r"^(-?\d+)$", replacement=r"\1.0")
+        encoded = pc.replace_substring_regex(
+            encoded, pattern=r"e([+-])(\d)$", replacement=r"e\10\2"
+        )
+        encoded = pc.replace_substring_regex(encoded, pattern="^nan$", replacement="NaN")
+        encoded = pc.replace_substring_regex(encoded, pattern="inf$", replacement="Infinity")
+    else:
+        return None
+    if encoded is None:
+        return None
+    return pc.fill_null(encoded, "null")
+
+
+def map_array_to_json(array: pa.MapArray) -> Optional[pa.Array]:
+    """
+    Convert a map array to an array of JSON strings using Arrow compute functions on the offsets
+    and the key & item children of the map array
+
+    Parameters
+    ----------
+    array: pa.MapArray
+        Map array to convert
+
+    Returns
+    -------
+    Optional[pa.Array]
+        String array of JSON objects (null for null maps), or None if the key or item type is not
+        supported
+    """
+    keys = array.keys
+    if not (pa.types.is_string(keys.type) or pa.types.is_large_string(keys.type)):
+        # json.dumps converts non-string keys to strings
+        keys = pc.cast(keys, pa.string())
+    encoded_keys = _to_json_values(keys)
+    encoded_items = _to_json_values(array.items)
+    if encoded_keys is None or encoded_items is None:
+        return None
+    pairs = pc.binary_join_element_wise(encoded_keys, encoded_items, ": ")
+    # offsets of a sliced map array index into the unsliced children
+    offsets = array.offsets
+    start, end = offsets[0].as_py(), offsets[-1].as_py()
+    offsets = pc.subtract(offsets, pa.scalar(start, offsets.type))
+    pairs_by_row = pa.ListArray.from_arrays(
+        offsets, pairs.slice(start, end - start), mask=array.is_null()
+    )
+    return pc.binary_join_element_wise("{", pc.binary_join(pairs_by_row, ", "), "}", "")
+
+
 class ArrowTablePostProcessor:
     """
     Post processor for Arrow table to fix databricks return format
+
+    Parameters
+    ----------
+    schema: Dict[str, str]
+        Mapping from column name to Databricks type name
+    keep_map_columns: bool
+        Whether to keep MAP columns as native Arrow map arrays in Arrow tables returned by
+        to_arrow_table instead of converting them to JSON strings
     """
 
-    def __init__(self, schema: Dict[str, str]):
+    def __init__(self, schema: Dict[str, str], keep_map_columns: bool = False):
         self._map_columns = []
+        self._keep_map_columns = keep_map_columns
         for col_name, var_type in schema.items():
             if var_type.upper() == "MAP":
                 self._map_columns.append(col_name)
 
+    @staticmethod
+    def _map_column_to_json(column: pa.ChunkedArray) -> Optional[pa.ChunkedArray]:
+        if not pa.types.is_map(column.type):
+            return None
+        chunks = []
+        for chunk in column.chunks:
+            converted = map_array_to_json(chunk)
+            if converted is None:
+                return None
+            chunks.append(converted)
+        return pa.chunked_array(chunks, type=pa.string())
+
+    def to_arrow_table(self, arrow_table: pa.Table) -> pa.Table:
+        """
+        Convert MAP columns of an Arrow table to JSON strings unless keep_map_columns is set
+
+        Parameters
+        ----------
+        arrow_table: pa.Table
+            Arrow table to convert
+
+        Returns
+        -------
+        pa.Table
+            Arrow table. MAP columns that cannot be converted with Arrow compute functions are
+            converted using json.dumps.
+        """
+        if self._keep_map_columns:
+            return arrow_table
+        for col_name in self._map_columns:
+            index = arrow_table.schema.get_field_index(col_name)
+            column = arrow_table.column(index)
+            converted = self._map_column_to_json(column)
+            if converted is None:
+                converted = pa.chunked_array(
+                    [self._map_values_to_json(column.to_pandas()).tolist()], type=pa.string()
+                )
+            arrow_table = arrow_table.set_column(index, col_name, converted)
+        return arrow_table
+
+    @staticmethod
+    def _map_values_to_json(values: pd.Series) -> pd.Series:
+        return values.apply(lambda x: json.dumps(dict(x)) if x is not None else None)
+
     def to_dataframe(self, arrow_table: pa.Table) -> pd.DataFrame:
         """
         Convert Arrow table to Pandas dataframe
@@ -53,12 +218,21 @@ class ArrowTablePostProcessor:
         """
         # handle map type. Databricks returns map as list of tuples
         # https://docs.databricks.com/sql/language-manual/sql-ref-datatypes.html#map
-        # which is not supported by pyarrow. Below converts the tuple list to json string
+        # which is not supported by pandas. Below converts the map arrays to json strings, using
+        # Arrow compute functions where possible
+        converted = {}
+        for col_name in self._map_columns:
+            column = arrow_table.column(col_name)
+            converted_column = self._map_column_to_json(column)
+            if converted_column is not None:
+                converted[col_name] = converted_column
+        for col_name, converted_column in converted.items():
+            index = arrow_table.schema.get_field_index(col_name)
+            arrow_table = arrow_table.set_column(index, col_name, converted_column)
         dataframe = arrow_table.to_pandas()
         for col_name in self._map_columns:
-            dataframe[col_name] = dataframe[col_name].apply(
-                lambda x: json.dumps(dict(x)) if x is not None else None
-            )
+            if col_name not in converted:
+                dataframe[col_name] = self._map_values_to_json(dataframe[col_name])
         return dataframe
 
 
@@ -106,7 +280,7 @@ class DatabricksSession(BaseSparkSession):
             out.extend(df_result["TABLE_SCHEM"])
         return out
 
-    async def list_tables(
+    async def _list_tables(
         self, database_name: str | None = None, schema_name: str | None = None
     ) -> list[str]:
         cursor = self._connection.cursor().tables(
@@ -118,7 +292,7 @@ class DatabricksSession(BaseSparkSession):
             out.extend(df_result["TABLE_NAME"])
         return out
 
-    async def list_table_schema(
+    async def _list_table_schema(
         self,
         table_name: str | None,
         database_name: str | None = None,
@@ -158,11 +332,12 @@ class DatabricksSession(BaseSparkSession):
             schema = {row[0]: row[1] for row in cursor.description}
 
         if schema:
-            post_processor = ArrowTablePostProcessor(schema=schema)
+            post_processor = ArrowTablePostProcessor(
+                schema=schema, keep_map_columns=DATABRICKS_STREAM_NATIVE_MAP_COLUMNS
+            )
             # fetch results in batches
             while True:
-                dataframe = post_processor.to_dataframe(cursor.fetchmany_arrow(size=1000))
-                arrow_table = pa.Table.from_pandas(dataframe)
+                arrow_table = post_processor.to_arrow_table(cursor.fetchmany_arrow(size=1000))
                 if arrow_table.num_rows == 0:
                     break
                 for record_batch in arrow_table.to_batches():
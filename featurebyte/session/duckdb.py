@@ -0,0 +1,532 @@
+"""
+DuckDBSession class
+"""
+from __future__ import annotations
+
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, OrderedDict, Tuple
+
+import collections
+import json
+import math
+import re
+
+import pandas as pd
+import pyarrow as pa
+from pydantic import Field
+
+from featurebyte.enum import DBVarType, SourceType
+from featurebyte.logging import get_logger
+from featurebyte.session.base import (
+    LONG_RUNNING_EXECUTE_QUERY_TIMEOUT_SECONDS,
+    BaseSchemaInitializer,
+    BaseSession,
+    to_thread,
+)
+
+try:
+    import duckdb
+    from duckdb.typing import BOOLEAN, DOUBLE, VARCHAR
+
+    HAS_DUCKDB = True
+except ImportError:
+    HAS_DUCKDB = False
+
+
+logger = get_logger(__name__)
+
+# Number of rows in each record batch fetched from query results
+FETCH_BATCH_NUM_ROWS = 100000
+
+# Working schema functions implemented as DuckDB macros so that they are evaluated natively
+MACROS = [
+    """
+    CREATE OR REPLACE MACRO F_TIMESTAMP_TO_INDEX(
+        event_timestamp, time_modulo_frequency_seconds, blind_spot_seconds, frequency_minute
+    ) AS CAST(
+        FLOOR(
+            (
+                EPOCH(CAST(event_timestamp AS TIMESTAMP))
+                - (time_modulo_frequency_seconds - blind_spot_seconds)
+            ) / (frequency_minute * 60)
+        ) AS BIGINT
+    )
+    """,
+    """
+    CREATE OR REPLACE MACRO F_INDEX_TO_TIMESTAMP(
+        tile_index, time_modulo_frequency_seconds, blind_spot_seconds, frequency_minute
+    ) AS STRFTIME(
+        EPOCH_MS(
+            CAST(
+                (
+                    CAST(tile_index AS BIGINT) * frequency_minute * 60
+                    + time_modulo_frequency_seconds
+                    - blind_spot_seconds
+                ) * 1000 AS BIGINT
+            )
+        ),
+        '%Y-%m-%dT%H:%M:%S.%gZ'
+    )
+    """,
+    """
+    CREATE OR REPLACE MACRO OBJECT_DELETE(counts, key_to_delete) AS
+        JSON_MERGE_PATCH(counts, JSON_OBJECT(key_to_delete, NULL))
+    """,
+]
+
+
+def _load_counts(counts: Optional[str]) -> Optional[Dict[str, Any]]:
+    if counts is None:
+        return None
+    loaded = json.loads(counts)
+    if not isinstance(loaded, dict):
+        return None
+    return loaded
+
+
+def _get_most_frequent_key_value(counts: Optional[str]) -> Tuple[Optional[str], Optional[float]]:
+    loaded = _load_counts(counts)
+    if not loaded:
+        return None, None
+    most_frequent_key, most_frequent_count = None, 0
+    for key, value in loaded.items():
+        if value is None:
+            continue
+        if value > most_frequent_count or (
+            value == most_frequent_count
+            and most_frequent_key is not None
+            and key < most_frequent_key
+        ):
+            most_frequent_key, most_frequent_count = key, value
+    if most_frequent_key is None:
+        return None, None
+    return most_frequent_key, most_frequent_count
+
+
+def count_dict_most_frequent(counts: Optional[str]) -> Optional[str]:
+    """
+    Get the key with the highest count in a count dictionary (smallest key in case of ties)
+
+    Parameters
+    ----------
+    counts: Optional[str]
+        Count dictionary as a JSON string
+
+    Returns
+    -------
+    Optional[str]
+    """
+    return _get_most_frequent_key_value(counts)[0]
+
+
+def count_dict_most_frequent_value(counts: Optional[str]) -> Optional[float]:
+    """
+    Get the highest count in a count dictionary
+
+    Parameters
+    ----------
+    counts: Optional[str]
+        Count dictionary as a JSON string
+
+    Returns
+    -------
+    Optional[float]
+    """
+    return _get_most_frequent_key_value(counts)[1]
+
+
+def count_dict_entropy(counts: Optional[str]) -> Optional[float]:
+    """
+    Get the entropy of the counts in a count dictionary
+
+    Parameters
+    ----------
+    counts: Optional[str]
+        Count dictionary as a JSON string
+
+    Returns
+    -------
+    Optional[float]
+    """
+    loaded = _load_counts(counts)
+    if loaded is None:
+        return None
+    values = [value or 0 for value in loaded.values()]
+    total = sum(values)
+    entropy = 0.0
+    for value in values:
+        if value > 0:
+            probability = value / total
+            entropy += probability * math.log(probability)
+    return -entropy
+
+
+def count_dict_num_unique(counts: Optional[str]) -> float:
+    """
+    Get the number of keys in a count dictionary
+
+    Parameters
+    ----------
+    counts: Optional[str]
+        Count dictionary as a JSON string
+
+    Returns
+    -------
+    float
+    """
+    loaded = _load_counts(counts)
+    if loaded is None:
+        return 0
+    return len(loaded)
+
+
+def count_dict_cosine_similarity(
+    counts_1: Optional[str], counts_2: Optional[str]
+) -> Optional[float]:
+    """
+    Get the cosine similarity between two count dictionaries
+
+    Parameters
+    ----------
+    counts_1: Optional[str]
+        Count dictionary as a JSON string
+    counts_2: Optional[str]
+        Other count dictionary as a JSON string
+
+    Returns
+    -------
+    Optional[float]
+    """
+    loaded_1, loaded_2 = _load_counts(counts_1), _load_counts(counts_2)
+    if loaded_1 is None or loaded_2 is None:
+        return None
+    if not loaded_1 or not loaded_2:
+        return 0
+    dot_product = sum(
+        (value or 0) * (loaded_2[key] or 0) for key, value in loaded_1.items() if key in loaded_2
+    )
+    norm_1 = math.sqrt(sum((value or 0) ** 2 for value in loaded_1.values()))
+    norm_2 = math.sqrt(sum((value or 0) ** 2 for value in loaded_2.values()))
+    if norm_1 == 0 or norm_2 == 0:
+        return None
+    return dot_product / (norm_1 * norm_2)
+
+
+def get_relative_frequency(counts: Optional[str], key: Optional[str]) -> Optional[float]:
+    """
+    Get the relative frequency of a key in a count dictionary
+
+    Parameters
+    ----------
+    counts: Optional[str]
+        Count dictionary as a JSON string
+    key: Optional[str]
+        Key to look up
+
+    Returns
+    -------
+    Optional[float]
+    """
+    loaded = _load_counts(counts)
+    if loaded is None or key is None:
+        return None
+    if key not in loaded:
+        return 0
+    total = sum(value or 0 for value in loaded.values())
+    return (loaded[key] or 0) / total
+
+
+def get_rank(counts: Optional[str], key: Optional[str], is_descending: bool) -> Optional[float]:
+    """
+    Get the rank of a key in a count dictionary. Keys with the same count have the same rank.
+
+    Parameters
+    ----------
+    counts: Optional[str]
+        Count dictionary as a JSON string
+    key: Optional[str]
+        Key to look up
+    is_descending: bool
+        Whether to rank by descending counts
+
+    Returns
+    -------
+    Optional[float]
+    """
+    loaded = _load_counts(counts)
+    if not loaded or key is None or key not in loaded:
+        return None
+    key_value = loaded[key] or 0
+    values = [value or 0 for value in loaded.values()]
+    if is_descending:
+        return 1 + sum(1 for value in values if value > key_value)
+    return 1 + sum(1 for value in values if value < key_value)
+
+
+TIMEZONE_OFFSET_PATTERN = re.compile(r"^([+-])(\d{2}):(\d{2})$")
+
+
+def timezone_offset_to_second(offset: Optional[str]) -> Optional[float]:
+    """
+    Convert a timezone offset string (e.g. "+08:00") to number of seconds
+
+    Parameters
+    ----------
+    offset: Optional[str]
+        Timezone offset string
+
+    Returns
+    -------
+    Optional[float]
+
+    Raises
+    ------
+    ValueError
+        If the timezone offset string is invalid
+    """
+    if not offset:
+        return None
+    match = TIMEZONE_OFFSET_PATTERN.match(offset)
+    if match is None or int(match.group(2)) > 18 or int(match.group(3)) > 59:
+        raise ValueError(f"Invalid timezone offset format: {offset}")
+    sign = 1 if match.group(1) == "+" else -1
+    return sign * (int(match.group(2)) * 60 + int(match.group(3))) * 60
+
+
+def _get_python_functions() -> List[Tuple[str, Callable[..., Any], List[Any], Any]]:
+    return [
+        ("F_COUNT_DICT_MOST_FREQUENT", count_dict_most_frequent, [VARCHAR], VARCHAR),
+        ("F_COUNT_DICT_MOST_FREQUENT_VALUE", count_dict_most_frequent_value, [VARCHAR], DOUBLE),
+        ("F_COUNT_DICT_ENTROPY", count_dict_entropy, [VARCHAR], DOUBLE),
+        ("F_COUNT_DICT_NUM_UNIQUE", count_dict_num_unique, [VARCHAR], DOUBLE),
+        (
+            "F_COUNT_DICT_COSINE_SIMILARITY",
+            count_dict_cosine_similarity,
+            [VARCHAR, VARCHAR],
+            DOUBLE,
+        ),
+        ("F_GET_RELATIVE_FREQUENCY", get_relative_frequency, [VARCHAR, VARCHAR], DOUBLE),
+        ("F_GET_RANK", get_rank, [VARCHAR, VARCHAR, BOOLEAN], DOUBLE),
+        ("F_TIMEZONE_OFFSET_TO_SECOND", timezone_offset_to_second, [VARCHAR], DOUBLE),
+    ]
+
+
+class DuckDBConnection:
+    """
+    Wrapper of a DuckDB connection that creates cursors using the working schema. DuckDB cursors
+    are separate connections to the same database and do not inherit the current schema of the
+    connection they are created from.
+
+    Parameters
+    ----------
+    connection: Any
+        DuckDB connection
+    schema_name: str
+        Working schema name
+    """
+
+    def __init__(self, connection: Any, schema_name: str):
+        self._connection = connection
+        self._schema_name = schema_name
+
+    def cursor(self) -> Any:
+        """
+        Create a cursor that uses the working schema
+
+        Returns
+        -------
+        Any
+        """
+        cursor = self._connection.cursor()
+        cursor.execute(f'USE "{self._schema_name}"')
+        return cursor
+
+    def close(self) -> None:
+        """
+        Close the connection
+        """
+        self._connection.close()
+
+
+class DuckDBSession(BaseSession):
+    """
+    DuckDB session class. Runs featurebyte queries on an embedded DuckDB database, which is useful
+    for running feature computation locally (e.g. in tests and benchmarks) without a data
+    warehouse.
+    """
+
+    database_path: str
+    featurebyte_schema: str = "main"
+    source_type: SourceType = Field(SourceType.DUCKDB, const=True)
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+
+        if not HAS_DUCKDB:
+            raise RuntimeError("duckdb is not available")
+
+        connection = duckdb.connect(self.database_path)
+        connection.execute("SET TimeZone='UTC'")
+        connection.execute(f'CREATE SCHEMA IF NOT EXISTS "{self.featurebyte_schema}"')
+        # macros are created in the default schema which is always in the search path
+        for macro in MACROS:
+            connection.execute(macro)
+        for function_name, func, parameters, return_type in _get_python_functions():
+            connection.create_function(
+                function_name, func, parameters, return_type, null_handling="special"
+            )
+        self._connection = DuckDBConnection(connection, self.featurebyte_schema)
+
+    def initializer(self) -> Optional[BaseSchemaInitializer]:
+        return None
+
+    @property
+    def database_name(self) -> str:
+        result = self.execute_query_blocking("SELECT CURRENT_DATABASE() AS DATABASE_NAME")
+        assert result is not None
+        return str(result["DATABASE_NAME"].iloc[0])
+
+    @property
+    def schema_name(self) -> str:
+        return self.featurebyte_schema
+
+    @classmethod
+    def is_threadsafe(cls) -> bool:
+        # each query is executed using a separate cursor
+        return True
+
+    async def list_databases(self) -> list[str]:
+        result = await self.execute_query(
+            "SELECT database_name FROM duckdb_databases() WHERE NOT internal"
+        )
+        if result is None:
+            return []
+        return result["database_name"].tolist()
+
+    async def list_schemas(self, database_name: str | None = None) -> list[str]:
+        catalog_name = f"'{database_name}'" if database_name else "CURRENT_DATABASE()"
+        query = (
+            "SELECT DISTINCT schema_name FROM information_schema.schemata "
+            f"WHERE catalog_name = {catalog_name} ORDER BY schema_name"
+        )
+        result = await self.execute_query(query)
+        if result is None:
+            return []
+        return result["schema_name"].tolist()
+
+    async def _list_tables(
+        self, database_name: str | None = None, schema_name: str | None = None
+    ) -> list[str]:
+        catalog_name = f"'{database_name}'" if database_name else "CURRENT_DATABASE()"
+        query = (
+            f"SELECT table_name FROM information_schema.tables WHERE table_catalog = {catalog_name}"
+        )
+        if schema_name:
+            query += f" AND table_schema = '{schema_name}'"
+        result = await self.execute_query(query)
+        if result is None:
+            return []
+        return result["table_name"].tolist()
+
+    @staticmethod
+    def _convert_to_internal_variable_type(duckdb_type: str) -> DBVarType:
+        duckdb_type = duckdb_type.upper()
+        if duckdb_type.endswith("INT") or duckdb_type in {"BIGINT", "HUGEINT", "UBIGINT"}:
+            # TINYINT, SMALLINT, INTEGER, BIGINT, HUGEINT and unsigned variants
+            return DBVarType.INT
+        if duckdb_type.startswith("DECIMAL"):
+            return DBVarType.FLOAT
+        if duckdb_type.endswith("[]"):
+            return DBVarType.ARRAY
+        if duckdb_type.startswith("MAP"):
+            return DBVarType.MAP
+        if duckdb_type.startswith("STRUCT"):
+            return DBVarType.STRUCT
+        mapping = {
+            "INTEGER": DBVarType.INT,
+            "UINTEGER": DBVarType.INT,
+            "BOOLEAN": DBVarType.BOOL,
+            "DOUBLE": DBVarType.FLOAT,
+            "FLOAT": DBVarType.FLOAT,
+            "REAL": DBVarType.FLOAT,
+            "VARCHAR": DBVarType.VARCHAR,
+            "JSON": DBVarType.OBJECT,
+            "DATE": DBVarType.DATE,
+            "TIME": DBVarType.TIME,
+            "TIMESTAMP": DBVarType.TIMESTAMP,
+            "TIMESTAMP_NS": DBVarType.TIMESTAMP,
+            "TIMESTAMP_MS": DBVarType.TIMESTAMP,
+            "TIMESTAMP_S": DBVarType.TIMESTAMP,
+            "TIMESTAMP WITH TIME ZONE": DBVarType.TIMESTAMP_TZ,
+            "INTERVAL": DBVarType.TIMEDELTA,
+            "BLOB": DBVarType.BINARY,
+        }
+        if duckdb_type not in mapping:
+            logger.warning(f"DuckDB: Not supported data type '{duckdb_type}'")
+        return mapping.get(duckdb_type, DBVarType.UNKNOWN)
+
+    async def _list_table_schema(
+        self,
+        table_name: str | None,
+        database_name: str | None = None,
+        schema_name: str | None = None,
+    ) -> OrderedDict[str, DBVarType]:
+        catalog_name = f"'{database_name}'" if database_name else "CURRENT_DATABASE()"
+        conditions = [f"table_name = '{table_name}'", f"table_catalog = {catalog_name}"]
+        if schema_name:
+            conditions.append(f"table_schema = '{schema_name}'")
+        result = await self.execute_query(
+            "SELECT column_name, data_type FROM information_schema.columns WHERE "
+            + " AND ".join(conditions)
+            + " ORDER BY ordinal_position"
+        )
+        column_name_type_map = collections.OrderedDict()
+        if result is not None:
+            for _, (column_name, data_type) in result[["column_name", "data_type"]].iterrows():
+                column_name_type_map[column_name] = self._convert_to_internal_variable_type(
+                    data_type
+                )
+        return column_name_type_map
+
+    def fetch_query_result_impl(self, cursor: Any) -> pd.DataFrame | None:
+        if cursor.description:
+            return cursor.fetch_arrow_table().to_pandas()
+        return None
+
+    async def fetch_query_stream_impl(self, cursor: Any) -> AsyncGenerator[pa.RecordBatch, None]:
+        if cursor.description:
+            reader = cursor.fetch_record_batch(FETCH_BATCH_NUM_ROWS)
+            has_batches = False
+            for record_batch in reader:
+                has_batches = True
+                yield record_batch
+            if not has_batches:
+                # yield an empty batch so that the result schema is preserved
+                yield pa.RecordBatch.from_pylist([], schema=reader.schema)
+
+    def _register_table(self, table_name: str, dataframe: pd.DataFrame, replace: bool) -> None:
+        cursor = self.connection.cursor()
+        view_name = f"__FB_DATAFRAME_{self.generate_session_unique_id()}"
+        try:
+            cursor.register(view_name, dataframe)
+            create_command = "CREATE OR REPLACE TABLE" if replace else "CREATE TABLE"
+            cursor.execute(f'{create_command} "{table_name}" AS SELECT * FROM "{view_name}"')
+        finally:
+            cursor.unregister(view_name)
+            cursor.close()
+
+    async def register_table(
+        self, table_name: str, dataframe: pd.DataFrame, temporary: bool = True
+    ) -> None:
+        # DuckDB temporary tables are only visible to the cursor that created them, so temporary
+        # tables are registered as regular tables in the working schema that are replaced when
+        # registered again
+        await to_thread(
+            self._register_table,
+            LONG_RUNNING_EXECUTE_QUERY_TIMEOUT_SECONDS,
+            table_name,
+            dataframe,
+            temporary,
+            executor=self.executor,
+        )
+        if self._metadata_cache is not None:
+            self._metadata_cache.invalidate_table(table_name, schema_name=self.schema_name)
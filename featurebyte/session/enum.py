@@ -1,7 +1,7 @@
 """
 This module contains all the enums used for session specific tasks.
 """
-from featurebyte.enum import StrEnum
+from featurebyte.enum import OrderedStrEnum, StrEnum
 
 
 class SnowflakeDataType(StrEnum):
@@ -19,3 +19,15 @@ class SnowflakeDataType(StrEnum):
     TIMESTAMP_LTZ = "TIMESTAMP_LTZ"
     TIMESTAMP_NTZ = "TIMESTAMP_NTZ"
     TIMESTAMP_TZ = "TIMESTAMP_TZ"
+
+
+class QueryPriority(OrderedStrEnum):
+    """
+    Priority class of a warehouse query. Queries with higher priority are admitted first when the
+    concurrency limit of a feature store is reached.
+    """
+
+    BATCH_HISTORICAL = "BATCH_HISTORICAL"
+    INTERACTIVE_PREVIEW = "INTERACTIVE_PREVIEW"
+    SCHEDULED_TILE = "SCHEDULED_TILE"
+    ONLINE_SERVING = "ONLINE_SERVING"
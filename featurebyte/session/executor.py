@@ -0,0 +1,177 @@
+"""
+Bounded thread pool executors used to run blocking data warehouse driver calls
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from pydantic import BaseModel
+
+from featurebyte.enum import SourceType
+
+# Maximum number of threads used to run blocking driver calls of each session type. Can be
+# overridden for a specific session type using FEATUREBYTE_<SOURCE_TYPE>_EXECUTOR_MAX_WORKERS.
+SESSION_EXECUTOR_MAX_WORKERS = int(os.environ.get("FEATUREBYTE_SESSION_EXECUTOR_MAX_WORKERS", 64))
+
+# Maximum number of threads of the default executor of event loops created by the worker
+DEFAULT_EXECUTOR_MAX_WORKERS = int(os.environ.get("FEATUREBYTE_DEFAULT_EXECUTOR_MAX_WORKERS", 64))
+
+
+class ExecutorMetrics(BaseModel):
+    """
+    Metrics of an InstrumentedThreadPoolExecutor
+    """
+
+    name: str
+    max_workers: int
+    num_queued: int
+    num_running: int
+    num_completed: int
+    total_wait_time: float
+    max_wait_time: float
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor that keeps track of queue depth and the time submitted calls wait for a
+    thread
+
+    Parameters
+    ----------
+    max_workers: int
+        Maximum number of threads
+    name: str
+        Name of the executor, used as thread name prefix
+    """
+
+    def __init__(self, max_workers: int, name: str):
+        super().__init__(max_workers=max_workers, thread_name_prefix=name)
+        self.name = name
+        self._metrics_lock = threading.Lock()
+        self._num_queued = 0
+        self._num_running = 0
+        self._num_completed = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def metrics(self) -> ExecutorMetrics:
+        """
+        Current metrics of the executor
+
+        Returns
+        -------
+        ExecutorMetrics
+        """
+        with self._metrics_lock:
+            return ExecutorMetrics(
+                name=self.name,
+                max_workers=self._max_workers,
+                num_queued=self._num_queued,
+                num_running=self._num_running,
+                num_completed=self._num_completed,
+                total_wait_time=self._total_wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    def submit(  # type: ignore[override]  # pylint: disable=arguments-differ
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        submitted_at = time.time()
+
+        def _run() -> Any:
+            wait_time = time.time() - submitted_at
+            with self._metrics_lock:
+                self._num_queued -= 1
+                self._num_running += 1
+                self._total_wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._metrics_lock:
+                    self._num_running -= 1
+                    self._num_completed += 1
+
+        def _on_done(future: Future[Any]) -> None:
+            # call cancelled before it started running
+            if future.cancelled():
+                with self._metrics_lock:
+                    self._num_queued -= 1
+
+        with self._metrics_lock:
+            self._num_queued += 1
+        future = super().submit(_run)
+        future.add_done_callback(_on_done)
+        return future
+
+
+_executors: Dict[str, InstrumentedThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_or_create_executor(name: str, max_workers: int) -> InstrumentedThreadPoolExecutor:
+    with _executors_lock:
+        if name not in _executors:
+            _executors[name] = InstrumentedThreadPoolExecutor(max_workers=max_workers, name=name)
+        return _executors[name]
+
+
+def get_session_executor(source_type: SourceType) -> InstrumentedThreadPoolExecutor:
+    """
+    Get the executor used to run blocking driver calls of sessions of the given type. The executor
+    is shared by all sessions of the same type in the current process.
+
+    Parameters
+    ----------
+    source_type: SourceType
+        Session source type
+
+    Returns
+    -------
+    InstrumentedThreadPoolExecutor
+    """
+    max_workers = int(
+        os.environ.get(
+            f"FEATUREBYTE_{source_type.upper()}_EXECUTOR_MAX_WORKERS",
+            SESSION_EXECUTOR_MAX_WORKERS,
+        )
+    )
+    return _get_or_create_executor(name=f"session_{source_type}", max_workers=max_workers)
+
+
+def get_default_executor(max_workers: Optional[int] = None) -> InstrumentedThreadPoolExecutor:
+    """
+    Get the executor shared by event loops as their default executor
+
+    Parameters
+    ----------
+    max_workers: Optional[int]
+        Maximum number of threads used if the executor does not exist
+
+    Returns
+    -------
+    InstrumentedThreadPoolExecutor
+    """
+    return _get_or_create_executor(
+        name="default", max_workers=max_workers or DEFAULT_EXECUTOR_MAX_WORKERS
+    )
+
+
+def get_executor_metrics() -> Dict[str, ExecutorMetrics]:
+    """
+    Get metrics of all executors in the current process
+
+    Returns
+    -------
+    Dict[str, ExecutorMetrics]
+        Mapping from executor name to executor metrics
+    """
+    with _executors_lock:
+        executors = dict(_executors)
+    return {name: executor.metrics for name, executor in executors.items()}
@@ -19,6 +19,9 @@ from featurebyte.models.feature_store import FeatureStoreModel
 from featurebyte.query_graph.node.schema import DatabaseDetails
 from featurebyte.session.base import BaseSession
 from featurebyte.session.databricks import DatabricksSession
+from featurebyte.session.duckdb import DuckDBSession
+from featurebyte.session.metadata_cache import get_metadata_cache
+from featurebyte.session.query_scheduler import get_query_scheduler
 from featurebyte.session.snowflake import SnowflakeSession
 from featurebyte.session.spark import SparkSession
 from featurebyte.session.sqlite import SQLiteSession
@@ -28,6 +31,7 @@ SOURCE_TYPE_SESSION_MAP = {
     SourceType.SNOWFLAKE: SnowflakeSession,
     SourceType.DATABRICKS: DatabricksSession,
     SourceType.SPARK: SparkSession,
+    SourceType.DUCKDB: DuckDBSession,
 }
 
 session_cache: TTLCache[Any, Any] = TTLCache(maxsize=1024, ttl=600)
@@ -60,6 +64,8 @@ async def get_new_session(item: str, credential_params: str) -> BaseSession:
         **item_dict["details"], **credential_params_dict
     )
     await session.initialize()
+    session.set_query_scheduler(get_query_scheduler(item))
+    session.set_metadata_cache(get_metadata_cache(item))
     logger.debug(f"Session creation time: {time.time() - tic:.3f}s")
     return session
 
@@ -0,0 +1,273 @@
+"""
+Cache of table metadata (table names and table schemas) retrieved from feature stores
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import copy
+import os
+import re
+import threading
+
+from cachetools import TTLCache
+
+from featurebyte.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Time to live of cached table metadata in seconds. A value that is not positive disables caching.
+METADATA_CACHE_TTL_SECONDS = int(os.environ.get("FEATUREBYTE_METADATA_CACHE_TTL_SECONDS", 300))
+
+# Maximum number of cached entries per feature store
+METADATA_CACHE_MAX_SIZE = int(os.environ.get("FEATUREBYTE_METADATA_CACHE_MAX_SIZE", 4096))
+
+_IDENTIFIER = r'(?:"[^"]*"|`[^`]*`|[^\s.(;]+)'
+DDL_PATTERN = re.compile(
+    r"^\s*(?:"
+    r"CREATE(?:\s+OR\s+REPLACE)?(?:\s+(?:TEMPORARY|TEMP|TRANSIENT|GLOBAL|LOCAL|VOLATILE))*"
+    r"\s+(?:TABLE|VIEW)(?:\s+IF\s+NOT\s+EXISTS)?"
+    r"|DROP\s+(?:TABLE|VIEW)(?:\s+IF\s+EXISTS)?"
+    r"|ALTER\s+(?:TABLE|VIEW)(?:\s+IF\s+EXISTS)?"
+    r"|REPLACE\s+TABLE"
+    r")\s+"
+    rf"(?P<name>{_IDENTIFIER}(?:\s*\.\s*{_IDENTIFIER}){{0,2}})",
+    re.IGNORECASE,
+)
+
+TABLES = "tables"
+TABLE_SCHEMA = "table_schema"
+
+
+def _normalize(name: Optional[str]) -> Optional[str]:
+    if name is None:
+        return None
+    return name.strip().strip('"`').upper()
+
+
+def parse_ddl_table_name(query: str) -> Optional[Tuple[Optional[str], Optional[str], str]]:
+    """
+    Get the name of the table created, altered or dropped by a DDL query
+
+    Parameters
+    ----------
+    query: str
+        SQL query
+
+    Returns
+    -------
+    Optional[Tuple[Optional[str], Optional[str], str]]
+        Tuple of database name, schema name and table name, or None if the query is not a DDL
+        query on a table. Database and schema names are None if the table name is not qualified.
+    """
+    match = DDL_PATTERN.match(query)
+    if match is None:
+        return None
+    parts: List[Optional[str]] = [
+        part.strip() for part in re.findall(_IDENTIFIER, match.group("name"))
+    ]
+    parts = [None] * (3 - len(parts)) + parts
+    database_name, schema_name, table_name = parts
+    assert table_name is not None
+    return database_name, schema_name, table_name
+
+
+class MetadataCache:
+    """
+    Cache of table metadata of a feature store with time to live
+
+    Cached entries expire after ttl seconds and are invalidated when a DDL query issued by
+    featurebyte creates, alters or drops the table. The cache can be shared by sessions running
+    on different threads (for example worker tasks).
+
+    Parameters
+    ----------
+    ttl: int
+        Time to live of cached entries in seconds. A value that is not positive disables caching.
+    maxsize: int
+        Maximum number of cached entries
+    """
+
+    def __init__(
+        self, ttl: int = METADATA_CACHE_TTL_SECONDS, maxsize: int = METADATA_CACHE_MAX_SIZE
+    ):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cache: Optional[TTLCache[Hashable, Any]] = (
+            TTLCache(maxsize=maxsize, ttl=ttl) if ttl > 0 else None
+        )
+
+    @staticmethod
+    def tables_key(database_name: Optional[str], schema_name: Optional[str]) -> Hashable:
+        """
+        Get the cache key of the table names in a schema
+
+        Parameters
+        ----------
+        database_name: Optional[str]
+            Database name
+        schema_name: Optional[str]
+            Schema name
+
+        Returns
+        -------
+        Hashable
+        """
+        return TABLES, database_name, schema_name
+
+    @staticmethod
+    def table_schema_key(
+        database_name: Optional[str], schema_name: Optional[str], table_name: Optional[str]
+    ) -> Hashable:
+        """
+        Get the cache key of the schema of a table
+
+        Parameters
+        ----------
+        database_name: Optional[str]
+            Database name
+        schema_name: Optional[str]
+            Schema name
+        table_name: Optional[str]
+            Table name
+
+        Returns
+        -------
+        Hashable
+        """
+        return TABLE_SCHEMA, database_name, schema_name, table_name
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get a cached value
+
+        Parameters
+        ----------
+        key: Hashable
+            Cache key
+
+        Returns
+        -------
+        Any
+            Copy of the cached value, or None if not cached
+        """
+        if self._cache is None:
+            return None
+        with self._lock:
+            value = self._cache.get(key)
+        return copy.copy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value
+
+        Parameters
+        ----------
+        key: Hashable
+            Cache key
+        value: Any
+            Value to cache
+        """
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache[key] = copy.copy(value)
+
+    def invalidate_table(
+        self,
+        table_name: str,
+        schema_name: Optional[str] = None,
+        database_name: Optional[str] = None,
+    ) -> None:
+        """
+        Invalidate the cached schema of a table and the cached table names of its schema. Names are
+        compared case-insensitively and a name that is not provided matches any name.
+
+        Parameters
+        ----------
+        table_name: str
+            Table name
+        schema_name: Optional[str]
+            Schema name
+        database_name: Optional[str]
+            Database name
+        """
+        if self._cache is None:
+            return
+
+        def _matches(cached_name: Optional[str], name: Optional[str]) -> bool:
+            return (
+                name is None or cached_name is None or _normalize(cached_name) == _normalize(name)
+            )
+
+        with self._lock:
+            for key in list(self._cache.keys()):
+                kind, cached_database_name, cached_schema_name, *rest = key  # type: ignore
+                if not _matches(cached_database_name, database_name) or not _matches(
+                    cached_schema_name, schema_name
+                ):
+                    continue
+                if kind == TABLE_SCHEMA and not _matches(rest[0], table_name):
+                    continue
+                self._cache.pop(key, None)
+
+    def invalidate_by_query(self, query: str) -> None:
+        """
+        Invalidate the cached metadata affected by a query if it is a DDL query
+
+        Parameters
+        ----------
+        query: str
+            SQL query executed on the feature store
+        """
+        if self._cache is None:
+            return
+        parsed = parse_ddl_table_name(query)
+        if parsed is None:
+            return
+        database_name, schema_name, table_name = parsed
+        logger.debug(
+            "Invalidating cached table metadata",
+            extra={
+                "database_name": database_name,
+                "schema_name": schema_name,
+                "table_name": table_name,
+            },
+        )
+        self.invalidate_table(
+            table_name=table_name, schema_name=schema_name, database_name=database_name
+        )
+
+    def clear(self) -> None:
+        """
+        Clear all cached entries
+        """
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache.clear()
+
+
+_metadata_caches: Dict[str, MetadataCache] = {}
+_metadata_caches_lock = threading.Lock()
+
+
+def get_metadata_cache(key: str, **kwargs: Any) -> MetadataCache:
+    """
+    Get the MetadataCache of a feature store, creating one if it does not exist
+
+    Parameters
+    ----------
+    key: str
+        Key that identifies the feature store (e.g. JSON dumps of feature store type & details)
+    **kwargs: Any
+        Parameters used to create the MetadataCache if it does not exist
+
+    Returns
+    -------
+    MetadataCache
+    """
+    with _metadata_caches_lock:
+        if key not in _metadata_caches:
+            _metadata_caches[key] = MetadataCache(**kwargs)
+        return _metadata_caches[key]
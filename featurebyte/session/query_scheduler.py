@@ -0,0 +1,274 @@
+"""
+Query scheduler that limits the number of concurrent queries executed on a feature store
+"""
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from featurebyte.logging import get_logger
+from featurebyte.session.enum import QueryPriority
+
+logger = get_logger(__name__)
+
+# Maximum number of queries executed concurrently on a feature store by a single process. A value
+# that is not positive disables the limit.
+MAX_CONCURRENT_QUERIES_PER_FEATURE_STORE = int(
+    os.environ.get("FEATUREBYTE_MAX_CONCURRENT_QUERIES_PER_FEATURE_STORE", 32)
+)
+
+_query_priority: contextvars.ContextVar[QueryPriority] = contextvars.ContextVar(
+    "query_priority", default=QueryPriority.INTERACTIVE_PREVIEW
+)
+
+
+@contextmanager
+def query_priority(priority: QueryPriority) -> Iterator[None]:
+    """
+    Context manager to set the priority of the queries executed within the context
+
+    Parameters
+    ----------
+    priority: QueryPriority
+        Query priority
+
+    Yields
+    ------
+    None
+        Context with the query priority set
+    """
+    token = _query_priority.set(priority)
+    try:
+        yield
+    finally:
+        _query_priority.reset(token)
+
+
+def get_current_query_priority() -> QueryPriority:
+    """
+    Get the priority of queries executed in the current context
+
+    Returns
+    -------
+    QueryPriority
+    """
+    return _query_priority.get()
+
+
+class QuerySchedulerMetrics(BaseModel):
+    """
+    Metrics of a QueryScheduler
+    """
+
+    max_concurrency: int
+    num_running: int
+    num_queued: int
+    num_admitted: int
+    num_waited: int
+    num_cancelled: int
+    total_wait_time: float
+    max_wait_time: float
+
+
+@dataclass
+class _Waiter:
+    """
+    A query waiting to be admitted by the QueryScheduler
+    """
+
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[None]
+    priority: QueryPriority
+    granted: bool = False
+    cancelled: bool = False
+
+
+def _notify_waiter(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class QueryScheduler:
+    """
+    Admission control for queries executed on a feature store
+
+    At most max_concurrency queries are executed concurrently. Queries beyond the limit are queued
+    and admitted in the order of their priority (and in the order of arrival for queries with the
+    same priority). The scheduler can be shared by sessions running on different event loops (for
+    example worker tasks running on different threads).
+
+    Parameters
+    ----------
+    max_concurrency: int
+        Maximum number of concurrent queries. A value that is not positive disables the limit.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENT_QUERIES_PER_FEATURE_STORE):
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._counter = itertools.count()
+        self._num_running = 0
+        self._num_queued = 0
+        self._num_admitted = 0
+        self._num_waited = 0
+        self._num_cancelled = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def metrics(self) -> QuerySchedulerMetrics:
+        """
+        Current metrics of the scheduler
+
+        Returns
+        -------
+        QuerySchedulerMetrics
+        """
+        with self._lock:
+            return QuerySchedulerMetrics(
+                max_concurrency=self.max_concurrency,
+                num_running=self._num_running,
+                num_queued=self._num_queued,
+                num_admitted=self._num_admitted,
+                num_waited=self._num_waited,
+                num_cancelled=self._num_cancelled,
+                total_wait_time=self._total_wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    @staticmethod
+    def _get_sort_key(priority: QueryPriority) -> int:
+        # QueryPriority members are ordered from the lowest to the highest priority
+        return -list(QueryPriority).index(priority)
+
+    @asynccontextmanager
+    async def acquire(self, priority: Optional[QueryPriority] = None) -> AsyncIterator[None]:
+        """
+        Wait until the query is admitted and release the slot when the context exits
+
+        Parameters
+        ----------
+        priority: Optional[QueryPriority]
+            Query priority. Use the priority of the current context if not provided.
+
+        Yields
+        ------
+        None
+            Context in which the query can be executed
+        """
+        await self._acquire(priority or get_current_query_priority())
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: QueryPriority) -> None:
+        with self._lock:
+            if self.max_concurrency <= 0 or (
+                self._num_running < self.max_concurrency and not self._num_queued
+            ):
+                self._num_running += 1
+                self._num_admitted += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = _Waiter(loop=loop, future=loop.create_future(), priority=priority)
+            heapq.heappush(self._queue, (self._get_sort_key(priority), next(self._counter), waiter))
+            self._num_queued += 1
+
+        tic = time.time()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # The query is cancelled (e.g. task revoked) while waiting. If a slot has already been
+            # handed over to this waiter, pass it on to the next one.
+            with self._lock:
+                is_granted = waiter.granted
+                if not is_granted:
+                    waiter.cancelled = True
+                    self._num_queued -= 1
+                    self._num_cancelled += 1
+            if is_granted:
+                self._release()
+            raise
+
+        wait_time = time.time() - tic
+        with self._lock:
+            self._num_waited += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+        logger.debug(
+            "Query admitted after waiting",
+            extra={"priority": priority, "wait_time": wait_time},
+        )
+
+    def _release(self) -> None:
+        with self._lock:
+            while self._queue:
+                _, _, waiter = heapq.heappop(self._queue)
+                if waiter.cancelled:
+                    continue
+                try:
+                    waiter.loop.call_soon_threadsafe(_notify_waiter, waiter.future)
+                except RuntimeError:
+                    # event loop of the waiter is closed
+                    waiter.cancelled = True
+                    self._num_queued -= 1
+                    self._num_cancelled += 1
+                    continue
+                # hand over the slot to the waiter, the number of running queries is unchanged
+                waiter.granted = True
+                self._num_queued -= 1
+                self._num_admitted += 1
+                return
+            self._num_running -= 1
+
+
+_query_schedulers: Dict[str, QueryScheduler] = {}
+_query_schedulers_lock = threading.Lock()
+
+
+def get_query_scheduler(key: str, **kwargs: Any) -> QueryScheduler:
+    """
+    Get the QueryScheduler of a feature store, creating one if it does not exist
+
+    Parameters
+    ----------
+    key: str
+        Key that identifies the feature store (e.g. JSON dumps of feature store type & details)
+    **kwargs: Any
+        Parameters used to create the QueryScheduler if it does not exist
+
+    Returns
+    -------
+    QueryScheduler
+    """
+    with _query_schedulers_lock:
+        if key not in _query_schedulers:
+            _query_schedulers[key] = QueryScheduler(**kwargs)
+        return _query_schedulers[key]
+
+
+def get_query_scheduler_metrics() -> Dict[str, QuerySchedulerMetrics]:
+    """
+    Get metrics of all query schedulers in the current process
+
+    Returns
+    -------
+    Dict[str, QuerySchedulerMetrics]
+        Mapping from feature store key to scheduler metrics
+    """
+    with _query_schedulers_lock:
+        schedulers = dict(_query_schedulers)
+    return {key: scheduler.metrics for key, scheduler in schedulers.items()}
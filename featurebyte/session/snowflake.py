@@ -35,6 +35,11 @@ logger = get_logger(__name__)
 
 logging.getLogger("snowflake.connector").setLevel(logging.ERROR)
 
+# Options used when write_pandas() dumps DataFrames into parquet files. Timestamps are written with
+# microsecond precision so that they are loaded as timestamps (nanosecond timestamps are not
+# supported by Snowflake's parquet loader without logical types).
+WRITE_PANDAS_PARQUET_OPTIONS = {"coerce_timestamps": "us", "allow_truncated_timestamps": True}
+
 
 class SnowflakeSession(BaseSession):
     """
@@ -128,7 +133,7 @@ class SnowflakeSession(BaseSession):
             output.extend(schemas["name"])
         return output
 
-    async def list_tables(
+    async def _list_tables(
         self, database_name: str | None = None, schema_name: str | None = None
     ) -> list[str]:
         tables = await self.execute_query(
@@ -142,6 +147,18 @@ class SnowflakeSession(BaseSession):
             output.extend(views["name"])
         return output
 
+    def cancel_query(self, cursor: Any, query: str) -> bool:
+        query_id = cursor.sfqid
+        if query_id is None:
+            # query has not been submitted to Snowflake yet
+            return False
+        cancel_cursor = self.connection.cursor()
+        try:
+            cancel_cursor.execute(f"SELECT SYSTEM$CANCEL_QUERY('{query_id}')")
+        finally:
+            cancel_cursor.close()
+        return True
+
     def fetch_query_result_impl(self, cursor: Any) -> pd.DataFrame | None:
         """
         Fetch the result of executed SQL query from connection cursor
@@ -202,7 +219,7 @@ class SnowflakeSession(BaseSession):
             """
         )
         dataframe = self._prep_dataframe_before_write_pandas(dataframe, schema)
-        write_pandas(self._connection, dataframe, table_name)
+        write_pandas(self._connection, dataframe, table_name, **WRITE_PANDAS_PARQUET_OPTIONS)
 
     @staticmethod
     def _convert_to_internal_variable_type(snowflake_var_info: dict[str, Any]) -> DBVarType:
@@ -232,7 +249,7 @@ class SnowflakeSession(BaseSession):
         logger.warning(f"Snowflake: Not supported data type '{snowflake_var_info}'")
         return DBVarType.UNKNOWN
 
-    async def list_table_schema(
+    async def _list_table_schema(
         self,
         table_name: str | None,
         database_name: str | None = None,
@@ -264,13 +281,8 @@ class SnowflakeSession(BaseSession):
         """
         schema = []
         for colname, dtype in dataframe.dtypes.to_dict().items():
-            if dataframe.shape[0] > 0 and isinstance(dataframe[colname].iloc[0], datetime.datetime):
-                if dataframe[colname].iloc[0].tzinfo:
-                    db_type = "TIMESTAMP_TZ"
-                else:
-                    db_type = "TIMESTAMP_NTZ"
-            elif pd.api.types.is_datetime64_any_dtype(dataframe[colname]):
-                if pd.api.types.is_datetime64tz_dtype(dataframe[colname]):
+            if pd.api.types.is_datetime64_any_dtype(dtype):
+                if pd.api.types.is_datetime64tz_dtype(dtype):
                     db_type = "TIMESTAMP_TZ"
                 else:
                     db_type = "TIMESTAMP_NTZ"
@@ -278,6 +290,16 @@ class SnowflakeSession(BaseSession):
                 db_type = "DOUBLE"
             elif pd.api.types.is_integer_dtype(dtype):
                 db_type = "INT"
+            elif (
+                pd.api.types.is_object_dtype(dtype)
+                and dataframe.shape[0] > 0
+                and isinstance(dataframe[colname].iloc[0], datetime.datetime)
+            ):
+                # only object columns need to be inspected for datetime objects
+                if dataframe[colname].iloc[0].tzinfo:
+                    db_type = "TIMESTAMP_TZ"
+                else:
+                    db_type = "TIMESTAMP_NTZ"
             else:
                 db_type = "VARCHAR"
             schema.append((colname, db_type))
@@ -287,18 +309,24 @@ class SnowflakeSession(BaseSession):
     def _prep_dataframe_before_write_pandas(
         dataframe: pd.DataFrame, schema: list[tuple[str, str]]
     ) -> pd.DataFrame:
-        # Ideally we should avoid making a copy, but so far the only way to get write_pandas() to
-        # create DATETIME type columns in Snowflake for datetime columns in DataFrame is to specify
-        # DATETIME type in the schema when creating table, and convert the dtype in DataFrame to
-        # object before calling write_pandas(). A copy is made to prevent unintended side effects.
-        dataframe = dataframe.copy()
+        # Timestamp columns are written to parquet as native timestamps and loaded into the
+        # TIMESTAMP_NTZ / TIMESTAMP_TZ columns of the table created using the schema. Only object
+        # columns of datetime objects have to be converted. Timezone aware values are converted to
+        # UTC since a parquet column can only have a single timezone. A shallow copy is made to
+        # prevent unintended side effects when any column has to be converted.
+        converted_columns = {}
         for colname, coltype in schema:
-            if coltype in {"TIMESTAMP_NTZ", "TIMESTAMP_TZ"}:
-                dataframe[colname] = (
-                    dataframe[colname]
-                    .astype(str)
-                    .str.replace(r"(\+\d+):(\d+)", r" \1\2", regex=True)
+            if coltype in {"TIMESTAMP_NTZ", "TIMESTAMP_TZ"} and pd.api.types.is_object_dtype(
+                dataframe[colname].dtype
+            ):
+                converted_columns[colname] = pd.to_datetime(
+                    dataframe[colname], utc=coltype == "TIMESTAMP_TZ"
                 )
+        if not converted_columns:
+            return dataframe
+        dataframe = dataframe.copy(deep=False)
+        for colname, converted_column in converted_columns.items():
+            dataframe[colname] = converted_column
         return dataframe
 
 
@@ -178,7 +178,7 @@ class SparkSession(BaseSparkSession):
             # in DataBricks the header is databaseName instead of namespace
         return output
 
-    async def list_tables(
+    async def _list_tables(
         self, database_name: str | None = None, schema_name: str | None = None
     ) -> list[str]:
         tables = await self.execute_query(f"SHOW TABLES IN `{database_name}`.`{schema_name}`")
@@ -187,7 +187,7 @@ class SparkSession(BaseSparkSession):
             output.extend(tables["tableName"])
         return output
 
-    async def list_table_schema(
+    async def _list_table_schema(
         self,
         table_name: str | None,
         database_name: str | None = None,
@@ -53,7 +53,7 @@ class SQLiteSession(BaseSession):
     async def list_schemas(self, database_name: str | None = None) -> list[str]:
         return []
 
-    async def list_tables(
+    async def _list_tables(
         self, database_name: str | None = None, schema_name: str | None = None
     ) -> list[str]:
         tables = await self.execute_query("SELECT name FROM sqlite_master WHERE type = 'table'")
@@ -83,7 +83,7 @@ class SQLiteSession(BaseSession):
             return DBVarType.DATE
         raise ValueError(f"Not supported data type '{sqlite_data_type}'")
 
-    async def list_table_schema(
+    async def _list_table_schema(
         self,
         table_name: str | None,
         database_name: str | None = None,
@@ -8,6 +8,10 @@ import dateutil.parser
 from featurebyte.common import date_util
 from featurebyte.logging import get_logger
 from featurebyte.models.tile import TileType
+from featurebyte.query_graph.sql.tiling import (
+    CUMULATIVE_TILE_COUNT_COLUMN,
+    get_cumulative_tile_table_name,
+)
 from featurebyte.service.tile_registry_service import TileRegistryService
 from featurebyte.sql.common import construct_create_table_query, retry_sql
 from featurebyte.sql.tile_common import TileCommon
@@ -102,6 +106,9 @@ class TileGenerate(TileCommon):
             """
             await retry_sql(session=self._session, sql=merge_sql)
 
+        if self.cumulative_value_column_names:
+            await self._update_cumulative_tile_table(tile_table_exist_flag)
+
         if self.last_tile_start_str:
             ind_value = date_util.timestamp_utc_to_tile_index(
                 dateutil.parser.isoparse(self.last_tile_start_str),
@@ -139,3 +146,141 @@ class TileGenerate(TileCommon):
             from ({self.sql})
         """
         return tile_sql
+
+    async def _update_cumulative_tile_table(self, tile_table_exist_flag: bool) -> None:
+        """
+        Update the cumulative tile table of the aggregation after the tile table is updated
+
+        Each row of the cumulative tile table has the sum of the tile values of the entity from the
+        first tile up to and including the tile at INDEX. Rows at and after the first tile index
+        produced by this run are recomputed, continuing from the last cumulative values before it.
+
+        Parameters
+        ----------
+        tile_table_exist_flag: bool
+            Whether the tile table existed before this run
+        """
+        cumulative_table_name = get_cumulative_tile_table_name(self.tile_id, self.aggregation_id)
+        cumulative_table_exist_flag = tile_table_exist_flag and await self.table_exists(
+            cumulative_table_name
+        )
+        if not cumulative_table_exist_flag:
+            logger.debug(
+                "creating cumulative tile table", extra={"table_name": cumulative_table_name}
+            )
+            create_sql = construct_create_table_query(
+                cumulative_table_name,
+                self._construct_cumulative_tile_sql(),
+                session=self._session,
+            )
+            await retry_sql(self._session, create_sql)
+            return
+
+        result = await self._session.execute_query(
+            f"select min(index) as MIN_INDEX from ({self.sql})"
+        )
+        if result is None or result.empty or result["MIN_INDEX"].isnull().iloc[0]:
+            return
+        min_index = int(result["MIN_INDEX"].iloc[0])
+
+        logger.debug(
+            "updating cumulative tile table",
+            extra={"table_name": cumulative_table_name, "min_index": min_index},
+        )
+        await retry_sql(
+            self._session, f"delete from {cumulative_table_name} where index >= {min_index}"
+        )
+        insert_cols_str = ", ".join(
+            ["index"]
+            + [self.quote_column(col) for col in self.entity_column_names]
+            + self.cumulative_value_column_names
+            + [CUMULATIVE_TILE_COUNT_COLUMN]
+        )
+        insert_sql = f"""
+            insert into {cumulative_table_name} ({insert_cols_str})
+                {self._construct_cumulative_tile_sql(cumulative_table_name, min_index)}
+        """
+        await retry_sql(self._session, insert_sql)
+
+    def _construct_cumulative_tile_sql(
+        self, cumulative_table_name: Optional[str] = None, min_index: Optional[int] = None
+    ) -> str:
+        """
+        Construct SQL for the cumulative tile values
+
+        Parameters
+        ----------
+        cumulative_table_name: Optional[str]
+            Existing cumulative tile table to continue from. Compute from the first tile if not
+            provided.
+        min_index: Optional[int]
+            Compute only the cumulative tile values at and after this tile index. Must be provided
+            together with cumulative_table_name.
+
+        Returns
+        -------
+        str
+        """
+        entity_cols = [self.quote_column(col) for col in self.entity_column_names]
+        a_entity_cols = [f"a.{col}" for col in entity_cols]
+        partition_by_str = (
+            f"partition by {', '.join(a_entity_cols)} " if self.entity_column_names else ""
+        )
+        window_str = (
+            f"over ({partition_by_str}order by a.index "
+            "rows between unbounded preceding and current row)"
+        )
+
+        if cumulative_table_name is None:
+            base_join_str = ""
+            tile_filter_str = ""
+            value_exprs = [
+                f"coalesce(sum(a.{col}) {window_str}, 0) as {col}"
+                for col in self.cumulative_value_column_names
+            ]
+            count_expr = f"count(*) {window_str} as {CUMULATIVE_TILE_COUNT_COLUMN}"
+        else:
+            # last cumulative values of each entity before min_index
+            row_number_partition_by_str = (
+                f"partition by {', '.join(entity_cols)} " if self.entity_column_names else ""
+            )
+            base_cols_str = ", ".join(
+                entity_cols + self.cumulative_value_column_names + [CUMULATIVE_TILE_COUNT_COLUMN]
+            )
+            base_sql = f"""
+                select {base_cols_str} from (
+                    select
+                        *,
+                        row_number() over (
+                            {row_number_partition_by_str}order by index desc
+                        ) as fb_row_number
+                    from {cumulative_table_name}
+                    where index < {min_index}
+                )
+                where fb_row_number = 1
+            """
+            if self.entity_column_names:
+                base_join_condition_str = " AND ".join(
+                    self.quote_column_null_aware_equal(f"a.{col}", f"b.{col}")
+                    for col in entity_cols
+                )
+            else:
+                base_join_condition_str = "1 = 1"
+            base_join_str = f"left join ({base_sql}) b on {base_join_condition_str}"
+            tile_filter_str = f"where a.index >= {min_index}"
+            value_exprs = [
+                f"coalesce(b.{col}, 0) + coalesce(sum(a.{col}) {window_str}, 0) as {col}"
+                for col in self.cumulative_value_column_names
+            ]
+            count_expr = (
+                f"coalesce(b.{CUMULATIVE_TILE_COUNT_COLUMN}, 0) + count(*) {window_str}"
+                f" as {CUMULATIVE_TILE_COUNT_COLUMN}"
+            )
+
+        select_cols_str = ", ".join(["a.index"] + a_entity_cols + value_exprs + [count_expr])
+        return f"""
+            select {select_cols_str}
+            from {self.tile_id} a
+            {base_join_str}
+            {tile_filter_str}
+        """
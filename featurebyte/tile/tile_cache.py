@@ -76,6 +76,7 @@ class OnDemandTileComputeRequest:
             aggregation_id=self.aggregation_id,
             category_column_name=self.tile_gen_info.value_by_column,
             feature_store_id=feature_store_id,
+            cumulative_value_column_names=self.tile_gen_info.cumulative_tile_value_columns,
         )
         return tile_spec, self.tracker_sql
 
@@ -150,30 +151,34 @@ class TileCache:
         """
         tic = time.time()
 
-        if progress_callback is not None:
-            progress_callback(0, "Checking tile status")
+        try:
+            if progress_callback is not None:
+                progress_callback(0, "Checking tile status")
 
-        required_requests = await self.get_required_computation(
-            request_id=request_id,
-            graph=graph,
-            nodes=nodes,
-            request_table_name=request_table_name,
-            serving_names_mapping=serving_names_mapping,
-        )
-        elapsed = time.time() - tic
-        logger.debug(
-            f"Getting required tiles computation took {elapsed:.2f}s ({len(required_requests)})"
-        )
-
-        if required_requests:
-            tic = time.time()
-            await self.invoke_tile_manager(required_requests, progress_callback=progress_callback)
+            required_requests = await self.get_required_computation(
+                request_id=request_id,
+                graph=graph,
+                nodes=nodes,
+                request_table_name=request_table_name,
+                serving_names_mapping=serving_names_mapping,
+            )
             elapsed = time.time() - tic
-            logger.debug(f"Compute tiles on demand took {elapsed:.2f}s")
-        else:
-            logger.debug("All required tiles can be reused")
+            logger.debug(
+                f"Getting required tiles computation took {elapsed:.2f}s ({len(required_requests)})"
+            )
 
-        await self.cleanup_temp_tables()
+            if required_requests:
+                tic = time.time()
+                await self.invoke_tile_manager(
+                    required_requests, progress_callback=progress_callback
+                )
+                elapsed = time.time() - tic
+                logger.debug(f"Compute tiles on demand took {elapsed:.2f}s")
+            else:
+                logger.debug("All required tiles can be reused")
+        finally:
+            # temp tables are also cleaned up when the computation fails or is cancelled
+            await self.cleanup_temp_tables()
 
     async def invoke_tile_manager(
         self,
@@ -415,7 +420,7 @@ class TileCache:
             columns.append(f"CAST(null AS TIMESTAMP) AS {agg_id}")
 
         table_expr = table_expr.select("REQ.*", *columns)
-        table_sql = sql_to_string(table_expr, source_type=self.source_type)
+        table_sql = sql_to_string(table_expr, source_type=self.source_type, pretty=False)
 
         tile_cache_working_table_name = (
             f"{InternalName.TILE_CACHE_WORKING_TABLE.value}_{request_id}"
@@ -566,13 +571,16 @@ class TileCache:
             tile_info.sql_template.render(
                 {
                     InternalName.ENTITY_TABLE_SQL_PLACEHOLDER: entity_table_expr.subquery(),
-                }
+                },
+                pretty=False,
             ),
         )
         request = OnDemandTileComputeRequest(
             tile_table_id=tile_info.tile_table_id,
             aggregation_id=aggregation_id,
-            tracker_sql=sql_to_string(entity_table_expr, source_type=self.source_type),
+            tracker_sql=sql_to_string(
+                entity_table_expr, source_type=self.source_type, pretty=False
+            ),
             tile_compute_sql=tile_compute_sql,
             tile_gen_info=tile_info,
         )
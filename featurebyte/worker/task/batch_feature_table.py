@@ -13,6 +13,8 @@ from featurebyte.schema.worker.task.batch_feature_table import BatchFeatureTable
 from featurebyte.service.batch_feature_table import BatchFeatureTableService
 from featurebyte.service.batch_request_table import BatchRequestTableService
 from featurebyte.service.online_serving import OnlineServingService
+from featurebyte.session.enum import QueryPriority
+from featurebyte.session.query_scheduler import query_priority
 from featurebyte.worker.task.base import BaseTask
 from featurebyte.worker.task.mixin import DataWarehouseMixin
 
@@ -64,12 +66,13 @@ class BatchFeatureTableTask(DataWarehouseMixin, BaseTask):
             db_session=db_session, table_details=location.table_details
         ):
             online_serving_service: OnlineServingService = app_container.online_serving_service
-            await online_serving_service.get_online_features_from_feature_list(
-                feature_list=feature_list,
-                request_data=batch_request_table_model,
-                get_credential=self.get_credential,
-                output_table_details=location.table_details,
-            )
+            with query_priority(QueryPriority.BATCH_HISTORICAL):
+                await online_serving_service.get_online_features_from_feature_list(
+                    feature_list=feature_list,
+                    request_data=batch_request_table_model,
+                    get_credential=self.get_credential,
+                    output_table_details=location.table_details,
+                )
             (
                 columns_info,
                 num_rows,
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from typing import Any, AsyncIterator, Callable
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from featurebyte.logging import get_logger
@@ -74,7 +75,7 @@ class DataWarehouseMixin:
         """
         try:
             yield
-        except Exception as exc:
+        except (Exception, asyncio.CancelledError) as exc:
             logger.error(
                 "Failed to create request table. Dropping table.",
                 extra={"error": str(exc), "task_payload": self.payload.dict()},
@@ -8,7 +8,9 @@ from typing import Any, cast
 from featurebyte.logging import get_logger
 from featurebyte.schema.worker.task.tile import TileTaskPayload
 from featurebyte.service.feature_store import FeatureStoreService
+from featurebyte.session.enum import QueryPriority
 from featurebyte.session.manager import SessionManager
+from featurebyte.session.query_scheduler import query_priority
 from featurebyte.worker.task.base import BaseTask
 
 logger = get_logger(__name__)
@@ -49,8 +51,9 @@ class TileTask(BaseTask):
         )
         db_session = await session_manager.get_session(feature_store)
 
-        await self.app_container.tile_task_executor.execute(
-            session=db_session, params=payload.parameters
-        )
+        with query_priority(QueryPriority.SCHEDULED_TILE):
+            await self.app_container.tile_task_executor.execute(
+                session=db_session, params=payload.parameters
+            )
 
         logger.debug("Tile task ended")
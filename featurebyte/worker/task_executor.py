@@ -8,7 +8,6 @@ from typing import Any, Awaitable, Optional
 import asyncio
 import os
 from abc import abstractmethod
-from concurrent.futures import ThreadPoolExecutor
 from threading import Thread
 from uuid import UUID
 
@@ -20,6 +19,7 @@ from featurebyte.config import get_home_path
 from featurebyte.enum import WorkerCommand
 from featurebyte.logging import get_logger
 from featurebyte.models.base import User
+from featurebyte.session.executor import get_default_executor, get_executor_metrics
 from featurebyte.utils.credential import MongoBackedCredentialProvider
 from featurebyte.utils.messaging import Progress
 from featurebyte.utils.persistent import get_persistent
@@ -68,12 +68,19 @@ def run_async(coro: Awaitable[Any], timeout: Optional[int] = None) -> Any:
         logger.debug("Use existing async loop", extra={"loop": loop})
     except RuntimeError:
         loop = asyncio.new_event_loop()
-        loop.set_default_executor(ThreadPoolExecutor(max_workers=1000))
+        # share a bounded default executor across the event loops created by the worker
+        loop.set_default_executor(get_default_executor())
         logger.debug("Create new async loop", extra={"loop": loop})
         thread = Thread(target=start_background_loop, args=(loop,), daemon=True)
         thread.start()
 
-    logger.debug("Asyncio tasks", extra={"num_tasks": len(asyncio.all_tasks(loop=loop))})
+    logger.debug(
+        "Asyncio tasks",
+        extra={
+            "num_tasks": len(asyncio.all_tasks(loop=loop)),
+            "executors": {name: metrics.dict() for name, metrics in get_executor_metrics().items()},
+        },
+    )
 
     logger.info("Start task", extra={"timeout": timeout})
     future = asyncio.run_coroutine_threadsafe(coro, loop)
@@ -84,9 +91,16 @@ def run_async(coro: Awaitable[Any], timeout: Optional[int] = None) -> Any:
             event.wait()
             return future.result()
     except TimeoutError as exc:
-        # try to cancel the job if it has not started
+        # cancel the coroutine so that running queries are cancelled in the data warehouse
         future.cancel()
         raise SoftTimeLimitExceeded(f"Task timed out after {timeout}s") from exc
+    except BaseException:
+        # task is revoked (e.g. SoftTimeLimitExceeded raised by the worker or greenlet killed),
+        # propagate the cancellation to the coroutine running in the event loop
+        if not future.done():
+            logger.info("Cancel revoked task")
+            future.cancel()
+        raise
 
 
 class TaskExecutor:
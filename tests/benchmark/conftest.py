@@ -0,0 +1,244 @@
+"""
+Fixtures for the query graph & SQL generation benchmarks
+
+Benchmarks are run on synthetic feature lists built from event, item and SCD tables so that they
+do not require a data warehouse or a running app. Run them with:
+
+    pytest tests/benchmark --benchmark-only
+
+Use --benchmark-sizes to limit the feature list sizes benchmarked (e.g. --benchmark-sizes 10,100).
+Besides the timings reported by pytest-benchmark, the peak memory allocated by one call of each
+benchmarked function is reported in the extra_info field of the benchmark results (use
+--benchmark-json to save them).
+"""
+from typing import Any, Callable, List, Tuple
+
+import tracemalloc
+
+import pytest
+from bson import ObjectId
+
+from featurebyte.enum import DBVarType
+from featurebyte.query_graph.enum import NodeOutputType, NodeType
+from featurebyte.query_graph.graph import QueryGraph
+from featurebyte.query_graph.node import Node
+from tests.util.helper import add_groupby_operation
+
+FEATURE_LIST_SIZES = [10, 100, 1000]
+
+CUSTOMER_ENTITY_ID = ObjectId("63dbe68cd918ef71acffd127")
+ORDER_ENTITY_ID = ObjectId("63748c9244bc4549b25f8200")
+
+EVENT_AGG_FUNCS = ["sum", "avg", "max", "min", "std", "latest"]
+ITEM_AGG_FUNCS = ["sum", "avg", "max", "min", "std"]
+FEATURE_JOB_SETTINGS = [
+    {"frequency": 3600, "time_modulo_frequency": 1800, "blind_spot": 900},
+    {"frequency": 86400, "time_modulo_frequency": 3600, "blind_spot": 7200},
+]
+WINDOWS = ["2h", "24h", "7d", "28d"]
+
+
+def pytest_addoption(parser):
+    """Set up benchmark options"""
+    parser.addoption(
+        "--benchmark-sizes",
+        type=str,
+        default=",".join(str(size) for size in FEATURE_LIST_SIZES),
+        help="Comma separated feature list sizes to benchmark",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize benchmarks by feature list size"""
+    if "feature_list_size" in metafunc.fixturenames:
+        # the option is not registered when the benchmarks are collected from a parent directory
+        option = metafunc.config.getoption("benchmark_sizes", default=None)
+        sizes = [int(size) for size in option.split(",")] if option else FEATURE_LIST_SIZES
+        metafunc.parametrize("feature_list_size", sizes, ids=[f"{size}_features" for size in sizes])
+
+
+def _add_input_node(graph: QueryGraph, table_name: str, node_params: dict[str, Any]) -> Node:
+    return graph.add_operation(
+        node_type=NodeType.INPUT,
+        node_params={
+            **node_params,
+            "table_details": {
+                "database_name": "db",
+                "schema_name": "public",
+                "table_name": table_name,
+            },
+            "feature_store_details": {
+                "type": "snowflake",
+                "details": {
+                    "account": "sf_account",
+                    "warehouse": "sf_warehouse",
+                    "database": "db",
+                    "sf_schema": "public",
+                },
+            },
+        },
+        node_output_type=NodeOutputType.FRAME,
+        input_nodes=[],
+    )
+
+
+def _project(graph: QueryGraph, node: Node, column_name: str) -> Node:
+    return graph.add_operation(
+        node_type=NodeType.PROJECT,
+        node_params={"columns": [column_name]},
+        node_output_type=NodeOutputType.SERIES,
+        input_nodes=[node],
+    )
+
+
+def build_feature_list_graph(num_features: int) -> Tuple[QueryGraph, List[Node]]:
+    """
+    Build a query graph of a synthetic feature list. Features are spread evenly across window
+    aggregates of an event table, non-time based aggregates of an item table and lookups of an SCD
+    table.
+
+    Parameters
+    ----------
+    num_features: int
+        Number of features in the feature list
+
+    Returns
+    -------
+    Tuple[QueryGraph, List[Node]]
+        Query graph and the feature nodes
+    """
+    graph = QueryGraph()
+    event_input_node = _add_input_node(
+        graph,
+        "event_table",
+        {
+            "type": "event_table",
+            "columns": [
+                {"name": "ts", "dtype": DBVarType.TIMESTAMP},
+                {"name": "cust_id", "dtype": DBVarType.INT},
+                {"name": "a", "dtype": DBVarType.FLOAT},
+                {"name": "b", "dtype": DBVarType.FLOAT},
+            ],
+            "timestamp_column": "ts",
+        },
+    )
+    item_input_node = _add_input_node(
+        graph,
+        "item_table",
+        {
+            "type": "item_table",
+            "columns": [
+                {"name": "order_id", "dtype": DBVarType.INT},
+                {"name": "item_id", "dtype": DBVarType.INT},
+                {"name": "item_price", "dtype": DBVarType.FLOAT},
+            ],
+        },
+    )
+    scd_input_node = _add_input_node(
+        graph,
+        "customer_profile_table",
+        {
+            "type": "scd_table",
+            "columns": [
+                {"name": "effective_ts", "dtype": DBVarType.TIMESTAMP},
+                {"name": "cust_id", "dtype": DBVarType.INT},
+                {"name": "membership_status", "dtype": DBVarType.VARCHAR},
+            ],
+            "effective_timestamp_column": "effective_ts",
+            "current_flag_column": "is_record_current",
+        },
+    )
+
+    feature_nodes = []
+    for i in range(num_features):
+        feature_name = f"feature_{i}"
+        if i % 3 == 0:
+            index = i // 3
+            groupby_node = add_groupby_operation(
+                graph,
+                {
+                    "keys": ["cust_id"],
+                    "serving_names": ["CUSTOMER_ID"],
+                    "entity_ids": [CUSTOMER_ENTITY_ID],
+                    "value_by": None,
+                    "parent": ["a", "b"][index % 2],
+                    "agg_func": EVENT_AGG_FUNCS[index % len(EVENT_AGG_FUNCS)],
+                    **FEATURE_JOB_SETTINGS[index % len(FEATURE_JOB_SETTINGS)],
+                    "timestamp": "ts",
+                    "names": [feature_name],
+                    "windows": [WINDOWS[index % len(WINDOWS)]],
+                },
+                event_input_node,
+            )
+            feature_node = _project(graph, groupby_node, feature_name)
+        elif i % 3 == 1:
+            index = i // 3
+            groupby_node = graph.add_operation(
+                node_type=NodeType.ITEM_GROUPBY,
+                node_params={
+                    "keys": ["order_id"],
+                    "serving_names": ["ORDER_ID"],
+                    "entity_ids": [ORDER_ENTITY_ID],
+                    "parent": "item_price",
+                    "agg_func": ITEM_AGG_FUNCS[index % len(ITEM_AGG_FUNCS)],
+                    "name": feature_name,
+                },
+                node_output_type=NodeOutputType.FRAME,
+                input_nodes=[item_input_node],
+            )
+            feature_node = _project(graph, groupby_node, feature_name)
+        else:
+            lookup_node = graph.add_operation(
+                node_type=NodeType.LOOKUP,
+                node_params={
+                    "input_column_names": ["membership_status"],
+                    "feature_names": [feature_name],
+                    "entity_column": "cust_id",
+                    "serving_name": "CUSTOMER_ID",
+                    "entity_id": CUSTOMER_ENTITY_ID,
+                    "scd_parameters": {
+                        "effective_timestamp_column": "effective_ts",
+                        "natural_key_column": "cust_id",
+                        "current_flag_column": "is_record_current",
+                    },
+                },
+                node_output_type=NodeOutputType.FRAME,
+                input_nodes=[scd_input_node],
+            )
+            feature_node = _project(graph, lookup_node, feature_name)
+        feature_nodes.append(
+            graph.add_operation(
+                node_type=NodeType.ALIAS,
+                node_params={"name": feature_name},
+                node_output_type=NodeOutputType.SERIES,
+                input_nodes=[feature_node],
+            )
+        )
+    return graph, feature_nodes
+
+
+@pytest.fixture(name="feature_list_graph")
+def feature_list_graph_fixture(feature_list_size):
+    """
+    Query graph and feature nodes of a synthetic feature list
+    """
+    return build_feature_list_graph(feature_list_size)
+
+
+@pytest.fixture(name="run_benchmark")
+def run_benchmark_fixture(benchmark):
+    """
+    Fixture to benchmark a function and record the peak memory allocated by one call of it
+    """
+
+    def _run_benchmark(func: Callable[..., Any], *args: Any, rounds: int = 3) -> Any:
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory_mb"] = round(peak_memory / 2**20, 3)
+        return benchmark.pedantic(func, args=args, rounds=rounds, iterations=1)
+
+    return _run_benchmark
@@ -0,0 +1,38 @@
+"""
+Benchmarks of query graph construction, hashing and pruning
+"""
+from featurebyte.query_graph.model.graph import QueryGraphModel
+from featurebyte.query_graph.transform.pruning import prune_query_graph
+from tests.benchmark.conftest import build_feature_list_graph
+
+
+def test_build_query_graph(run_benchmark, feature_list_size):
+    """
+    Benchmark adding the nodes of a feature list to a query graph (node hashing included)
+    """
+    _, feature_nodes = run_benchmark(build_feature_list_graph, feature_list_size)
+    assert len(feature_nodes) == feature_list_size
+
+
+def test_query_graph_from_dict(run_benchmark, feature_list_graph):
+    """
+    Benchmark constructing a QueryGraphModel from its serialized form
+    """
+    graph, _ = feature_list_graph
+    graph_dict = graph.dict(by_alias=True)
+    loaded_graph = run_benchmark(lambda: QueryGraphModel(**graph_dict))
+    assert len(loaded_graph.nodes) == len(graph.nodes)
+
+
+def test_prune_query_graph(run_benchmark, feature_list_graph):
+    """
+    Benchmark pruning the query graph of a feature list for each of its features
+    """
+    graph, feature_nodes = feature_list_graph
+
+    def _prune_all() -> list[QueryGraphModel]:
+        return [prune_query_graph(graph=graph, node=node)[0] for node in feature_nodes]
+
+    pruned_graphs = run_benchmark(_prune_all, rounds=1)
+    assert len(pruned_graphs) == len(feature_nodes)
+    assert all(len(pruned_graph.nodes) <= len(graph.nodes) for pruned_graph in pruned_graphs)
@@ -0,0 +1,87 @@
+"""
+Benchmarks of execution planning and SQL generation for feature lists
+"""
+from featurebyte.enum import SourceType, SpecialColumnName
+from featurebyte.query_graph.node.schema import TableDetails
+from featurebyte.query_graph.sql.common import sql_to_string
+from featurebyte.query_graph.sql.feature_compute import FeatureExecutionPlanner
+from featurebyte.query_graph.sql.feature_historical import (
+    get_feature_names,
+    get_historical_features_expr,
+    get_historical_features_query_set,
+)
+from featurebyte.query_graph.sql.online_serving import get_online_store_retrieval_template
+
+REQUEST_TABLE_NAME = "REQUEST_TABLE"
+REQUEST_TABLE_COLUMNS = [SpecialColumnName.POINT_IN_TIME.value, "CUSTOMER_ID", "ORDER_ID"]
+
+
+def test_generate_plan(run_benchmark, feature_list_graph):
+    """
+    Benchmark FeatureExecutionPlanner.generate_plan
+    """
+    graph, feature_nodes = feature_list_graph
+
+    def _generate_plan():
+        planner = FeatureExecutionPlanner(graph, is_online_serving=False)
+        return planner.generate_plan(feature_nodes)
+
+    plan = run_benchmark(_generate_plan)
+    assert len(plan.feature_names) == len(feature_nodes)
+
+
+def test_get_historical_features_query_set(run_benchmark, feature_list_graph):
+    """
+    Benchmark get_historical_features_query_set
+    """
+    graph, feature_nodes = feature_list_graph
+    output_feature_names = get_feature_names(graph, feature_nodes)
+
+    def _get_query_set():
+        return get_historical_features_query_set(
+            request_table_name=REQUEST_TABLE_NAME,
+            graph=graph,
+            nodes=feature_nodes,
+            request_table_columns=list(REQUEST_TABLE_COLUMNS),
+            source_type=SourceType.SNOWFLAKE,
+            output_table_details=TableDetails(table_name="OUTPUT_TABLE"),
+            output_feature_names=output_feature_names,
+        )
+
+    query_set = run_benchmark(_get_query_set)
+    assert query_set.output_query
+
+
+def test_get_online_store_retrieval_template(run_benchmark, feature_list_graph):
+    """
+    Benchmark get_online_store_retrieval_template
+    """
+    graph, feature_nodes = feature_list_graph
+
+    def _get_template():
+        return get_online_store_retrieval_template(
+            graph=graph,
+            nodes=feature_nodes,
+            source_type=SourceType.SNOWFLAKE,
+            request_table_columns=["CUSTOMER_ID", "ORDER_ID"],
+            request_table_name=REQUEST_TABLE_NAME,
+        )
+
+    template = run_benchmark(_get_template)
+    assert template.sql_template
+
+
+def test_sql_to_string(run_benchmark, feature_list_graph):
+    """
+    Benchmark sql_to_string on the historical features query of a feature list
+    """
+    graph, feature_nodes = feature_list_graph
+    expr, _ = get_historical_features_expr(
+        request_table_name=REQUEST_TABLE_NAME,
+        graph=graph,
+        nodes=feature_nodes,
+        request_table_columns=list(REQUEST_TABLE_COLUMNS),
+        source_type=SourceType.SNOWFLAKE,
+    )
+    sql = run_benchmark(sql_to_string, expr, SourceType.SNOWFLAKE)
+    assert sql.startswith("WITH")
@@ -1,21 +1 @@
-CREATE TABLE "SOME_HISTORICAL_FEATURE_TABLE" AS
-SELECT
-  REQ."POINT_IN_TIME",
-  REQ."CUSTOMER_ID",
-  T2."a_2h_average",
-  T2."a_48h_average",
-  T0."order_size",
-  T2."MY FEATURE",
-  T1."Current Membership Status",
-  T3."a_latest_value_past_90d",
-  T1."a_latest_value",
-  T0."asat_feature"
-FROM REQUEST_TABLE AS REQ
-LEFT JOIN "__TEMP_646f1b781d1e7970788b32ec_0" AS T0
-  ON REQ."__FB_ROW_INDEX_FOR_JOIN" = T0."__FB_ROW_INDEX_FOR_JOIN"
-LEFT JOIN "__TEMP_646f1b781d1e7970788b32ec_1" AS T1
-  ON REQ."__FB_ROW_INDEX_FOR_JOIN" = T1."__FB_ROW_INDEX_FOR_JOIN"
-LEFT JOIN "__TEMP_646f1b781d1e7970788b32ec_2" AS T2
-  ON REQ."__FB_ROW_INDEX_FOR_JOIN" = T2."__FB_ROW_INDEX_FOR_JOIN"
-LEFT JOIN "__TEMP_646f1b781d1e7970788b32ec_3" AS T3
-  ON REQ."__FB_ROW_INDEX_FOR_JOIN" = T3."__FB_ROW_INDEX_FOR_JOIN"
+CREATE TABLE "SOME_HISTORICAL_FEATURE_TABLE" AS SELECT REQ."POINT_IN_TIME", REQ."CUSTOMER_ID", T2."a_2h_average", T2."a_48h_average", T0."order_size", T2."MY FEATURE", T1."Current Membership Status", T3."a_latest_value_past_90d", T1."a_latest_value", T0."asat_feature" FROM REQUEST_TABLE AS REQ LEFT JOIN "__TEMP_646f1b781d1e7970788b32ec_0" AS T0 ON REQ."__FB_ROW_INDEX_FOR_JOIN" = T0."__FB_ROW_INDEX_FOR_JOIN" LEFT JOIN "__TEMP_646f1b781d1e7970788b32ec_1" AS T1 ON REQ."__FB_ROW_INDEX_FOR_JOIN" = T1."__FB_ROW_INDEX_FOR_JOIN" LEFT JOIN "__TEMP_646f1b781d1e7970788b32ec_2" AS T2 ON REQ."__FB_ROW_INDEX_FOR_JOIN" = T2."__FB_ROW_INDEX_FOR_JOIN" LEFT JOIN "__TEMP_646f1b781d1e7970788b32ec_3" AS T3 ON REQ."__FB_ROW_INDEX_FOR_JOIN" = T3."__FB_ROW_INDEX_FOR_JOIN"
@@ -0,0 +1,294 @@
+WITH "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS (
+  SELECT
+    "POINT_IN_TIME",
+    "CID",
+    FLOOR((
+      DATE_PART(EPOCH_SECOND, "POINT_IN_TIME") - 60
+    ) / 300) AS "__FB_LAST_TILE_INDEX",
+    FLOOR((
+      DATE_PART(EPOCH_SECOND, "POINT_IN_TIME") - 60
+    ) / 300) - 25920 AS "__FB_FIRST_TILE_INDEX"
+  FROM (
+    SELECT DISTINCT
+      "POINT_IN_TIME",
+      "CID"
+    FROM REQUEST_TABLE
+  )
+)
+SELECT
+  *
+FROM (
+  SELECT
+    a,
+    b,
+    c,
+    "T0"."_fb_internal_window_w7776000_sum_1234" AS "_fb_internal_window_w7776000_sum_1234",
+    "T1"."_fb_internal_window_w7776000_avg_5678" AS "_fb_internal_window_w7776000_avg_5678"
+  FROM REQUEST_TABLE
+  LEFT JOIN (
+    SELECT
+      "POINT_IN_TIME",
+      "CID",
+      SUM(value_sum_1234) AS "_fb_internal_window_w7776000_sum_1234"
+    FROM (
+      SELECT
+        "POINT_IN_TIME",
+        "CID",
+        COALESCE("__FB_CUMULATIVE_LAST_value_sum_1234", 0) - COALESCE("__FB_CUMULATIVE_FIRST_value_sum_1234", 0) AS value_sum_1234
+      FROM (
+        SELECT
+          L."POINT_IN_TIME" AS "POINT_IN_TIME",
+          L."CID" AS "CID",
+          L."__FB_CUMULATIVE_LAST_value_sum_1234" AS "__FB_CUMULATIVE_LAST_value_sum_1234",
+          L."__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT" AS "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT",
+          R.value_sum_1234 AS "__FB_CUMULATIVE_FIRST_value_sum_1234",
+          R.CUMULATIVE_TILE_COUNT AS "__FB_CUMULATIVE_FIRST_CUMULATIVE_TILE_COUNT"
+        FROM (
+          SELECT
+            "__FB_KEY_COL_0",
+            "__FB_LAST_TS",
+            "POINT_IN_TIME",
+            "CID",
+            "__FB_CUMULATIVE_LAST_value_sum_1234",
+            "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT"
+          FROM (
+            SELECT
+              "__FB_KEY_COL_0",
+              LAG("__FB_EFFECTIVE_TS_COL") IGNORE NULLS OVER (PARTITION BY "__FB_KEY_COL_0" ORDER BY "__FB_TS_COL", "__FB_TS_TIE_BREAKER_COL") AS "__FB_LAST_TS",
+              "POINT_IN_TIME",
+              "CID",
+              "__FB_CUMULATIVE_LAST_value_sum_1234",
+              "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT",
+              "__FB_EFFECTIVE_TS_COL"
+            FROM (
+              SELECT
+                "__FB_FIRST_TILE_INDEX" AS "__FB_TS_COL",
+                "CID" AS "__FB_KEY_COL_0",
+                NULL AS "__FB_EFFECTIVE_TS_COL",
+                0 AS "__FB_TS_TIE_BREAKER_COL",
+                "POINT_IN_TIME" AS "POINT_IN_TIME",
+                "CID" AS "CID",
+                "__FB_CUMULATIVE_LAST_value_sum_1234" AS "__FB_CUMULATIVE_LAST_value_sum_1234",
+                "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT" AS "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT"
+              FROM (
+                SELECT
+                  L."POINT_IN_TIME" AS "POINT_IN_TIME",
+                  L."CID" AS "CID",
+                  L."__FB_FIRST_TILE_INDEX" AS "__FB_FIRST_TILE_INDEX",
+                  R.value_sum_1234 AS "__FB_CUMULATIVE_LAST_value_sum_1234",
+                  R.CUMULATIVE_TILE_COUNT AS "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT"
+                FROM (
+                  SELECT
+                    "__FB_KEY_COL_0",
+                    "__FB_LAST_TS",
+                    "POINT_IN_TIME",
+                    "CID",
+                    "__FB_FIRST_TILE_INDEX"
+                  FROM (
+                    SELECT
+                      "__FB_KEY_COL_0",
+                      LAG("__FB_EFFECTIVE_TS_COL") IGNORE NULLS OVER (PARTITION BY "__FB_KEY_COL_0" ORDER BY "__FB_TS_COL", "__FB_TS_TIE_BREAKER_COL") AS "__FB_LAST_TS",
+                      "POINT_IN_TIME",
+                      "CID",
+                      "__FB_FIRST_TILE_INDEX",
+                      "__FB_EFFECTIVE_TS_COL"
+                    FROM (
+                      SELECT
+                        "__FB_LAST_TILE_INDEX" AS "__FB_TS_COL",
+                        "CID" AS "__FB_KEY_COL_0",
+                        NULL AS "__FB_EFFECTIVE_TS_COL",
+                        0 AS "__FB_TS_TIE_BREAKER_COL",
+                        "POINT_IN_TIME" AS "POINT_IN_TIME",
+                        "CID" AS "CID",
+                        "__FB_FIRST_TILE_INDEX" AS "__FB_FIRST_TILE_INDEX"
+                      FROM (
+                        SELECT
+                          "POINT_IN_TIME",
+                          "CID",
+                          "__FB_LAST_TILE_INDEX",
+                          "__FB_FIRST_TILE_INDEX"
+                        FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID"
+                      )
+                      UNION ALL
+                      SELECT
+                        "INDEX" AS "__FB_TS_COL",
+                        "CUST_ID" AS "__FB_KEY_COL_0",
+                        "INDEX" AS "__FB_EFFECTIVE_TS_COL",
+                        1 AS "__FB_TS_TIE_BREAKER_COL",
+                        NULL AS "POINT_IN_TIME",
+                        NULL AS "CID",
+                        NULL AS "__FB_FIRST_TILE_INDEX"
+                      FROM TILE_SUM_CUMULATIVE_sum_1234
+                    )
+                  )
+                  WHERE
+                    "__FB_EFFECTIVE_TS_COL" IS NULL
+                ) AS L
+                LEFT JOIN TILE_SUM_CUMULATIVE_sum_1234 AS R
+                  ON L."__FB_LAST_TS" = R."INDEX" AND L."__FB_KEY_COL_0" = R."CUST_ID"
+              )
+              UNION ALL
+              SELECT
+                "INDEX" AS "__FB_TS_COL",
+                "CUST_ID" AS "__FB_KEY_COL_0",
+                "INDEX" AS "__FB_EFFECTIVE_TS_COL",
+                1 AS "__FB_TS_TIE_BREAKER_COL",
+                NULL AS "POINT_IN_TIME",
+                NULL AS "CID",
+                NULL AS "__FB_CUMULATIVE_LAST_value_sum_1234",
+                NULL AS "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT"
+              FROM TILE_SUM_CUMULATIVE_sum_1234
+            )
+          )
+          WHERE
+            "__FB_EFFECTIVE_TS_COL" IS NULL
+        ) AS L
+        LEFT JOIN TILE_SUM_CUMULATIVE_sum_1234 AS R
+          ON L."__FB_LAST_TS" = R."INDEX" AND L."__FB_KEY_COL_0" = R."CUST_ID"
+      )
+      WHERE
+        COALESCE("__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT", 0) - COALESCE("__FB_CUMULATIVE_FIRST_CUMULATIVE_TILE_COUNT", 0) > 0
+    )
+    GROUP BY
+      "POINT_IN_TIME",
+      "CID"
+  ) AS T0
+    ON REQ."POINT_IN_TIME" = T0."POINT_IN_TIME" AND REQ."CID" = T0."CID"
+  LEFT JOIN (
+    SELECT
+      "POINT_IN_TIME",
+      "CID",
+      SUM(sum_value_avg_5678) / SUM(count_value_avg_5678) AS "_fb_internal_window_w7776000_avg_5678"
+    FROM (
+      SELECT
+        "POINT_IN_TIME",
+        "CID",
+        COALESCE("__FB_CUMULATIVE_LAST_count_value_avg_5678", 0) - COALESCE("__FB_CUMULATIVE_FIRST_count_value_avg_5678", 0) AS count_value_avg_5678,
+        COALESCE("__FB_CUMULATIVE_LAST_sum_value_avg_5678", 0) - COALESCE("__FB_CUMULATIVE_FIRST_sum_value_avg_5678", 0) AS sum_value_avg_5678
+      FROM (
+        SELECT
+          L."POINT_IN_TIME" AS "POINT_IN_TIME",
+          L."CID" AS "CID",
+          L."__FB_CUMULATIVE_LAST_count_value_avg_5678" AS "__FB_CUMULATIVE_LAST_count_value_avg_5678",
+          L."__FB_CUMULATIVE_LAST_sum_value_avg_5678" AS "__FB_CUMULATIVE_LAST_sum_value_avg_5678",
+          L."__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT" AS "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT",
+          R.count_value_avg_5678 AS "__FB_CUMULATIVE_FIRST_count_value_avg_5678",
+          R.sum_value_avg_5678 AS "__FB_CUMULATIVE_FIRST_sum_value_avg_5678",
+          R.CUMULATIVE_TILE_COUNT AS "__FB_CUMULATIVE_FIRST_CUMULATIVE_TILE_COUNT"
+        FROM (
+          SELECT
+            "__FB_KEY_COL_0",
+            "__FB_LAST_TS",
+            "POINT_IN_TIME",
+            "CID",
+            "__FB_CUMULATIVE_LAST_count_value_avg_5678",
+            "__FB_CUMULATIVE_LAST_sum_value_avg_5678",
+            "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT"
+          FROM (
+            SELECT
+              "__FB_KEY_COL_0",
+              LAG("__FB_EFFECTIVE_TS_COL") IGNORE NULLS OVER (PARTITION BY "__FB_KEY_COL_0" ORDER BY "__FB_TS_COL", "__FB_TS_TIE_BREAKER_COL") AS "__FB_LAST_TS",
+              "POINT_IN_TIME",
+              "CID",
+              "__FB_CUMULATIVE_LAST_count_value_avg_5678",
+              "__FB_CUMULATIVE_LAST_sum_value_avg_5678",
+              "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT",
+              "__FB_EFFECTIVE_TS_COL"
+            FROM (
+              SELECT
+                "__FB_FIRST_TILE_INDEX" AS "__FB_TS_COL",
+                "CID" AS "__FB_KEY_COL_0",
+                NULL AS "__FB_EFFECTIVE_TS_COL",
+                0 AS "__FB_TS_TIE_BREAKER_COL",
+                "POINT_IN_TIME" AS "POINT_IN_TIME",
+                "CID" AS "CID",
+                "__FB_CUMULATIVE_LAST_count_value_avg_5678" AS "__FB_CUMULATIVE_LAST_count_value_avg_5678",
+                "__FB_CUMULATIVE_LAST_sum_value_avg_5678" AS "__FB_CUMULATIVE_LAST_sum_value_avg_5678",
+                "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT" AS "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT"
+              FROM (
+                SELECT
+                  L."POINT_IN_TIME" AS "POINT_IN_TIME",
+                  L."CID" AS "CID",
+                  L."__FB_FIRST_TILE_INDEX" AS "__FB_FIRST_TILE_INDEX",
+                  R.count_value_avg_5678 AS "__FB_CUMULATIVE_LAST_count_value_avg_5678",
+                  R.sum_value_avg_5678 AS "__FB_CUMULATIVE_LAST_sum_value_avg_5678",
+                  R.CUMULATIVE_TILE_COUNT AS "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT"
+                FROM (
+                  SELECT
+                    "__FB_KEY_COL_0",
+                    "__FB_LAST_TS",
+                    "POINT_IN_TIME",
+                    "CID",
+                    "__FB_FIRST_TILE_INDEX"
+                  FROM (
+                    SELECT
+                      "__FB_KEY_COL_0",
+                      LAG("__FB_EFFECTIVE_TS_COL") IGNORE NULLS OVER (PARTITION BY "__FB_KEY_COL_0" ORDER BY "__FB_TS_COL", "__FB_TS_TIE_BREAKER_COL") AS "__FB_LAST_TS",
+                      "POINT_IN_TIME",
+                      "CID",
+                      "__FB_FIRST_TILE_INDEX",
+                      "__FB_EFFECTIVE_TS_COL"
+                    FROM (
+                      SELECT
+                        "__FB_LAST_TILE_INDEX" AS "__FB_TS_COL",
+                        "CID" AS "__FB_KEY_COL_0",
+                        NULL AS "__FB_EFFECTIVE_TS_COL",
+                        0 AS "__FB_TS_TIE_BREAKER_COL",
+                        "POINT_IN_TIME" AS "POINT_IN_TIME",
+                        "CID" AS "CID",
+                        "__FB_FIRST_TILE_INDEX" AS "__FB_FIRST_TILE_INDEX"
+                      FROM (
+                        SELECT
+                          "POINT_IN_TIME",
+                          "CID",
+                          "__FB_LAST_TILE_INDEX",
+                          "__FB_FIRST_TILE_INDEX"
+                        FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID"
+                      )
+                      UNION ALL
+                      SELECT
+                        "INDEX" AS "__FB_TS_COL",
+                        "CUST_ID" AS "__FB_KEY_COL_0",
+                        "INDEX" AS "__FB_EFFECTIVE_TS_COL",
+                        1 AS "__FB_TS_TIE_BREAKER_COL",
+                        NULL AS "POINT_IN_TIME",
+                        NULL AS "CID",
+                        NULL AS "__FB_FIRST_TILE_INDEX"
+                      FROM TILE_SUM_CUMULATIVE_avg_5678
+                    )
+                  )
+                  WHERE
+                    "__FB_EFFECTIVE_TS_COL" IS NULL
+                ) AS L
+                LEFT JOIN TILE_SUM_CUMULATIVE_avg_5678 AS R
+                  ON L."__FB_LAST_TS" = R."INDEX" AND L."__FB_KEY_COL_0" = R."CUST_ID"
+              )
+              UNION ALL
+              SELECT
+                "INDEX" AS "__FB_TS_COL",
+                "CUST_ID" AS "__FB_KEY_COL_0",
+                "INDEX" AS "__FB_EFFECTIVE_TS_COL",
+                1 AS "__FB_TS_TIE_BREAKER_COL",
+                NULL AS "POINT_IN_TIME",
+                NULL AS "CID",
+                NULL AS "__FB_CUMULATIVE_LAST_count_value_avg_5678",
+                NULL AS "__FB_CUMULATIVE_LAST_sum_value_avg_5678",
+                NULL AS "__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT"
+              FROM TILE_SUM_CUMULATIVE_avg_5678
+            )
+          )
+          WHERE
+            "__FB_EFFECTIVE_TS_COL" IS NULL
+        ) AS L
+        LEFT JOIN TILE_SUM_CUMULATIVE_avg_5678 AS R
+          ON L."__FB_LAST_TS" = R."INDEX" AND L."__FB_KEY_COL_0" = R."CUST_ID"
+      )
+      WHERE
+        COALESCE("__FB_CUMULATIVE_LAST_CUMULATIVE_TILE_COUNT", 0) - COALESCE("__FB_CUMULATIVE_FIRST_CUMULATIVE_TILE_COUNT", 0) > 0
+    )
+    GROUP BY
+      "POINT_IN_TIME",
+      "CID"
+  ) AS T1
+    ON REQ."POINT_IN_TIME" = T1."POINT_IN_TIME" AND REQ."CID" = T1."CID"
+)
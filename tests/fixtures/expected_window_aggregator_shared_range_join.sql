@@ -0,0 +1,68 @@
+WITH "REQUEST_TABLE_W2592000_F300_BS120_M60_CID" AS (
+  SELECT
+    "POINT_IN_TIME",
+    "CID",
+    FLOOR((
+      DATE_PART(EPOCH_SECOND, "POINT_IN_TIME") - 60
+    ) / 300) AS "__FB_LAST_TILE_INDEX",
+    FLOOR((
+      DATE_PART(EPOCH_SECOND, "POINT_IN_TIME") - 60
+    ) / 300) - 8640 AS "__FB_FIRST_TILE_INDEX"
+  FROM (
+    SELECT DISTINCT
+      "POINT_IN_TIME",
+      "CID"
+    FROM REQUEST_TABLE
+  )
+)
+SELECT
+  *
+FROM (
+  SELECT
+    a,
+    b,
+    c,
+    "T0"."_fb_internal_window_w86400_sum_1234" AS "_fb_internal_window_w86400_sum_1234",
+    "T0"."_fb_internal_window_w604800_sum_1234" AS "_fb_internal_window_w604800_sum_1234",
+    "T0"."_fb_internal_window_w2592000_sum_1234" AS "_fb_internal_window_w2592000_sum_1234"
+  FROM REQUEST_TABLE
+  LEFT JOIN (
+    SELECT
+      "POINT_IN_TIME",
+      "CID",
+      SUM(CASE WHEN INDEX >= "__FB_LAST_TILE_INDEX" - 288 THEN value_sum_1234 END) AS "_fb_internal_window_w86400_sum_1234",
+      SUM(CASE WHEN INDEX >= "__FB_LAST_TILE_INDEX" - 2016 THEN value_sum_1234 END) AS "_fb_internal_window_w604800_sum_1234",
+      SUM(value_sum_1234) AS "_fb_internal_window_w2592000_sum_1234"
+    FROM (
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        REQ."__FB_LAST_TILE_INDEX",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W2592000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN TILE_SUM AS TILE
+        ON FLOOR(REQ.__FB_LAST_TILE_INDEX / 8640) = FLOOR(TILE.INDEX / 8640)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= REQ.__FB_FIRST_TILE_INDEX AND TILE.INDEX < REQ.__FB_LAST_TILE_INDEX
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        REQ."__FB_LAST_TILE_INDEX",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W2592000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN TILE_SUM AS TILE
+        ON FLOOR(REQ.__FB_LAST_TILE_INDEX / 8640) - 1 = FLOOR(TILE.INDEX / 8640)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= REQ.__FB_FIRST_TILE_INDEX AND TILE.INDEX < REQ.__FB_LAST_TILE_INDEX
+    )
+    GROUP BY
+      "POINT_IN_TIME",
+      "CID"
+  ) AS T0
+    ON REQ."POINT_IN_TIME" = T0."POINT_IN_TIME" AND REQ."CID" = T0."CID"
+)
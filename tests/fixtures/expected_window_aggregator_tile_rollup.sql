@@ -0,0 +1,186 @@
+WITH "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS (
+  SELECT
+    "POINT_IN_TIME",
+    "CID",
+    FLOOR((
+      DATE_PART(EPOCH_SECOND, "POINT_IN_TIME") - 60
+    ) / 300) AS "__FB_LAST_TILE_INDEX",
+    FLOOR((
+      DATE_PART(EPOCH_SECOND, "POINT_IN_TIME") - 60
+    ) / 300) - 25920 AS "__FB_FIRST_TILE_INDEX"
+  FROM (
+    SELECT DISTINCT
+      "POINT_IN_TIME",
+      "CID"
+    FROM REQUEST_TABLE
+  )
+), "TILE_SUM_ROLLUP_12" AS (
+  SELECT
+    "CUST_ID",
+    FLOOR(INDEX / 12) AS INDEX,
+    SUM(value_sum_1234) AS value_sum_1234
+  FROM TILE_SUM
+  GROUP BY
+    "CUST_ID",
+    FLOOR(INDEX / 12)
+), "TILE_SUM_ROLLUP_288" AS (
+  SELECT
+    "CUST_ID",
+    FLOOR(INDEX / 24) AS INDEX,
+    SUM(value_sum_1234) AS value_sum_1234
+  FROM "TILE_SUM_ROLLUP_12"
+  GROUP BY
+    "CUST_ID",
+    FLOOR(INDEX / 24)
+)
+SELECT
+  *
+FROM (
+  SELECT
+    a,
+    b,
+    c,
+    "T0"."_fb_internal_window_w7776000_sum_1234" AS "_fb_internal_window_w7776000_sum_1234"
+  FROM REQUEST_TABLE
+  LEFT JOIN (
+    SELECT
+      "POINT_IN_TIME",
+      "CID",
+      SUM(value_sum_1234) AS "_fb_internal_window_w7776000_sum_1234"
+    FROM (
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN "TILE_SUM_ROLLUP_288" AS TILE
+        ON FLOOR(FLOOR(REQ.__FB_LAST_TILE_INDEX / 288) / 90) = FLOOR(TILE.INDEX / 90)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= CEIL(REQ.__FB_FIRST_TILE_INDEX / 288)
+        AND TILE.INDEX < FLOOR(REQ.__FB_LAST_TILE_INDEX / 288)
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN "TILE_SUM_ROLLUP_288" AS TILE
+        ON FLOOR(FLOOR(REQ.__FB_LAST_TILE_INDEX / 288) / 90) - 1 = FLOOR(TILE.INDEX / 90)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= CEIL(REQ.__FB_FIRST_TILE_INDEX / 288)
+        AND TILE.INDEX < FLOOR(REQ.__FB_LAST_TILE_INDEX / 288)
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN TILE_SUM AS TILE
+        ON FLOOR(CEIL(REQ.__FB_FIRST_TILE_INDEX / 12) * 12 / 12) = FLOOR(TILE.INDEX / 12)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= REQ.__FB_FIRST_TILE_INDEX
+        AND TILE.INDEX < CEIL(REQ.__FB_FIRST_TILE_INDEX / 12) * 12
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN TILE_SUM AS TILE
+        ON FLOOR(CEIL(REQ.__FB_FIRST_TILE_INDEX / 12) * 12 / 12) - 1 = FLOOR(TILE.INDEX / 12)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= REQ.__FB_FIRST_TILE_INDEX
+        AND TILE.INDEX < CEIL(REQ.__FB_FIRST_TILE_INDEX / 12) * 12
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN TILE_SUM AS TILE
+        ON FLOOR(REQ.__FB_LAST_TILE_INDEX / 12) = FLOOR(TILE.INDEX / 12)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= FLOOR(REQ.__FB_LAST_TILE_INDEX / 12) * 12
+        AND TILE.INDEX < REQ.__FB_LAST_TILE_INDEX
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN TILE_SUM AS TILE
+        ON FLOOR(REQ.__FB_LAST_TILE_INDEX / 12) - 1 = FLOOR(TILE.INDEX / 12)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= FLOOR(REQ.__FB_LAST_TILE_INDEX / 12) * 12
+        AND TILE.INDEX < REQ.__FB_LAST_TILE_INDEX
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN "TILE_SUM_ROLLUP_12" AS TILE
+        ON FLOOR(CEIL(REQ.__FB_FIRST_TILE_INDEX / 288) * 24 / 24) = FLOOR(TILE.INDEX / 24)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= CEIL(REQ.__FB_FIRST_TILE_INDEX / 12)
+        AND TILE.INDEX < CEIL(REQ.__FB_FIRST_TILE_INDEX / 288) * 24
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN "TILE_SUM_ROLLUP_12" AS TILE
+        ON FLOOR(CEIL(REQ.__FB_FIRST_TILE_INDEX / 288) * 24 / 24) - 1 = FLOOR(TILE.INDEX / 24)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= CEIL(REQ.__FB_FIRST_TILE_INDEX / 12)
+        AND TILE.INDEX < CEIL(REQ.__FB_FIRST_TILE_INDEX / 288) * 24
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN "TILE_SUM_ROLLUP_12" AS TILE
+        ON FLOOR(FLOOR(REQ.__FB_LAST_TILE_INDEX / 12) / 24) = FLOOR(TILE.INDEX / 24)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= FLOOR(REQ.__FB_LAST_TILE_INDEX / 288) * 24
+        AND TILE.INDEX < FLOOR(REQ.__FB_LAST_TILE_INDEX / 12)
+      UNION ALL
+      SELECT
+        REQ."POINT_IN_TIME",
+        REQ."CID",
+        TILE.INDEX,
+        TILE.value_sum_1234
+      FROM "REQUEST_TABLE_W7776000_F300_BS120_M60_CID" AS REQ
+      INNER JOIN "TILE_SUM_ROLLUP_12" AS TILE
+        ON FLOOR(FLOOR(REQ.__FB_LAST_TILE_INDEX / 12) / 24) - 1 = FLOOR(TILE.INDEX / 24)
+        AND REQ."CID" = TILE."CUST_ID"
+      WHERE
+        TILE.INDEX >= FLOOR(REQ.__FB_LAST_TILE_INDEX / 288) * 24
+        AND TILE.INDEX < FLOOR(REQ.__FB_LAST_TILE_INDEX / 12)
+    )
+    GROUP BY
+      "POINT_IN_TIME",
+      "CID"
+  ) AS T0
+    ON REQ."POINT_IN_TIME" = T0."POINT_IN_TIME" AND REQ."CID" = T0."CID"
+)
@@ -4,13 +4,17 @@ Base materialize table test class
 from typing import Any, Dict, Generic, Type, TypeVar
 
 from abc import abstractmethod
+from unittest.mock import patch
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from featurebyte.api.api_object import ApiObject
+from featurebyte.common.utils import dataframe_to_arrow_bytes
 from featurebyte.exception import RecordRetrievalException
 from featurebyte.models.base import CAMEL_CASE_TO_SNAKE_CASE_PATTERN
+from featurebyte.service.preview import PreviewService
 
 BaseFeatureOrTargetTableT = TypeVar("BaseFeatureOrTargetTableT", bound=ApiObject)
 
@@ -128,3 +132,37 @@ class BaseMaterializedTableApiTest(Generic[BaseFeatureOrTargetTableT]):
         table_under_test.update_description(None)
         assert table_under_test.description is None
         assert table_under_test.info()["description"] is None
+
+    def test_iter_batches(self, table_under_test, mock_api_client_fixture):
+        """Test iterating over the table in batches"""
+        df = pd.DataFrame({"a": range(10), "b": [f"value_{i}" for i in range(10)]})
+        test_client_request = mock_api_client_fixture.side_effect
+
+        def request_with_stream(*args, stream=False, **kwargs):
+            # test client does not support requests' stream parameter
+            response = test_client_request(*args, **kwargs)
+            if stream:
+                response.iter_content = response.iter_bytes
+            return response
+
+        mock_api_client_fixture.side_effect = request_with_stream
+
+        async def mock_download_table(*args, **kwargs):
+            _ = args, kwargs
+
+            async def _bytestream():
+                yield dataframe_to_arrow_bytes(df)
+
+            return _bytestream()
+
+        with patch.object(PreviewService, "download_table", new=mock_download_table):
+            batches = list(table_under_test.iter_batches(batch_size=4))
+            arrow_batches = list(table_under_test.iter_batches(batch_size=4, as_arrow=True))
+
+        assert [batch.shape[0] for batch in batches] == [4, 4, 2]
+        pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), df)
+        assert all(isinstance(batch, pa.RecordBatch) for batch in arrow_batches)
+        assert [batch.num_rows for batch in arrow_batches] == [4, 4, 2]
+
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            next(table_under_test.iter_batches(batch_size=0))
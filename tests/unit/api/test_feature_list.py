@@ -119,6 +119,45 @@ def test_feature_list__get_historical_features(single_feat_flist, mocked_compute
     mock_feature_table.delete.assert_called_once()
 
 
+def test_feature_list__iter_historical_features(single_feat_flist):
+    """Test FeatureList.iter_historical_features yields batches from a temporary table"""
+    flist = single_feat_flist
+    dataframe = pd.DataFrame(
+        {"POINT_IN_TIME": ["2022-04-01", "2022-04-01"], "cust_id": ["C1", "C2"]}
+    )
+    batches = [pd.DataFrame({"cust_id": ["C1"]}), pd.DataFrame({"cust_id": ["C2"]})]
+    mock_feature_table = Mock(name="TempFeatureTable")
+    mock_feature_table.iter_batches.return_value = iter(batches)
+    with patch.object(
+        FeatureList, "compute_historical_feature_table", return_value=mock_feature_table
+    ) as mock_compute_historical_feature_table:
+        iterator = flist.iter_historical_features(dataframe, batch_size=1)
+        # the historical feature table is only computed when the iteration starts
+        mock_compute_historical_feature_table.assert_not_called()
+        assert next(iterator) is batches[0]
+        mock_feature_table.delete.assert_not_called()
+        assert list(iterator) == [batches[1]]
+
+    _, kwargs = mock_compute_historical_feature_table.call_args
+    assert kwargs["observation_table"] is dataframe
+    assert kwargs["historical_feature_table_name"].startswith(
+        "__TEMPORARY_HISTORICAL_FEATURE_TABLE_"
+    )
+    mock_feature_table.iter_batches.assert_called_once_with(batch_size=1, as_arrow=False)
+    mock_feature_table.delete.assert_called_once()
+
+    # check temporary feature table is deleted when the iterator is closed early
+    mock_feature_table = Mock(name="TempFeatureTable")
+    mock_feature_table.iter_batches.return_value = iter(batches)
+    with patch.object(
+        FeatureList, "compute_historical_feature_table", return_value=mock_feature_table
+    ):
+        iterator = flist.iter_historical_features(dataframe)
+        next(iterator)
+        iterator.close()
+    mock_feature_table.delete.assert_called_once()
+
+
 def test_feature_list_creation__feature_and_group(production_ready_feature, feature_group, catalog):
     """Test FeatureList can be created with valid inputs"""
     flist = FeatureList(
@@ -1,8 +1,11 @@
 """
 Test helper functions in featurebyte.common.utils
 """
+from unittest.mock import Mock
+
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 import toml
 from pandas.testing import assert_frame_equal
@@ -13,6 +16,7 @@ from featurebyte.common.utils import (
     dataframe_to_arrow_bytes,
     dataframe_to_json,
     get_version,
+    record_batches_from_arrow_stream,
 )
 from featurebyte.enum import DBVarType
 from featurebyte.query_graph.graph import QueryGraph
@@ -126,3 +130,21 @@ def create_feature_list_batch_feature_create(
         graph=query_graph,
         features=feature_items,
     )
+
+
+def test_record_batches_from_arrow_stream():
+    """
+    Test record_batches_from_arrow_stream regroups the streamed rows into batches of batch_size
+    """
+    table = pa.table({"a": range(12)})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        for offset, length in [(0, 3), (3, 5), (8, 0), (8, 4)]:
+            values = pa.array(range(offset, offset + length), type=pa.int64())
+            writer.write_batch(pa.RecordBatch.from_arrays([values], names=["a"]))
+    data = sink.getvalue().to_pybytes()
+    response = Mock(iter_content=Mock(return_value=iter([data[:100], data[100:]])))
+
+    batches = list(record_batches_from_arrow_stream(response, batch_size=5))
+    assert [batch.num_rows for batch in batches] == [5, 5, 2]
+    assert pa.Table.from_batches(batches).equals(table)
@@ -40,6 +40,7 @@ from featurebyte.models.feature_namespace import FeatureReadiness
 from featurebyte.models.task import Task as TaskModel
 from featurebyte.models.tile import TileSpec
 from featurebyte.query_graph.graph import GlobalQueryGraph
+from featurebyte.query_graph.sql.builder import clear_sql_node_cache
 from featurebyte.routes.lazy_app_container import LazyAppContainer
 from featurebyte.routes.registry import app_container_config
 from featurebyte.schema.task import TaskStatus
@@ -63,6 +64,14 @@ pytest.register_assert_rewrite("tests.unit.routes.base")
 _ = [config_file_fixture, config_fixture, mock_config_path_env_fixture]
 
 
+@pytest.fixture(autouse=True)
+def clear_sql_node_cache_fixture():
+    """Clear the process level SQLNode cache so that cached SQL does not leak between tests"""
+    clear_sql_node_cache()
+    yield
+    clear_sql_node_cache()
+
+
 @pytest.fixture(name="mock_api_object_cache")
 def mock_api_object_cache_fixture():
     """Mock api object cache so that the time-to-live period is 0"""
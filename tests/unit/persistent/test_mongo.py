@@ -470,3 +470,53 @@ def test_check_mongo_persistent_is_not_shared():
     persistent1 = get_persistent()
     persistent2 = get_persistent()
     assert id(persistent1) != id(persistent2)
+
+
+@pytest.mark.parametrize("sort_by", ["_id", "value", "nested.value"])
+@pytest.mark.parametrize("sort_dir", ["asc", "desc"])
+@pytest.mark.asyncio
+async def test_find_after(mongo_persistent, sort_by, sort_dir):
+    """
+    Test finding documents page by page using keyset pagination
+    """
+    persistent, client = mongo_persistent
+    values = [3, 1, None, 2, 1, None, 3, 1]
+    documents = [
+        {"_id": ObjectId(), "value": value, "nested": {"value": value}} for value in values
+    ]
+    documents.append({"_id": ObjectId()})  # document without the sort key
+    await client["test"]["data"].insert_many(documents)
+
+    # keyset pages should follow the same order as find
+    expected_docs, _ = await persistent.find(
+        collection_name="data", query_filter={}, sort_by=sort_by, sort_dir=sort_dir
+    )
+    docs, start_after = [], None
+    with patch.object(persistent._db["data"], "count_documents") as mock_count:
+        while True:
+            page_docs = await persistent.find_after(
+                collection_name="data",
+                query_filter={},
+                sort_by=sort_by,
+                sort_dir=sort_dir,
+                page_size=2,
+                start_after=start_after,
+            )
+            docs.extend(page_docs)
+            if len(page_docs) < 2:
+                break
+            start_after = page_docs[-1]
+    assert docs == expected_docs
+    assert len(docs) == len(documents)
+    mock_count.assert_not_called()
+
+    # query filter is combined with the keyset condition
+    docs = await persistent.find_after(
+        collection_name="data",
+        query_filter={"value": 1, "$and": [{"nested.value": 1}]},
+        sort_by=sort_by,
+        sort_dir=sort_dir,
+        page_size=10,
+        start_after=expected_docs[0],
+    )
+    assert docs == [doc for doc in expected_docs[1:] if doc.get("value") == 1]
@@ -35,13 +35,13 @@ def input_details_fixture(request):
     (not API objects).
 
     To obtain query graph fixtures with a different source type, indirect parametrize this fixture
-    with the table source type name ("snowflake" or "databricks"). Parametrization of this fixture is
-    optional; the default value is "snowflake".
+    with the table source type name ("snowflake", "databricks" or "duckdb"). Parametrization of this
+    fixture is optional; the default value is "snowflake".
     """
     kind = "snowflake"
     if hasattr(request, "param"):
         kind = request.param
-    assert kind in {"snowflake", "databricks"}
+    assert kind in {"snowflake", "databricks", "duckdb"}
     if kind == "snowflake":
         input_details = {
             "table_details": {
@@ -59,6 +59,18 @@ def input_details_fixture(request):
                 },
             },
         }
+    elif kind == "duckdb":
+        input_details = {
+            "table_details": {
+                "database_name": "db",
+                "schema_name": "public",
+                "table_name": "event_table",
+            },
+            "feature_store_details": {
+                "type": "duckdb",
+                "details": {"database_path": ":memory:"},
+            },
+        }
     else:
         input_details = {
             "table_details": {
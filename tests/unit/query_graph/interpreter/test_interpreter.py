@@ -12,6 +12,7 @@ from featurebyte.query_graph.enum import NodeOutputType, NodeType
 from featurebyte.query_graph.sql.builder import SQLOperationGraph
 from featurebyte.query_graph.sql.common import SQLType
 from featurebyte.query_graph.sql.interpreter import GraphInterpreter
+from featurebyte.session.duckdb import DuckDBSession
 
 
 def test_graph_interpreter_super_simple(simple_graph):
@@ -229,11 +230,54 @@ def test_graph_interpreter_tile_gen(query_graph_with_groupby, groupby_node_aggre
         "frequency": 3600,
         "blind_spot": 900,
         "windows": ["2h", "48h"],
+        "cumulative_tile_value_columns": [],
         "serving_names": ["CUSTOMER_ID"],
         "value_by_column": None,
     }
 
 
+@pytest.mark.parametrize("input_details", ["duckdb"], indirect=True)
+@pytest.mark.asyncio
+async def test_graph_interpreter_tile_gen__duckdb(query_graph_with_groupby):
+    """Test tile building SQL can be executed end to end using DuckDBSession"""
+    interpreter = GraphInterpreter(query_graph_with_groupby, SourceType.DUCKDB)
+    groupby_node = query_graph_with_groupby.get_node_by_name("groupby_1")
+    tile_gen_sqls = interpreter.construct_tile_gen_sql(groupby_node, is_on_demand=False)
+    assert len(tile_gen_sqls) == 1
+    info = tile_gen_sqls[0]
+    aggregation_id = groupby_node.parameters.aggregation_id.split("_")[1]
+
+    session = DuckDBSession(database_path=":memory:")
+    await session.execute_query("ATTACH ':memory:' AS db")
+    await session.execute_query("CREATE SCHEMA db.public")
+    await session.execute_query(
+        "CREATE TABLE db.public.event_table (ts TIMESTAMP, cust_id BIGINT, a DOUBLE, b DOUBLE)"
+    )
+    await session.execute_query(
+        """
+        INSERT INTO db.public.event_table VALUES
+          ('2022-01-01 10:20:00', 1, 1.0, 2.0),
+          ('2022-01-01 10:40:00', 1, 3.0, 4.0),
+          ('2022-01-01 11:20:00', 1, 5.0, 6.0),
+          ('2022-01-01 10:20:00', 2, 7.0, 8.0)
+        """
+    )
+    tile_sql = info.sql.replace(
+        InternalName.TILE_START_DATE_SQL_PLACEHOLDER, "'2022-01-01 09:15:00'"
+    ).replace(InternalName.TILE_END_DATE_SQL_PLACEHOLDER, "'2022-01-01 12:15:00'")
+    df_tiles = await session.execute_query(tile_sql)
+    # unlike Snowflake, DuckDB preserves the case of unquoted identifiers in the result
+    df_tiles = df_tiles.sort_values(["cust_id", "index"]).reset_index(drop=True)
+    sum_column = f"sum_value_avg_{aggregation_id}"
+    count_column = f"count_value_avg_{aggregation_id}"
+    assert df_tiles[["index", "cust_id", sum_column, count_column]].to_dict("list") == {
+        "index": [455842, 455843, 455842],
+        "cust_id": [1, 1, 2],
+        sum_column: [4.0, 5.0, 7.0],
+        count_column: [2, 1, 1],
+    }
+
+
 def test_graph_interpreter_on_demand_tile_gen(
     query_graph_with_groupby, groupby_node_aggregation_id
 ):
@@ -311,6 +355,7 @@ def test_graph_interpreter_on_demand_tile_gen(
         "frequency": 3600,
         "blind_spot": 900,
         "windows": ["2h", "48h"],
+        "cumulative_tile_value_columns": [],
         "serving_names": ["CUSTOMER_ID"],
         "value_by_column": None,
     }
@@ -385,6 +430,7 @@ def test_graph_interpreter_tile_gen_with_category(query_graph_with_category_grou
         "frequency": 3600,
         "blind_spot": 900,
         "windows": ["2h", "48h"],
+        "cumulative_tile_value_columns": [],
         "serving_names": ["CUSTOMER_ID"],
         "value_by_column": "product_type",
     }
@@ -425,6 +471,7 @@ def test_graph_interpreter_on_demand_tile_gen_two_groupby(
         "frequency": 3600,
         "blind_spot": 900,
         "windows": ["2h", "48h"],
+        "cumulative_tile_value_columns": [],
     }
     expected = textwrap.dedent(
         f"""
@@ -490,6 +537,7 @@ def test_graph_interpreter_on_demand_tile_gen_two_groupby(
         "frequency": 3600,
         "blind_spot": 900,
         "windows": ["7d"],
+        "cumulative_tile_value_columns": [],
     }
     expected = textwrap.dedent(
         f"""
@@ -0,0 +1,122 @@
+"""
+Tests for the SQLNode cache in SQLOperationGraph
+"""
+from unittest.mock import patch
+
+import pytest
+
+from featurebyte.enum import SourceType
+from featurebyte.query_graph.enum import NodeOutputType, NodeType
+from featurebyte.query_graph.sql import builder
+from featurebyte.query_graph.sql.builder import (
+    SQLOperationGraph,
+    clear_sql_node_cache,
+    set_sql_node_cache_size,
+)
+from featurebyte.query_graph.sql.common import SQLType, sql_to_string
+
+
+def build_sql_node(graph, node, **kwargs):
+    """
+    Helper to build a SQLNode using SQLOperationGraph
+    """
+    params = {"sql_type": SQLType.MATERIALIZE, "source_type": SourceType.SNOWFLAKE}
+    params.update(kwargs)
+    return SQLOperationGraph(graph, **params).build(node)
+
+
+def test_build_same_graph_twice__cache_hit(simple_graph):
+    """
+    Test building the same graph twice returns the cached SQLNode
+    """
+    graph, node = simple_graph
+    sql_node_1 = build_sql_node(graph, node)
+    sql_node_2 = build_sql_node(graph, node)
+    assert sql_node_2 is sql_node_1
+    assert sql_to_string(sql_node_2.sql, SourceType.SNOWFLAKE) == sql_to_string(
+        build_sql_node(graph, node, use_cache=False).sql, SourceType.SNOWFLAKE
+    )
+
+
+def test_cached_sql_node__graph_reference_released(simple_graph):
+    """
+    Test cached SQLNode does not keep a reference to the query graph
+    """
+    graph, node = simple_graph
+    sql_node = build_sql_node(graph, node)
+    assert sql_node.context.graph is not graph
+    assert sql_node.context.input_sql_nodes == []
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"sql_type": SQLType.AGGREGATION},
+        {"source_type": SourceType.SPARK},
+        {"to_filter_scd_by_current_flag": True},
+    ],
+)
+def test_build_with_different_options__cache_miss(simple_graph, kwargs):
+    """
+    Test building with different SQLType, source_type or to_filter_scd_by_current_flag misses the
+    cache
+    """
+    graph, node = simple_graph
+    sql_node_1 = build_sql_node(graph, node)
+    sql_node_2 = build_sql_node(graph, node, **kwargs)
+    assert sql_node_2 is not sql_node_1
+
+
+def test_build_with_different_node_parameters__cache_miss(graph, node_input):
+    """
+    Test changing a node parameter misses the cache
+    """
+    sql_nodes = []
+    for value in [123, 456]:
+        assign = graph.add_operation(
+            node_type=NodeType.ASSIGN,
+            node_params={"name": "x", "value": value},
+            node_output_type=NodeOutputType.FRAME,
+            input_nodes=[node_input],
+        )
+        sql_nodes.append(build_sql_node(graph, assign))
+    assert sql_nodes[0] is not sql_nodes[1]
+    assert "123" in sql_to_string(sql_nodes[0].sql, SourceType.SNOWFLAKE)
+    assert "456" in sql_to_string(sql_nodes[1].sql, SourceType.SNOWFLAKE)
+
+
+def test_build_without_cache(simple_graph):
+    """
+    Test use_cache=False neither reads from nor writes to the cache
+    """
+    graph, node = simple_graph
+    sql_node_1 = build_sql_node(graph, node, use_cache=False)
+    assert len(builder.SQL_NODE_CACHE) == 0
+    sql_node_2 = build_sql_node(graph, node, use_cache=False)
+    assert sql_node_2 is not sql_node_1
+    assert sql_node_2.context.graph is graph
+
+
+def test_clear_sql_node_cache(simple_graph):
+    """
+    Test clear_sql_node_cache removes cached SQLNode objects
+    """
+    graph, node = simple_graph
+    sql_node_1 = build_sql_node(graph, node)
+    assert len(builder.SQL_NODE_CACHE) > 0
+    clear_sql_node_cache()
+    assert len(builder.SQL_NODE_CACHE) == 0
+    sql_node_2 = build_sql_node(graph, node)
+    assert sql_node_2 is not sql_node_1
+
+
+def test_set_sql_node_cache_size(simple_graph):
+    """
+    Test the maximum number of cached SQLNode objects can be configured
+    """
+    graph, node = simple_graph
+    with patch.object(builder, "SQL_NODE_CACHE", builder.SQL_NODE_CACHE):
+        set_sql_node_cache_size(1)
+        build_sql_node(graph, node)
+        assert builder.SQL_NODE_CACHE.maxsize == 1
+        assert len(builder.SQL_NODE_CACHE) == 1
@@ -0,0 +1,292 @@
+"""
+Test window aggregator
+"""
+from __future__ import annotations
+
+import copy
+import math
+
+import pytest
+from bson import ObjectId
+from sqlglot import select
+
+from featurebyte.enum import DBVarType, InternalName, SourceType
+from featurebyte.query_graph.sql.aggregator.window import WindowAggregator
+from featurebyte.query_graph.sql.common import construct_cte_sql, sql_to_string
+from featurebyte.query_graph.sql.specs import TileBasedAggregationSpec
+from tests.util.helper import assert_equal_with_expected_fixture
+
+
+@pytest.fixture(name="agg_spec_sum_90d")
+def agg_spec_sum_90d_fixture(expected_pruned_graph_and_node_1):
+    """Fixture for an AggregationSpec with 90 days sum on 5 minutes tiles"""
+    return TileBasedAggregationSpec(
+        window=90 * 86400,
+        frequency=300,
+        blind_spot=120,
+        time_modulo_frequency=60,
+        tile_table_id="TILE_SUM",
+        aggregation_id="sum_1234",
+        keys=["CUST_ID"],
+        serving_names=["CID"],
+        serving_names_mapping=None,
+        value_by=None,
+        merge_expr="SUM(value_sum_1234)",
+        feature_name="amount_sum_90d",
+        is_order_dependent=False,
+        tile_value_columns=["value_sum_1234"],
+        entity_ids=[ObjectId()],
+        dtype=DBVarType.FLOAT,
+        tile_value_rollup_funcs={"value_sum_1234": "SUM"},
+        **expected_pruned_graph_and_node_1,
+    )
+
+
+def evaluate_index_expr(expr, first_tile_index, last_tile_index):
+    """Evaluate a tile index expression given the tile indices of a request"""
+    expr = (
+        expr.replace(f"REQ.{InternalName.FIRST_TILE_INDEX}", str(first_tile_index))
+        .replace(f"REQ.{InternalName.LAST_TILE_INDEX}", str(last_tile_index))
+        .replace("CEIL", "math.ceil")
+        .replace("FLOOR", "math.floor")
+    )
+    return eval(expr, {"math": math})  # pylint: disable=eval-used
+
+
+@pytest.mark.parametrize("last_tile_index", [1000000, 1000001, 1000287, 1000288, 1003456])
+@pytest.mark.parametrize(
+    "num_tiles, rollup_factors",
+    [(25920, []), (25920, [12]), (25920, [12, 288]), (48, [12]), (576, [12, 288])],
+)
+def test_get_range_join_segments(last_tile_index, num_tiles, rollup_factors):
+    """
+    Test the segments cover exactly the tiles in the window without overlap
+    """
+    segments = WindowAggregator.get_range_join_segments(
+        tile_table_id="TILE_SUM", num_tiles=num_tiles, rollup_factors=rollup_factors
+    )
+    assert len(segments) == 1 + 2 * len(rollup_factors)
+
+    first_tile_index = last_tile_index - num_tiles
+    factor_by_table_name = {"TILE_SUM": 1}
+    for factor in rollup_factors:
+        factor_by_table_name[f'"TILE_SUM_ROLLUP_{factor}"'] = factor
+
+    covered_tile_indices = []
+    num_joined_tiles = 0
+    for segment in segments:
+        factor = factor_by_table_name[segment.table_name]
+        first = evaluate_index_expr(segment.first_index_expr, first_tile_index, last_tile_index)
+        last = evaluate_index_expr(segment.last_index_expr, first_tile_index, last_tile_index)
+        assert last - first <= segment.max_num_tiles
+        num_joined_tiles += max(last - first, 0)
+        for index in range(first, last):
+            covered_tile_indices.extend(range(index * factor, (index + 1) * factor))
+
+    assert sorted(covered_tile_indices) == list(range(first_tile_index, last_tile_index))
+    if rollup_factors and num_tiles > 1000:
+        # long windows join with orders of magnitude fewer tiles
+        assert num_joined_tiles < num_tiles / 10
+
+
+@pytest.mark.parametrize(
+    "tile_rollup_resolutions, expected",
+    [
+        ([], []),
+        ([3600, 86400], [12, 288]),
+        ([86400, 3600], [12, 288]),
+        ([3600, 5400, 86400], [12, 288]),
+        ([450, 3600], [12]),
+        ([3600, 86400 * 60], [12]),
+    ],
+)
+def test_get_tile_rollup_factors(agg_spec_sum_90d, tile_rollup_resolutions, expected):
+    """
+    Test rollup factors are derived from resolutions compatible with the feature job setting
+    """
+    aggregator = WindowAggregator(
+        source_type=SourceType.SNOWFLAKE, tile_rollup_resolutions=tile_rollup_resolutions
+    )
+    assert aggregator.get_tile_rollup_factors([agg_spec_sum_90d]) == expected
+
+
+def test_get_tile_rollup_factors__not_supported(agg_spec_sum_90d):
+    """
+    Test tiles are not rolled up for order dependent aggregations
+    """
+    aggregator = WindowAggregator(
+        source_type=SourceType.SNOWFLAKE, tile_rollup_resolutions=[3600, 86400]
+    )
+    agg_spec = copy.deepcopy(agg_spec_sum_90d)
+    agg_spec.is_order_dependent = True
+    agg_spec.tile_value_rollup_funcs = None
+    assert aggregator.get_tile_rollup_factors([agg_spec]) == []
+
+
+def test_window_aggregator__tile_rollup(agg_spec_sum_90d, update_fixtures):
+    """
+    Test window aggregation SQL with rolled up tiles
+    """
+    aggregator = WindowAggregator(
+        source_type=SourceType.SNOWFLAKE, tile_rollup_resolutions=[3600, 86400]
+    )
+    aggregator.update(agg_spec_sum_90d)
+    result = aggregator.update_aggregation_table_expr(
+        select("a", "b", "c").from_("REQUEST_TABLE"), "POINT_IN_TIME", ["a", "b", "c"], 0
+    )
+    cte_statements = aggregator.get_common_table_expressions("REQUEST_TABLE")
+    assert [name.sql() for name, _ in cte_statements] == [
+        '"REQUEST_TABLE_W7776000_F300_BS120_M60_CID"',
+        '"TILE_SUM_ROLLUP_12"',
+        '"TILE_SUM_ROLLUP_288"',
+    ]
+    expr = construct_cte_sql(cte_statements).select("*").from_(result.updated_table_expr.subquery())
+    assert_equal_with_expected_fixture(
+        sql_to_string(expr, source_type=SourceType.SNOWFLAKE),
+        "tests/fixtures/expected_window_aggregator_tile_rollup.sql",
+        update_fixture=update_fixtures,
+    )
+
+
+@pytest.fixture(name="agg_specs_sum_ladder")
+def agg_specs_sum_ladder_fixture(agg_spec_sum_90d):
+    """Fixture for AggregationSpecs with 1d, 7d and 30d sum on the same tile table"""
+    agg_specs = []
+    for num_days in [1, 7, 30]:
+        agg_spec = copy.deepcopy(agg_spec_sum_90d)
+        agg_spec.window = num_days * 86400
+        agg_spec.feature_name = f"amount_sum_{num_days}d"
+        agg_specs.append(agg_spec)
+    return agg_specs
+
+
+def test_construct_window_conditional_merge_expr(agg_spec_sum_90d):
+    """
+    Test merge expression restricted to the tiles within the window
+    """
+    agg_spec = copy.deepcopy(agg_spec_sum_90d)
+    agg_spec.window = 86400
+    agg_spec.merge_expr = "SUM(sum_value_avg_1234) / SUM(count_value_avg_1234)"
+    agg_spec.tile_value_columns = ["sum_value_avg_1234", "count_value_avg_1234"]
+    assert WindowAggregator.construct_window_conditional_merge_expr(agg_spec) == (
+        'SUM(CASE WHEN INDEX >= "__FB_LAST_TILE_INDEX" - 288 THEN sum_value_avg_1234 END) / '
+        'SUM(CASE WHEN INDEX >= "__FB_LAST_TILE_INDEX" - 288 THEN count_value_avg_1234 END)'
+    )
+
+
+@pytest.mark.parametrize("shared_window_range_join", [False, True])
+def test_get_grouped_aggregation_specs(agg_specs_sum_ladder, shared_window_range_join):
+    """
+    Test windows on the same tile table are grouped together when shared range join is enabled
+    """
+    aggregator = WindowAggregator(
+        source_type=SourceType.SNOWFLAKE,
+        tile_rollup_resolutions=[],
+        shared_window_range_join=shared_window_range_join,
+    )
+    order_dependent_agg_spec = copy.deepcopy(agg_specs_sum_ladder[0])
+    order_dependent_agg_spec.tile_table_id = "TILE_LATEST"
+    order_dependent_agg_spec.is_order_dependent = True
+    for agg_spec in agg_specs_sum_ladder + [order_dependent_agg_spec]:
+        aggregator.update(agg_spec)
+
+    grouped_windows = [
+        [agg_spec.window for agg_spec in agg_specs]
+        for agg_specs in aggregator.get_grouped_aggregation_specs()
+    ]
+    if shared_window_range_join:
+        assert grouped_windows == [[86400, 604800, 2592000], [86400]]
+    else:
+        assert grouped_windows == [[86400], [604800], [2592000], [86400]]
+
+
+def test_window_aggregator__shared_window_range_join(agg_specs_sum_ladder, update_fixtures):
+    """
+    Test window aggregation SQL with a range join shared by different windows
+    """
+    aggregator = WindowAggregator(
+        source_type=SourceType.SNOWFLAKE,
+        tile_rollup_resolutions=[],
+        shared_window_range_join=True,
+    )
+    for agg_spec in agg_specs_sum_ladder:
+        aggregator.update(agg_spec)
+    result = aggregator.update_aggregation_table_expr(
+        select("a", "b", "c").from_("REQUEST_TABLE"), "POINT_IN_TIME", ["a", "b", "c"], 0
+    )
+    cte_statements = aggregator.get_common_table_expressions("REQUEST_TABLE")
+    assert [name.sql() for name, _ in cte_statements] == [
+        '"REQUEST_TABLE_W2592000_F300_BS120_M60_CID"'
+    ]
+    expr = construct_cte_sql(cte_statements).select("*").from_(result.updated_table_expr.subquery())
+    assert_equal_with_expected_fixture(
+        sql_to_string(expr, source_type=SourceType.SNOWFLAKE),
+        "tests/fixtures/expected_window_aggregator_shared_range_join.sql",
+        update_fixture=update_fixtures,
+    )
+
+
+@pytest.mark.parametrize(
+    "tile_value_rollup_funcs, is_order_dependent, expected",
+    [
+        ({"value_sum_1234": "SUM"}, False, True),
+        ({"value_max_1234": "MAX"}, False, False),
+        (None, True, False),
+    ],
+)
+def test_is_cumulative_tiles_applicable(
+    agg_spec_sum_90d, tile_value_rollup_funcs, is_order_dependent, expected
+):
+    """
+    Test cumulative tiles are only used for additive aggregations
+    """
+    aggregator = WindowAggregator(source_type=SourceType.SNOWFLAKE, cumulative_tiles=True)
+    agg_spec = copy.deepcopy(agg_spec_sum_90d)
+    agg_spec.tile_value_rollup_funcs = tile_value_rollup_funcs
+    agg_spec.is_order_dependent = is_order_dependent
+    assert aggregator.is_cumulative_tiles_applicable([agg_spec]) is expected
+
+    aggregator = WindowAggregator(source_type=SourceType.SNOWFLAKE, cumulative_tiles=False)
+    assert aggregator.is_cumulative_tiles_applicable([agg_spec]) is False
+
+
+def test_window_aggregator__cumulative_tiles(agg_spec_sum_90d, update_fixtures):
+    """
+    Test window aggregation SQL using cumulative tile tables
+    """
+    aggregator = WindowAggregator(
+        source_type=SourceType.SNOWFLAKE,
+        tile_rollup_resolutions=[3600, 86400],
+        shared_window_range_join=True,
+        cumulative_tiles=True,
+    )
+    agg_spec_avg_90d = copy.deepcopy(agg_spec_sum_90d)
+    agg_spec_avg_90d.aggregation_id = "avg_5678"
+    agg_spec_avg_90d.feature_name = "amount_avg_90d"
+    agg_spec_avg_90d.merge_expr = "SUM(sum_value_avg_5678) / SUM(count_value_avg_5678)"
+    agg_spec_avg_90d.tile_value_columns = ["sum_value_avg_5678", "count_value_avg_5678"]
+    agg_spec_avg_90d.tile_value_rollup_funcs = {
+        "sum_value_avg_5678": "SUM",
+        "count_value_avg_5678": "SUM",
+    }
+    aggregator.update(agg_spec_sum_90d)
+    aggregator.update(agg_spec_avg_90d)
+
+    queries = aggregator.get_window_aggregations("POINT_IN_TIME")
+    assert [query.column_names for query in queries] == [
+        [agg_spec_sum_90d.agg_result_name],
+        [agg_spec_avg_90d.agg_result_name],
+    ]
+    result = aggregator.update_aggregation_table_expr(
+        select("a", "b", "c").from_("REQUEST_TABLE"), "POINT_IN_TIME", ["a", "b", "c"], 0
+    )
+    cte_statements = aggregator.get_common_table_expressions("REQUEST_TABLE")
+    assert [name.sql() for name, _ in cte_statements] == [
+        '"REQUEST_TABLE_W7776000_F300_BS120_M60_CID"'
+    ]
+    expr = construct_cte_sql(cte_statements).select("*").from_(result.updated_table_expr.subquery())
+    assert_equal_with_expected_fixture(
+        sql_to_string(expr, source_type=SourceType.SNOWFLAKE),
+        "tests/fixtures/expected_window_aggregator_cumulative_tiles.sql",
+        update_fixture=update_fixtures,
+    )
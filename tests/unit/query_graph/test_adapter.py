@@ -71,6 +71,10 @@ def test_escape_quote_char__spark(query, expected):
             SourceType.DATABRICKS,
             "CREATE TABLE `db1`.`schema1`.`table1` USING DELTA TBLPROPERTIES ('delta.columnMapping.mode'='name', 'delta.minReaderVersion'='2', 'delta.minWriterVersion'='5') AS SELECT * FROM A",
         ),
+        (
+            SourceType.DUCKDB,
+            'CREATE TABLE "db1"."schema1"."table1" AS SELECT * FROM A',
+        ),
     ],
 )
 def test_create_table_as(source_type, expected):
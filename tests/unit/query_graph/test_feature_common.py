@@ -44,6 +44,10 @@ def test_aggregation_spec__from_groupby_query_node(
                 f"sum_value_avg_{groupby_node_aggregation_id}",
                 f"count_value_avg_{groupby_node_aggregation_id}",
             ],
+            tile_value_rollup_funcs={
+                f"sum_value_avg_{groupby_node_aggregation_id}": "SUM",
+                f"count_value_avg_{groupby_node_aggregation_id}": "SUM",
+            },
             entity_ids=[ObjectId("637516ebc9c18f5a277a78db")],
             dtype=DBVarType.FLOAT,
             **expected_pruned_graph_and_node_1,
@@ -69,6 +73,10 @@ def test_aggregation_spec__from_groupby_query_node(
                 f"sum_value_avg_{groupby_node_aggregation_id}",
                 f"count_value_avg_{groupby_node_aggregation_id}",
             ],
+            tile_value_rollup_funcs={
+                f"sum_value_avg_{groupby_node_aggregation_id}": "SUM",
+                f"count_value_avg_{groupby_node_aggregation_id}": "SUM",
+            },
             entity_ids=[ObjectId("637516ebc9c18f5a277a78db")],
             dtype=DBVarType.FLOAT,
             **expected_pruned_graph_and_node_2,
@@ -118,6 +126,10 @@ def test_aggregation_spec__override_serving_names(
                 f"sum_value_avg_{groupby_node_aggregation_id}",
                 f"count_value_avg_{groupby_node_aggregation_id}",
             ],
+            tile_value_rollup_funcs={
+                f"sum_value_avg_{groupby_node_aggregation_id}": "SUM",
+                f"count_value_avg_{groupby_node_aggregation_id}": "SUM",
+            },
             entity_ids=[ObjectId("637516ebc9c18f5a277a78db")],
             dtype=DBVarType.FLOAT,
             **expected_pruned_graph_and_node_1,
@@ -143,6 +155,10 @@ def test_aggregation_spec__override_serving_names(
                 f"sum_value_avg_{groupby_node_aggregation_id}",
                 f"count_value_avg_{groupby_node_aggregation_id}",
             ],
+            tile_value_rollup_funcs={
+                f"sum_value_avg_{groupby_node_aggregation_id}": "SUM",
+                f"count_value_avg_{groupby_node_aggregation_id}": "SUM",
+            },
             entity_ids=[ObjectId("637516ebc9c18f5a277a78db")],
             dtype=DBVarType.FLOAT,
             **expected_pruned_graph_and_node_2,
@@ -260,6 +260,10 @@ def test_feature_execution_planner(
                     f"sum_value_avg_{groupby_node_aggregation_id}",
                     f"count_value_avg_{groupby_node_aggregation_id}",
                 ],
+                tile_value_rollup_funcs={
+                    f"sum_value_avg_{groupby_node_aggregation_id}": "SUM",
+                    f"count_value_avg_{groupby_node_aggregation_id}": "SUM",
+                },
                 entity_ids=[ObjectId("637516ebc9c18f5a277a78db")],
                 dtype=DBVarType.FLOAT,
                 **expected_pruned_graph_and_node_1,
@@ -287,6 +291,10 @@ def test_feature_execution_planner(
                     f"sum_value_avg_{groupby_node_aggregation_id}",
                     f"count_value_avg_{groupby_node_aggregation_id}",
                 ],
+                tile_value_rollup_funcs={
+                    f"sum_value_avg_{groupby_node_aggregation_id}": "SUM",
+                    f"count_value_avg_{groupby_node_aggregation_id}": "SUM",
+                },
                 entity_ids=[ObjectId("637516ebc9c18f5a277a78db")],
                 dtype=DBVarType.FLOAT,
                 **expected_pruned_graph_and_node_2,
@@ -351,6 +359,10 @@ def test_feature_execution_planner__serving_names_mapping(
                     f"sum_value_avg_{groupby_node_aggregation_id}",
                     f"count_value_avg_{groupby_node_aggregation_id}",
                 ],
+                tile_value_rollup_funcs={
+                    f"sum_value_avg_{groupby_node_aggregation_id}": "SUM",
+                    f"count_value_avg_{groupby_node_aggregation_id}": "SUM",
+                },
                 entity_ids=[ObjectId("637516ebc9c18f5a277a78db")],
                 dtype=DBVarType.FLOAT,
                 **expected_pruned_graph_and_node_1,
@@ -378,6 +390,10 @@ def test_feature_execution_planner__serving_names_mapping(
                     f"sum_value_avg_{groupby_node_aggregation_id}",
                     f"count_value_avg_{groupby_node_aggregation_id}",
                 ],
+                tile_value_rollup_funcs={
+                    f"sum_value_avg_{groupby_node_aggregation_id}": "SUM",
+                    f"count_value_avg_{groupby_node_aggregation_id}": "SUM",
+                },
                 entity_ids=[ObjectId("637516ebc9c18f5a277a78db")],
                 dtype=DBVarType.FLOAT,
                 **expected_pruned_graph_and_node_2,
@@ -37,7 +37,7 @@ from featurebyte.query_graph.sql.ast.literal import make_literal_value
 from featurebyte.query_graph.sql.ast.string import IsStringNode
 from featurebyte.query_graph.sql.ast.unary import CastNode, LagNode
 from featurebyte.query_graph.sql.builder import SQLNodeContext
-from featurebyte.query_graph.sql.common import SQLType
+from featurebyte.query_graph.sql.common import SQLType, sql_to_string
 
 
 def make_context(node_type=None, parameters=None, input_sql_nodes=None, sql_type=None):
@@ -585,3 +585,18 @@ def test_make_literal_value(value, expected_sql):
     """
     expr = make_literal_value(value)
     assert expr.sql() == expected_sql
+
+
+@pytest.mark.parametrize(
+    "pretty, expected_sql",
+    [
+        (True, 'SELECT\n  "a",\n  "b"\nFROM "tab"\nWHERE\n  "a" > 1'),
+        (False, 'SELECT "a", "b" FROM "tab" WHERE "a" > 1'),
+    ],
+)
+def test_sql_to_string__pretty(pretty, expected_sql):
+    """
+    Test sql_to_string with and without pretty formatting
+    """
+    expr = parse_one('SELECT "a", "b" FROM "tab" WHERE "a" > 1')
+    assert sql_to_string(expr, SourceType.SNOWFLAKE, pretty=pretty) == expected_sql
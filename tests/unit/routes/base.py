@@ -422,6 +422,42 @@ class BaseApiTestSuite:
         )
         assert response_page_size_boundary.status_code == HTTPStatus.OK
 
+    def test_list_200__cursor(self, test_api_client_persistent, create_multiple_success_responses):
+        """Test list using keyset pagination (success, multiple)"""
+        test_api_client, _ = test_api_client_persistent
+        _ = create_multiple_success_responses
+        params = {"sort_dir": "asc", "sort_by": "name", "page_size": 2}
+        response = test_api_client.get(self.base_route, params={**params, "page_size": 100})
+        expected_names = [elem["name"] for elem in response.json()["data"]]
+
+        # iterate pages using the next cursor of each page
+        names, cursor, num_pages = [], "", 0
+        while cursor is not None:
+            response = test_api_client.get(self.base_route, params={**params, "cursor": cursor})
+            assert response.status_code == HTTPStatus.OK, response.json()
+            response_dict = response.json()
+            assert response_dict["total"] is None
+            assert len(response_dict["data"]) <= 2
+            names.extend(elem["name"] for elem in response_dict["data"])
+            cursor = response_dict["next_cursor"]
+            num_pages += 1
+        assert names == expected_names
+        assert num_pages == (len(expected_names) + 1) // 2
+
+        # cursor is only valid for the sort key used to create it
+        response = test_api_client.get(self.base_route, params={**params, "cursor": ""})
+        next_cursor = response.json()["next_cursor"]
+        response = test_api_client.get(
+            self.base_route, params={**params, "sort_by": "created_at", "cursor": next_cursor}
+        )
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.json()["detail"] == (
+            'Cursor was created for sort_by "name" but sort_by is "created_at".'
+        )
+        response = test_api_client.get(self.base_route, params={**params, "cursor": "abc"})
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert response.json()["detail"] == 'Invalid cursor "abc".'
+
     def test_list_422(
         self,
         test_api_client_persistent,
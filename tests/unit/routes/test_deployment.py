@@ -132,6 +132,7 @@ class TestDeploymentApi(BaseAsyncApiTestSuite, BaseCatalogApiTestSuite):
             "page": 1,
             "page_size": 10,
             "total": 3,
+            "next_cursor": None,
         }
 
     def test_deployment_summary_200(
@@ -163,6 +164,7 @@ class TestDeploymentApi(BaseAsyncApiTestSuite, BaseCatalogApiTestSuite):
             "page": 1,
             "page_size": 10,
             "total": 1,
+            "next_cursor": None,
             "data": [
                 {
                     "_id": deployment_id,
@@ -180,7 +182,13 @@ class TestDeploymentApi(BaseAsyncApiTestSuite, BaseCatalogApiTestSuite):
         del test_api_client.headers["active-catalog-id"]
         response = test_api_client.get("/deployment/all/?enabled=true")
         assert response.status_code == HTTPStatus.OK
-        assert response.json() == {"page": 1, "page_size": 10, "total": 0, "data": []}
+        assert response.json() == {
+            "page": 1,
+            "page_size": 10,
+            "total": 0,
+            "data": [],
+            "next_cursor": None,
+        }
 
         response = test_api_client.get("/deployment/all/")
         assert response.status_code == HTTPStatus.OK
@@ -199,7 +207,13 @@ class TestDeploymentApi(BaseAsyncApiTestSuite, BaseCatalogApiTestSuite):
             "/deployment/", headers={"active-catalog-id": str(catalog_id)}
         )
         assert response.status_code == HTTPStatus.OK
-        assert response.json() == {"page": 1, "page_size": 10, "total": 0, "data": []}
+        assert response.json() == {
+            "page": 1,
+            "page_size": 10,
+            "total": 0,
+            "data": [],
+            "next_cursor": None,
+        }
 
         response = test_api_client.get("/deployment/all/?enabled=true")
         assert response.status_code == HTTPStatus.OK
@@ -2,6 +2,7 @@
 Test for TaskStatus route
 """
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
@@ -60,6 +61,25 @@ class TestTaskStatusApi:
         assert response.status_code == HTTPStatus.NOT_FOUND
         assert response.json()["detail"] == f'Task (id: "{unknown_id}") not found.'
 
+    def test_update_200__revoke(self, api_client_persistent, task_status_id):
+        """Test update (revoke task)"""
+        test_api_client, _ = api_client_persistent
+        with patch("featurebyte.service.task_manager.TaskManager.revoke_task") as mock_revoke:
+            response = test_api_client.patch(
+                f"{self.base_route}/{task_status_id}", json={"revoke": True}
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["id"] == str(task_status_id)
+        mock_revoke.assert_called_once_with(task_id=str(task_status_id))
+
+    def test_update_404(self, api_client_persistent):
+        """Test update (not found)"""
+        test_api_client, _ = api_client_persistent
+        unknown_id = ObjectId()
+        response = test_api_client.patch(f"{self.base_route}/{unknown_id}", json={"revoke": True})
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert response.json()["detail"] == f'Task (id: "{unknown_id}") not found.'
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("sort_dir", ["desc", "asc"])
     async def test_list_200(self, user_id, task_manager, api_client_persistent, sort_dir):
@@ -3,7 +3,6 @@ Tests for OnlineServingService
 """
 import json
 import os
-import textwrap
 from unittest.mock import Mock, patch
 
 import pandas as pd
@@ -16,6 +15,7 @@ from featurebyte.exception import FeatureListNotOnlineEnabledError, RequiredEnti
 from featurebyte.models.batch_request_table import BatchRequestTableModel
 from featurebyte.query_graph.model.common_table import TabularSource
 from featurebyte.query_graph.node.schema import TableDetails
+from tests.util.helper import assert_equal_with_expected_fixture
 
 
 @pytest.fixture
@@ -77,75 +77,13 @@ def mock_session_for_online_serving_fixture():
     )
 
 
-@pytest.fixture(name="expected_online_feature_query")
-def expected_online_feature_query_fixture():
-    """Expected query for online feature"""
-    # pylint: disable=line-too-long
-    return textwrap.dedent(
-        '''
-        WITH ONLINE_REQUEST_TABLE AS (
-          SELECT
-            REQ."cust_id",
-            SYSDATE() AS POINT_IN_TIME
-          FROM (
-            SELECT
-              1 AS "cust_id"
-          ) AS REQ
-        ), _FB_AGGREGATED AS (
-          SELECT
-            REQ."cust_id",
-            REQ."POINT_IN_TIME",
-            "T0"."_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481" AS "_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481"
-          FROM ONLINE_REQUEST_TABLE AS REQ
-          LEFT JOIN (
-            SELECT
-              "cust_id" AS "cust_id",
-              "_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481"
-            FROM (
-              SELECT
-                """cust_id""" AS "cust_id",
-                "'_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481'" AS "_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481"
-              FROM (
-                SELECT
-                  "cust_id",
-                  "AGGREGATION_RESULT_NAME",
-                  "VALUE"
-                FROM (
-                  SELECT
-                    R.*
-                  FROM (
-                    SELECT
-                      "AGGREGATION_RESULT_NAME",
-                      "LATEST_VERSION"
-                    FROM (VALUES
-                      ('_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481', _fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481_VERSION_PLACEHOLDER)) AS version_table("AGGREGATION_RESULT_NAME", "LATEST_VERSION")
-                  ) AS L
-                  INNER JOIN online_store_377553e5920dd2db8b17f21ddd52f8b1194a780c AS R
-                    ON R."AGGREGATION_RESULT_NAME" = L."AGGREGATION_RESULT_NAME"
-                    AND R."VERSION" = L."LATEST_VERSION"
-                )
-                WHERE
-                  "AGGREGATION_RESULT_NAME" IN ('_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481')
-              )   PIVOT(  MAX("VALUE") FOR "AGGREGATION_RESULT_NAME" IN ('_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481'))
-            )
-          ) AS T0
-            ON REQ."cust_id" = T0."cust_id"
-        )
-        SELECT
-          AGG."cust_id",
-          "_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481" AS "sum_30m"
-        FROM _FB_AGGREGATED AS AGG
-        '''
-    ).strip()
-
-
 @pytest.mark.asyncio
 async def test_feature_list_deployed(
     online_serving_service,
     deployed_feature_list,
     entity_serving_names,
     mock_session_for_online_serving,
-    expected_online_feature_query,
+    update_fixtures,
 ):
     """
     Test getting online features request for a valid feature list
@@ -166,7 +104,11 @@ async def test_feature_list_deployed(
     # Check query used
     assert len(mock_session_for_online_serving.execute_query.call_args_list) == 1
     args, _ = mock_session_for_online_serving.execute_query.call_args
-    assert args[0] == expected_online_feature_query
+    assert_equal_with_expected_fixture(
+        args[0],
+        "tests/fixtures/expected_online_feature_query.sql",
+        update_fixture=update_fixtures,
+    )
 
 
 @pytest.mark.asyncio
@@ -175,7 +117,7 @@ async def test_feature_list_deployed_with_output_table(
     deployed_feature_list,
     entity_serving_names,
     mock_session_for_online_serving,
-    expected_online_feature_query,
+    update_fixtures,
 ):
     """
     Test getting online features request with output table
@@ -197,11 +139,11 @@ async def test_feature_list_deployed_with_output_table(
 
     assert len(mock_session_for_online_serving.execute_query_long_running.call_args_list) == 1
     args, _ = mock_session_for_online_serving.execute_query_long_running.call_args
-    expected_with_output_table = (
-        'CREATE TABLE "output_db_name"."output_schema_name"."output_table_name" AS\n'
-        + expected_online_feature_query
+    assert_equal_with_expected_fixture(
+        args[0],
+        "tests/fixtures/expected_online_feature_query_with_output_table.sql",
+        update_fixture=update_fixtures,
     )
-    assert args[0] == expected_with_output_table
 
 
 @pytest_asyncio.fixture(name="batch_request_table")
@@ -234,6 +176,7 @@ async def test_feature_list_deployed_with_batch_request_table(
     deployed_feature_list,
     mock_session_for_online_serving,
     batch_request_table,
+    update_fixtures,
 ):
     """
     Test getting online features request with batch request table
@@ -251,62 +194,8 @@ async def test_feature_list_deployed_with_batch_request_table(
     assert len(mock_session_for_online_serving.execute_query.call_args_list) == 1
     args, _ = mock_session_for_online_serving.execute_query.call_args
 
-    # pylint: disable=line-too-long
-    expected = textwrap.dedent(
-        '''
-        WITH ONLINE_REQUEST_TABLE AS (
-          SELECT
-            REQ."cust_id",
-            SYSDATE() AS POINT_IN_TIME
-          FROM (
-            SELECT
-              *
-            FROM "req_db_name"."req_schema_name"."req_table_name"
-          ) AS REQ
-        ), _FB_AGGREGATED AS (
-          SELECT
-            REQ."cust_id",
-            REQ."POINT_IN_TIME",
-            "T0"."_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481" AS "_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481"
-          FROM ONLINE_REQUEST_TABLE AS REQ
-          LEFT JOIN (
-            SELECT
-              "cust_id" AS "cust_id",
-              "_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481"
-            FROM (
-              SELECT
-                """cust_id""" AS "cust_id",
-                "'_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481'" AS "_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481"
-              FROM (
-                SELECT
-                  "cust_id",
-                  "AGGREGATION_RESULT_NAME",
-                  "VALUE"
-                FROM (
-                  SELECT
-                    R.*
-                  FROM (
-                    SELECT
-                      "AGGREGATION_RESULT_NAME",
-                      "LATEST_VERSION"
-                    FROM (VALUES
-                      ('_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481', _fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481_VERSION_PLACEHOLDER)) AS version_table("AGGREGATION_RESULT_NAME", "LATEST_VERSION")
-                  ) AS L
-                  INNER JOIN online_store_377553e5920dd2db8b17f21ddd52f8b1194a780c AS R
-                    ON R."AGGREGATION_RESULT_NAME" = L."AGGREGATION_RESULT_NAME"
-                    AND R."VERSION" = L."LATEST_VERSION"
-                )
-                WHERE
-                  "AGGREGATION_RESULT_NAME" IN ('_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481')
-              )   PIVOT(  MAX("VALUE") FOR "AGGREGATION_RESULT_NAME" IN ('_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481'))
-            )
-          ) AS T0
-            ON REQ."cust_id" = T0."cust_id"
-        )
-        SELECT
-          AGG."cust_id",
-          "_fb_internal_window_w1800_sum_aed233b0e8a6e1c1e0d5427b126b03c949609481" AS "sum_30m"
-        FROM _FB_AGGREGATED AS AGG
-        '''
-    ).strip()
-    assert args[0] == expected
+    assert_equal_with_expected_fixture(
+        args[0],
+        "tests/fixtures/expected_online_feature_query_with_batch_request_table.sql",
+        update_fixture=update_fixtures,
+    )
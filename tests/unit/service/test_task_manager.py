@@ -193,3 +193,11 @@ async def test_task_manager__schedule_cron_task(task_manager, user_id, catalog):
     await task_manager.delete_periodic_task(periodic_task_id)
     with pytest.raises(DocumentNotFoundError):
         await task_manager.get_periodic_task(periodic_task_id)
+
+
+@pytest.mark.asyncio
+async def test_revoke_task(task_manager, celery):
+    """Test revoke task terminates the task in the worker"""
+    task_id = str(uuid4())
+    await task_manager.revoke_task(task_id=task_id)
+    celery.control.revoke.assert_called_once_with(task_id, terminate=True, signal="SIGUSR1")
@@ -5,7 +5,9 @@ from __future__ import annotations
 
 from typing import Any, OrderedDict
 
+import asyncio
 import collections
+import time
 from unittest.mock import Mock, patch
 
 import pandas as pd
@@ -15,6 +17,7 @@ from snowflake.connector.errors import ProgrammingError
 
 from featurebyte.enum import DBVarType, SourceType
 from featurebyte.session.base import BaseSchemaInitializer, BaseSession, MetadataSchemaInitializer
+from featurebyte.session.metadata_cache import MetadataCache
 
 CURRENT_WORKING_SCHEMA_VERSION_TEST = 1
 
@@ -51,12 +54,12 @@ def base_session_test_fixture():
         async def list_schemas(self, database_name: str | None = None) -> list[str]:
             return []
 
-        async def list_tables(
+        async def _list_tables(
             self, database_name: str | None = None, schema_name: str | None = None
         ) -> list[str]:
             return []
 
-        async def list_table_schema(
+        async def _list_table_schema(
             self,
             table_name: str | None,
             database_name: str | None = None,
@@ -233,3 +236,49 @@ async def test_should_update_schema__no_results_found(base_schema_initializer):
     ):
         should_update_schema = await base_schema_initializer.should_update_schema()
     assert should_update_schema
+
+
+@pytest.mark.asyncio
+async def test_get_async_query_stream__cancelled(base_session_test):
+    """
+    Test the running query is cancelled using the driver's cancel API when the caller is cancelled
+    """
+    session = base_session_test()
+    cursor = Mock(name="cursor")
+    cursor.execute.side_effect = lambda *args, **kwargs: time.sleep(1)
+    session._connection = Mock(cursor=Mock(return_value=cursor))
+
+    task = asyncio.create_task(session.execute_query("SELECT * FROM T"))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    cursor.cancel.assert_called_once()
+    cursor.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_list_table_schema__metadata_cache(base_session_test):
+    """
+    Test table schemas are cached and invalidated by DDL queries
+    """
+    session = base_session_test()
+    session.set_metadata_cache(MetadataCache(ttl=300))
+    table_schema = collections.OrderedDict([("a", DBVarType.INT)])
+    with patch.object(
+        base_session_test, "_list_table_schema", return_value=table_schema
+    ) as mock_list_table_schema, patch.object(
+        base_session_test, "_get_async_query_stream"
+    ) as mock_get_async_query_stream:
+        mock_get_async_query_stream.return_value.__aiter__.return_value = []
+        for _ in range(2):
+            assert await session.list_table_schema("MY_TABLE", "DB", "SCHEMA") == table_schema
+        assert mock_list_table_schema.call_count == 1
+
+        await session.execute_query("SELECT * FROM DB.SCHEMA.MY_TABLE")
+        await session.list_table_schema("MY_TABLE", "DB", "SCHEMA")
+        assert mock_list_table_schema.call_count == 1
+
+        await session.execute_query("ALTER TABLE DB.SCHEMA.MY_TABLE ADD COLUMN b INT")
+        await session.list_table_schema("MY_TABLE", "DB", "SCHEMA")
+        assert mock_list_table_schema.call_count == 2
@@ -1,6 +1,7 @@
 """
 Unit test for DatabricksSession
 """
+import json
 import os
 from unittest import mock
 from unittest.mock import call
@@ -11,7 +12,7 @@ import pytest
 
 from featurebyte.enum import DBVarType
 from featurebyte.session.base_spark import BaseSparkSchemaInitializer
-from featurebyte.session.databricks import DatabricksSession
+from featurebyte.session.databricks import ArrowTablePostProcessor, DatabricksSession
 
 
 @pytest.fixture
@@ -202,7 +203,7 @@ async def test_databricks_register_table(databricks_session_dict, databricks_con
     ) as mock_execute_query:
         with mock.patch("featurebyte.session.base_spark.S3SimpleStorage", autospec=True) as _:
             with mock.patch(
-                "featurebyte.session.databricks.pd.DataFrame.to_parquet", autospec=True
+                "featurebyte.session.base_spark.BaseSparkSession._write_parquet_part"
             ) as _:
                 session = DatabricksSession(**databricks_session_dict)
                 df = pd.DataFrame(
@@ -223,6 +224,85 @@ async def test_databricks_register_table(databricks_session_dict, databricks_con
                     assert mock_execute_query.call_args_list[-1][0][0].startswith(expected)
 
 
+@pytest.fixture(name="databricks_file_storage_session")
+def databricks_file_storage_session_fixture(
+    databricks_session_dict, databricks_connection, tmp_path
+):
+    """
+    DatabricksSession with local file storage
+    """
+    _ = databricks_connection
+    session_dict = {
+        **databricks_session_dict,
+        "storage_type": "file",
+        "storage_url": str(tmp_path),
+        "storage_spark_url": "dbfs:/FileStore/featurebyte",
+    }
+    return DatabricksSession(**session_dict)
+
+
+@pytest.mark.parametrize("temporary", [True, False])
+@pytest.mark.asyncio
+async def test_databricks_register_table__staged_parts(
+    databricks_file_storage_session, tmp_path, temporary
+):
+    """
+    Test register_table stages the dataframe in multiple parquet files and removes them
+    """
+    session = databricks_file_storage_session
+    df = pd.DataFrame(
+        {
+            "point_in_time": pd.to_datetime(
+                ["2022-01-01 00:00:00.1234567", "2022-01-02", "2022-01-03"]
+            ),
+            "cust_id": [1, 2, 3],
+        },
+    )
+    df_original = df.copy()
+    staged = []
+
+    async def mock_execute_query(query):
+        if "USING parquet" in query:
+            staged.append(pd.read_parquet(tmp_path))
+
+    with mock.patch("featurebyte.session.base_spark.REGISTER_TABLE_PART_NUM_ROWS", 2):
+        with mock.patch.object(DatabricksSession, "execute_query", side_effect=mock_execute_query):
+            await session.register_table("my_table", df, temporary)
+
+    # staged as multiple parts readable using the path pattern, input dataframe unchanged
+    pd.testing.assert_frame_equal(df, df_original)
+    assert len(staged) == 1
+    expected = df.copy()
+    expected["point_in_time"] = expected["point_in_time"].dt.floor("us")
+    pd.testing.assert_frame_equal(staged[0], expected)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_databricks_register_table__uncached(databricks_file_storage_session, tmp_path):
+    """
+    Test register_table without caching keeps the staged files until the table is dropped
+    """
+    session = databricks_file_storage_session
+    df = pd.DataFrame({"cust_id": [1, 2, 3]})
+
+    with mock.patch.object(DatabricksSession, "execute_query") as mock_execute_query:
+        await session.register_table("my_table", df, cache=False)
+        queries = [call_args.args[0] for call_args in mock_execute_query.call_args_list]
+        assert len(queries) == 1
+        assert queries[0].startswith(
+            "CREATE OR REPLACE TEMPORARY VIEW `my_table` USING parquet OPTIONS "
+            "(path 'dbfs:/FileStore/featurebyte/temp_"
+        )
+        assert queries[0].endswith("_part_*.parquet')")
+        assert len(list(tmp_path.iterdir())) == 1
+
+        await session.drop_table(
+            "my_table", schema_name="featurebyte", database_name="hive_metastore"
+        )
+        assert list(tmp_path.iterdir()) == []
+
+
 def test_databricks_sql_connector_not_available(databricks_session_dict):
     """
     Simulate missing databricks-sql-connector dependency
@@ -252,3 +332,80 @@ def test_databricks_schema_initializer__sql_objects(patched_databricks_session_c
         return sorted(lst, key=lambda x: x["filename"])
 
     assert _sorted_result(sql_objects) == _sorted_result(expected)
+
+
+@pytest.fixture(name="arrow_table_with_map_columns")
+def arrow_table_with_map_columns_fixture():
+    """
+    Arrow table with map columns as returned by databricks
+    """
+    float_maps = [
+        [("a", 1.0), ('b"x\\y\n', 2.5)],
+        None,
+        [],
+        [("c", None), ("d", float("nan")), ("e", -float("inf")), ("f", 1e-7), ("g", 1e20)],
+    ]
+    int_maps = [[("k", 1)], None, [], [("\u00e9", 2)]]
+    return pa.table(
+        {
+            "float_map": pa.array(float_maps, type=pa.map_(pa.string(), pa.float64())),
+            "int_map": pa.array(int_maps, type=pa.map_(pa.string(), pa.int64())),
+            "struct_map": pa.array(
+                [[("x", {"y": 1})], None, [], []],
+                type=pa.map_(pa.string(), pa.struct([("y", pa.int64())])),
+            ),
+            "other": [1, 2, 3, 4],
+        }
+    )
+
+
+def _expected_json_values(arrow_table, col_name):
+    return [
+        json.dumps(dict(value)) if value is not None else None
+        for value in arrow_table.column(col_name).to_pylist()
+    ]
+
+
+def test_arrow_table_post_processor__to_dataframe(arrow_table_with_map_columns):
+    """
+    Test map columns are converted to json strings
+    """
+    post_processor = ArrowTablePostProcessor(
+        schema={"float_map": "MAP", "int_map": "map", "struct_map": "MAP", "other": "INT"}
+    )
+    dataframe = post_processor.to_dataframe(arrow_table_with_map_columns)
+    assert dataframe["float_map"].tolist() == [
+        '{"a": 1.0, "b\\"x\\\\y\\n": 2.5}',
+        None,
+        "{}",
+        '{"c": null, "d": NaN, "e": -Infinity, "f": 1e-07, "g": 1e+20}',
+    ]
+    for col_name in ["int_map", "struct_map"]:
+        # non-ascii keys and nested values are converted using json.dumps
+        expected = _expected_json_values(arrow_table_with_map_columns, col_name)
+        assert dataframe[col_name].tolist() == expected
+    assert dataframe["other"].tolist() == [1, 2, 3, 4]
+
+
+def test_arrow_table_post_processor__to_arrow_table(arrow_table_with_map_columns):
+    """
+    Test map columns of sliced arrow tables are converted to json strings
+    """
+    post_processor = ArrowTablePostProcessor(
+        schema={"float_map": "MAP", "int_map": "MAP", "struct_map": "MAP", "other": "INT"}
+    )
+    arrow_table = arrow_table_with_map_columns.slice(1, 3)
+    converted = post_processor.to_arrow_table(arrow_table)
+    assert converted.column_names == arrow_table.column_names
+    for col_name in ["float_map", "int_map", "struct_map"]:
+        assert converted.schema.field(col_name).type == pa.string()
+        assert converted.column(col_name).to_pylist() == _expected_json_values(
+            arrow_table, col_name
+        )
+
+    # map columns kept as native arrow map arrays
+    post_processor = ArrowTablePostProcessor(
+        schema={"float_map": "MAP", "int_map": "MAP", "struct_map": "MAP", "other": "INT"},
+        keep_map_columns=True,
+    )
+    assert post_processor.to_arrow_table(arrow_table) is arrow_table
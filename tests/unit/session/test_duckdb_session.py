@@ -0,0 +1,146 @@
+"""
+Unit test for DuckDB session
+"""
+import json
+
+import pandas as pd
+import pytest
+
+from featurebyte.enum import DBVarType
+from featurebyte.session.duckdb import (
+    DuckDBSession,
+    count_dict_entropy,
+    count_dict_most_frequent,
+    count_dict_num_unique,
+    get_rank,
+    timezone_offset_to_second,
+)
+
+
+@pytest.fixture(name="duckdb_session")
+def duckdb_session_fixture():
+    """
+    DuckDBSession using an in-memory database
+    """
+    session = DuckDBSession(database_path=":memory:", featurebyte_schema="featurebyte")
+    yield session
+    session.connection.close()
+
+
+@pytest.mark.asyncio
+async def test_duckdb_session__metadata(duckdb_session):
+    """
+    Test listing databases, schemas, tables and table schema
+    """
+    await duckdb_session.execute_query(
+        """
+        CREATE TABLE type_table(
+            int_col INTEGER,
+            bigint_col BIGINT,
+            double_col DOUBLE,
+            decimal_col DECIMAL(10, 5),
+            bool_col BOOLEAN,
+            varchar_col VARCHAR,
+            date_col DATE,
+            ts_col TIMESTAMP,
+            ts_tz_col TIMESTAMPTZ,
+            list_col INTEGER[]
+        )
+        """
+    )
+    assert duckdb_session.database_name == "memory"
+    assert duckdb_session.schema_name == "featurebyte"
+    assert await duckdb_session.list_databases() == ["memory"]
+    assert {"featurebyte", "main"}.issubset(await duckdb_session.list_schemas())
+    assert await duckdb_session.list_tables(schema_name="featurebyte") == ["type_table"]
+    assert await duckdb_session.list_table_schema(
+        table_name="type_table", database_name="memory", schema_name="featurebyte"
+    ) == {
+        "int_col": DBVarType.INT,
+        "bigint_col": DBVarType.INT,
+        "double_col": DBVarType.FLOAT,
+        "decimal_col": DBVarType.FLOAT,
+        "bool_col": DBVarType.BOOL,
+        "varchar_col": DBVarType.VARCHAR,
+        "date_col": DBVarType.DATE,
+        "ts_col": DBVarType.TIMESTAMP,
+        "ts_tz_col": DBVarType.TIMESTAMP_TZ,
+        "list_col": DBVarType.ARRAY,
+    }
+
+
+@pytest.mark.asyncio
+async def test_duckdb_session__register_table(duckdb_session):
+    """
+    Test registering a dataframe as a table and reading it back
+    """
+    df = pd.DataFrame(
+        {
+            "ts": pd.to_datetime(["2022-01-01 10:00:00", "2022-01-02 10:00:00"]),
+            "cust_id": [1, 2],
+            "value": [1.5, None],
+        }
+    )
+    await duckdb_session.register_table("my_table", df)
+    df_result = await duckdb_session.execute_query('SELECT * FROM "my_table" ORDER BY "cust_id"')
+    pd.testing.assert_frame_equal(df_result, df, check_dtype=False)
+
+    # registering a temporary table again replaces it
+    await duckdb_session.register_table("my_table", df.iloc[:1])
+    df_result = await duckdb_session.execute_query('SELECT COUNT(*) AS "count" FROM "my_table"')
+    assert df_result["count"].iloc[0] == 1
+
+    # query with empty result
+    await duckdb_session.execute_query('DROP TABLE "my_table"')
+    assert await duckdb_session.list_tables(schema_name="featurebyte") == []
+    df_result = await duckdb_session.execute_query("SELECT 1 AS a WHERE 1 = 0")
+    assert df_result.columns.tolist() == ["a"]
+    assert df_result.shape[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_duckdb_session__functions(duckdb_session):
+    """
+    Test working schema functions are available
+    """
+    df_result = await duckdb_session.execute_query(
+        """
+        SELECT
+          F_TIMESTAMP_TO_INDEX(TIMESTAMP '2022-01-01 10:20:00', 1800, 900, 60) AS tile_index,
+          F_INDEX_TO_TIMESTAMP(455842, 1800, 900, 60) AS tile_ts,
+          OBJECT_DELETE('{"a": 1, "b": 2}', 'a') AS deleted,
+          F_COUNT_DICT_MOST_FREQUENT('{"a": 1, "b": 2}') AS most_frequent,
+          F_TIMEZONE_OFFSET_TO_SECOND('-05:30') AS offset_seconds
+        """
+    )
+    assert df_result.iloc[0].to_dict() == {
+        "tile_index": 455842,
+        "tile_ts": "2022-01-01T10:15:00.000Z",
+        "deleted": '{"b":2}',
+        "most_frequent": "b",
+        "offset_seconds": -19800.0,
+    }
+
+
+def test_count_dict_functions():
+    """
+    Test python implementation of count dict functions
+    """
+    counts = json.dumps({"a": 1, "b": 2, "c": 2})
+    assert count_dict_most_frequent(counts) == "b"
+    assert count_dict_most_frequent(None) is None
+    assert count_dict_num_unique(counts) == 3
+    assert count_dict_num_unique(None) == 0
+    assert count_dict_entropy(json.dumps({"a": 1, "b": 1})) == pytest.approx(0.693147, rel=1e-5)
+    assert get_rank(counts, "a", False) == 1
+    assert get_rank(counts, "a", True) == 3
+    assert get_rank(counts, "c", True) == 1
+    assert get_rank(counts, "d", True) is None
+
+
+def test_timezone_offset_to_second__invalid():
+    """
+    Test invalid timezone offset
+    """
+    with pytest.raises(ValueError):
+        timezone_offset_to_second("invalid")
@@ -0,0 +1,62 @@
+"""
+Unit tests for session executors
+"""
+import threading
+
+from featurebyte.enum import SourceType
+from featurebyte.session.executor import (
+    InstrumentedThreadPoolExecutor,
+    get_default_executor,
+    get_executor_metrics,
+    get_session_executor,
+)
+
+
+def test_instrumented_executor_metrics():
+    """
+    Test queue depth and wait time are tracked
+    """
+    executor = InstrumentedThreadPoolExecutor(max_workers=1, name="test_executor")
+    release_event = threading.Event()
+    started_event = threading.Event()
+
+    def blocking_call():
+        started_event.set()
+        release_event.wait()
+        return 1
+
+    futures = [executor.submit(blocking_call) for _ in range(3)]
+    started_event.wait()
+    metrics = executor.metrics
+    assert metrics.max_workers == 1
+    assert metrics.num_running == 1
+    assert metrics.num_queued == 2
+
+    # cancel a queued call
+    assert futures[-1].cancel()
+    assert executor.metrics.num_queued == 1
+
+    release_event.set()
+    assert [future.result() for future in futures[:2]] == [1, 1]
+    executor.shutdown(wait=True)
+    metrics = executor.metrics
+    assert metrics.num_queued == 0
+    assert metrics.num_running == 0
+    assert metrics.num_completed == 2
+    assert metrics.max_wait_time > 0
+    assert metrics.total_wait_time >= metrics.max_wait_time
+
+
+def test_get_session_executor(monkeypatch):
+    """
+    Test executors are shared by session type and sized by environment variables
+    """
+    monkeypatch.setenv("FEATUREBYTE_SQLITE_EXECUTOR_MAX_WORKERS", "3")
+    executor = get_session_executor(SourceType.SQLITE)
+    assert get_session_executor(SourceType.SQLITE) is executor
+    assert get_session_executor(SourceType.SNOWFLAKE) is not executor
+    assert executor.metrics.max_workers == 3
+    assert get_default_executor() is get_default_executor()
+
+    metrics = get_executor_metrics()
+    assert {"session_sqlite", "session_snowflake", "default"}.issubset(metrics)
@@ -0,0 +1,103 @@
+"""
+Unit tests for MetadataCache
+"""
+import collections
+import time
+
+import pytest
+
+from featurebyte.enum import DBVarType
+from featurebyte.session.metadata_cache import (
+    MetadataCache,
+    get_metadata_cache,
+    parse_ddl_table_name,
+)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ('CREATE OR REPLACE TEMP TABLE "my_table"(\n"a" INT)', (None, None, '"my_table"')),
+        (
+            "CREATE TABLE `db`.`schema`.`my_table` USING DELTA AS SELECT 1",
+            ("`db`", "`schema`", "`my_table`"),
+        ),
+        ("create table if not exists MY_TABLE as select 1", (None, None, "MY_TABLE")),
+        ('DROP TABLE IF EXISTS "DB"."SCHEMA"."MY_TABLE"', ('"DB"', '"SCHEMA"', '"MY_TABLE"')),
+        ("ALTER TABLE schema.my_table ADD COLUMN a INT", (None, "schema", "my_table")),
+        ("CREATE OR REPLACE TEMPORARY VIEW `my_view` AS SELECT 1", (None, None, "`my_view`")),
+        ("SELECT * FROM my_table", None),
+        ("CREATE SCHEMA my_schema", None),
+        ("MERGE INTO my_table a USING b ON a.x = b.x", None),
+    ],
+)
+def test_parse_ddl_table_name(query, expected):
+    """
+    Test parsing table names from DDL queries
+    """
+    assert parse_ddl_table_name(query) == expected
+
+
+def test_metadata_cache__get_and_set():
+    """
+    Test cached values are copies and expire after ttl
+    """
+    cache = MetadataCache(ttl=1)
+    key = MetadataCache.table_schema_key("DB", "SCHEMA", "MY_TABLE")
+    assert cache.get(key) is None
+
+    table_schema = collections.OrderedDict([("a", DBVarType.INT)])
+    cache.set(key, table_schema)
+    table_schema["b"] = DBVarType.FLOAT
+    cached = cache.get(key)
+    assert cached == collections.OrderedDict([("a", DBVarType.INT)])
+    cached["c"] = DBVarType.FLOAT
+    assert cache.get(key) == collections.OrderedDict([("a", DBVarType.INT)])
+
+    time.sleep(1.1)
+    assert cache.get(key) is None
+
+
+def test_metadata_cache__disabled():
+    """
+    Test nothing is cached when ttl is not positive
+    """
+    cache = MetadataCache(ttl=0)
+    key = MetadataCache.tables_key("DB", "SCHEMA")
+    cache.set(key, ["MY_TABLE"])
+    assert cache.get(key) is None
+
+
+def test_metadata_cache__invalidate_by_query():
+    """
+    Test DDL queries invalidate the affected table schema and table names
+    """
+    cache = MetadataCache(ttl=300)
+    my_table_key = MetadataCache.table_schema_key("DB", "SCHEMA", "MY_TABLE")
+    other_table_key = MetadataCache.table_schema_key("DB", "SCHEMA", "OTHER_TABLE")
+    other_schema_key = MetadataCache.table_schema_key("DB", "OTHER_SCHEMA", "MY_TABLE")
+    tables_key = MetadataCache.tables_key("DB", "SCHEMA")
+    for key in [my_table_key, other_table_key, other_schema_key, tables_key]:
+        cache.set(key, ["value"])
+
+    cache.invalidate_by_query("SELECT * FROM DB.SCHEMA.MY_TABLE")
+    assert cache.get(my_table_key) == ["value"]
+
+    cache.invalidate_by_query('DROP TABLE "db"."schema"."my_table"')
+    assert cache.get(my_table_key) is None
+    assert cache.get(tables_key) is None
+    assert cache.get(other_table_key) == ["value"]
+    assert cache.get(other_schema_key) == ["value"]
+
+    # unqualified table names invalidate the table in any schema
+    cache.invalidate_by_query("CREATE OR REPLACE TABLE OTHER_TABLE AS SELECT 1")
+    assert cache.get(other_table_key) is None
+
+
+def test_get_metadata_cache():
+    """
+    Test metadata caches are shared by feature store key
+    """
+    cache = get_metadata_cache("test_get_metadata_cache_key_1")
+    assert get_metadata_cache("test_get_metadata_cache_key_1") is cache
+    assert get_metadata_cache("test_get_metadata_cache_key_2") is not cache
@@ -0,0 +1,150 @@
+"""
+Unit tests for QueryScheduler
+"""
+import asyncio
+
+import pytest
+
+from featurebyte.session.enum import QueryPriority
+from featurebyte.session.query_scheduler import (
+    QueryScheduler,
+    get_current_query_priority,
+    get_query_scheduler,
+    query_priority,
+)
+
+
+async def run_query(scheduler, priority, name, events, hold_event=None):
+    """
+    Helper to simulate a query executed through the scheduler
+    """
+    async with scheduler.acquire(priority):
+        events.append(name)
+        if hold_event is not None:
+            await hold_event.wait()
+
+
+async def wait_until(condition):
+    """
+    Helper to wait until the condition is satisfied
+    """
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Condition not satisfied")
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_priority():
+    """
+    Test queries are limited by max_concurrency and queued queries are admitted by priority
+    """
+    scheduler = QueryScheduler(max_concurrency=1)
+    events = []
+    hold_event = asyncio.Event()
+
+    first = asyncio.create_task(
+        run_query(scheduler, QueryPriority.INTERACTIVE_PREVIEW, "first", events, hold_event)
+    )
+    await wait_until(lambda: events == ["first"])
+
+    waiting_tasks = [
+        asyncio.create_task(run_query(scheduler, priority, priority.value, events))
+        for priority in [
+            QueryPriority.BATCH_HISTORICAL,
+            QueryPriority.INTERACTIVE_PREVIEW,
+            QueryPriority.ONLINE_SERVING,
+            QueryPriority.SCHEDULED_TILE,
+        ]
+    ]
+    await wait_until(lambda: scheduler.metrics.num_queued == 4)
+    assert scheduler.metrics.num_running == 1
+
+    hold_event.set()
+    await asyncio.gather(first, *waiting_tasks)
+    assert events == [
+        "first",
+        "ONLINE_SERVING",
+        "SCHEDULED_TILE",
+        "INTERACTIVE_PREVIEW",
+        "BATCH_HISTORICAL",
+    ]
+    metrics = scheduler.metrics
+    assert metrics.num_running == 0
+    assert metrics.num_queued == 0
+    assert metrics.num_admitted == 5
+    assert metrics.num_waited == 4
+    assert metrics.max_wait_time > 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_waiting_query():
+    """
+    Test cancelling a queued query removes it from the queue
+    """
+    scheduler = QueryScheduler(max_concurrency=1)
+    events = []
+    hold_event = asyncio.Event()
+
+    first = asyncio.create_task(
+        run_query(scheduler, QueryPriority.INTERACTIVE_PREVIEW, "first", events, hold_event)
+    )
+    await wait_until(lambda: events == ["first"])
+    cancelled = asyncio.create_task(
+        run_query(scheduler, QueryPriority.ONLINE_SERVING, "cancelled", events)
+    )
+    other = asyncio.create_task(
+        run_query(scheduler, QueryPriority.BATCH_HISTORICAL, "other", events)
+    )
+    await wait_until(lambda: scheduler.metrics.num_queued == 2)
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert scheduler.metrics.num_queued == 1
+    assert scheduler.metrics.num_cancelled == 1
+
+    hold_event.set()
+    await asyncio.gather(first, other)
+    assert events == ["first", "other"]
+    assert scheduler.metrics.num_running == 0
+
+
+@pytest.mark.asyncio
+async def test_no_concurrency_limit():
+    """
+    Test queries are never queued when the concurrency limit is disabled
+    """
+    scheduler = QueryScheduler(max_concurrency=0)
+    events = []
+    hold_event = asyncio.Event()
+    tasks = [
+        asyncio.create_task(
+            run_query(scheduler, QueryPriority.INTERACTIVE_PREVIEW, i, events, hold_event)
+        )
+        for i in range(5)
+    ]
+    await wait_until(lambda: len(events) == 5)
+    assert scheduler.metrics.num_queued == 0
+    hold_event.set()
+    await asyncio.gather(*tasks)
+
+
+def test_query_priority_context():
+    """
+    Test query_priority context manager
+    """
+    assert get_current_query_priority() == QueryPriority.INTERACTIVE_PREVIEW
+    with query_priority(QueryPriority.ONLINE_SERVING):
+        assert get_current_query_priority() == QueryPriority.ONLINE_SERVING
+    assert get_current_query_priority() == QueryPriority.INTERACTIVE_PREVIEW
+
+
+def test_get_query_scheduler():
+    """
+    Test query schedulers are shared by feature store key
+    """
+    scheduler = get_query_scheduler("test_get_query_scheduler_key_1")
+    assert get_query_scheduler("test_get_query_scheduler_key_1") is scheduler
+    assert get_query_scheduler("test_get_query_scheduler_key_2") is not scheduler
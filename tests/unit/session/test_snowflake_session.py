@@ -515,6 +515,77 @@ def test_get_columns_schema_from_dataframe():
     assert schema == expected_schema
 
 
+def test_get_columns_schema_from_dataframe__timestamps():
+    """Test get_columns_schema_from_dataframe with timestamp columns"""
+    timestamps = pd.date_range("2022-01-01", periods=2)
+    dataframe = pd.DataFrame(
+        {
+            "ts_ntz": timestamps,
+            "ts_tz": timestamps.tz_localize("Asia/Singapore"),
+            "ts_ntz_object": timestamps.to_pydatetime(),
+            "ts_tz_object": pd.Series(
+                timestamps.tz_localize("Asia/Singapore").to_pydatetime(), dtype=object
+            ),
+        }
+    )
+    schema = SnowflakeSession.get_columns_schema_from_dataframe(dataframe)
+    assert schema == [
+        ("ts_ntz", "TIMESTAMP_NTZ"),
+        ("ts_tz", "TIMESTAMP_TZ"),
+        ("ts_ntz_object", "TIMESTAMP_NTZ"),
+        ("ts_tz_object", "TIMESTAMP_TZ"),
+    ]
+
+
+def test_prep_dataframe_before_write_pandas():
+    """
+    Test timestamp columns are kept as native timestamps and dataframe is only copied if required
+    """
+    timestamps = pd.date_range("2022-01-01 10:00:00", periods=2)
+    dataframe = pd.DataFrame({"ts_ntz": timestamps, "x": [1, 2]})
+    schema = SnowflakeSession.get_columns_schema_from_dataframe(dataframe)
+    prepared = SnowflakeSession._prep_dataframe_before_write_pandas(dataframe, schema)
+    assert prepared is dataframe
+
+    dataframe["ts_tz_object"] = pd.Series(
+        timestamps.tz_localize("Asia/Singapore").to_pydatetime(), dtype=object
+    )
+    schema = SnowflakeSession.get_columns_schema_from_dataframe(dataframe)
+    prepared = SnowflakeSession._prep_dataframe_before_write_pandas(dataframe, schema)
+    assert prepared is not dataframe
+    assert dataframe["ts_tz_object"].dtype == object
+    assert str(prepared["ts_tz_object"].dtype) == "datetime64[ns, UTC]"
+    assert prepared["ts_tz_object"].tolist() == [
+        pd.Timestamp("2022-01-01 02:00:00", tz="UTC"),
+        pd.Timestamp("2022-01-02 02:00:00", tz="UTC"),
+    ]
+    assert prepared["ts_ntz"].dtype == dataframe["ts_ntz"].dtype
+
+
+@pytest.mark.asyncio
+async def test_register_table(snowflake_connector, snowflake_session_dict):
+    """
+    Test register_table writes timestamps without converting them to strings
+    """
+    session = SnowflakeSession(**snowflake_session_dict)
+    dataframe = pd.DataFrame(
+        {"POINT_IN_TIME": pd.date_range("2022-01-01", periods=2), "CUST_ID": [1, 2]}
+    )
+    with patch(
+        "featurebyte.session.snowflake.SnowflakeSession.execute_query"
+    ) as mock_execute_query, patch(
+        "featurebyte.session.snowflake.write_pandas"
+    ) as mock_write_pandas:
+        await session.register_table("my_table", dataframe)
+
+    create_query = mock_execute_query.call_args.args[0]
+    assert '"POINT_IN_TIME" TIMESTAMP_NTZ' in create_query
+    args, kwargs = mock_write_pandas.call_args
+    assert args[1] is dataframe
+    assert args[2] == "my_table"
+    assert kwargs == {"coerce_timestamps": "us", "allow_truncated_timestamps": True}
+
+
 @pytest.mark.parametrize("error_type", [DatabaseError, OperationalError])
 def test_constructor__credentials_error(snowflake_connector, error_type, snowflake_session_dict):
     """
@@ -584,6 +655,25 @@ async def test_timeout(mock_fetch_query_stream_impl, snowflake_connector, snowfl
     mock_fetch_query_stream_impl.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_timeout__query_cancelled(snowflake_connector, snowflake_session_dict):
+    """
+    Test query is cancelled in Snowflake when execute_query times out
+    """
+    connection = snowflake_connector.connect.return_value
+    session = SnowflakeSession(**snowflake_session_dict)
+
+    query_cursor, cancel_cursor = Mock(name="query_cursor"), Mock(name="cancel_cursor")
+    query_cursor.sfqid = "some_query_id"
+    query_cursor.execute.side_effect = lambda *args, **kwargs: time.sleep(1)
+    connection.cursor.side_effect = [query_cursor, cancel_cursor]
+
+    with pytest.raises(QueryExecutionTimeOut):
+        await session.execute_query("SELECT * FROM T", timeout=0.1)
+    cancel_cursor.execute.assert_called_once_with("SELECT SYSTEM$CANCEL_QUERY('some_query_id')")
+    cancel_cursor.close.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_exception_handling_in_thread(snowflake_connector, snowflake_session_dict):
     """
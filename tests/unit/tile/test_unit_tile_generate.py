@@ -0,0 +1,133 @@
+"""
+Unit tests for TileGenerate
+"""
+import textwrap
+from unittest.mock import AsyncMock, Mock, patch
+
+import pandas as pd
+import pytest
+from bson import ObjectId
+
+from featurebyte.enum import SourceType
+from featurebyte.models.tile import TileType
+from featurebyte.service.tile_registry_service import TileRegistryService
+from featurebyte.session.snowflake import SnowflakeSession
+from featurebyte.sql.tile_generate import TileGenerate
+
+
+def get_tile_generate(session, cumulative_value_column_names):
+    """
+    Helper to create a TileGenerate instance
+    """
+    return TileGenerate(
+        session=session,
+        feature_store_id=ObjectId(),
+        tile_id="TILE_ID1",
+        aggregation_id="avg_1234",
+        time_modulo_frequency_second=60,
+        blind_spot_second=120,
+        frequency_minute=5,
+        sql="select index, cust_id, sum_value_avg_1234, count_value_avg_1234 from tiles",
+        entity_column_names=["cust_id"],
+        value_column_names=["sum_value_avg_1234", "count_value_avg_1234"],
+        value_column_types=["FLOAT", "FLOAT"],
+        cumulative_value_column_names=cumulative_value_column_names,
+        tile_type=TileType.OFFLINE,
+        last_tile_start_str=None,
+        tile_registry_service=Mock(spec=TileRegistryService),
+    )
+
+
+def get_mock_session(missing_tables):
+    """
+    Helper to create a mock session with the given tables missing
+    """
+
+    async def mock_execute_query(query):
+        for table_name in missing_tables:
+            if query == f"select * from {table_name} limit 1":
+                raise ValueError("table not found")
+        if "min(index)" in query:
+            return pd.DataFrame({"MIN_INDEX": [1000]})
+        return None
+
+    session = Mock(name="mock_snowflake_session", spec=SnowflakeSession)
+    session.source_type = SourceType.SNOWFLAKE
+    session._no_schema_error = ValueError
+    session.execute_query = AsyncMock(side_effect=mock_execute_query)
+    session.execute_query_long_running = session.execute_query
+    return session
+
+
+def get_executed_queries(session):
+    """
+    Helper to get the executed queries with normalized whitespaces
+    """
+    return [
+        textwrap.dedent(call.args[0]).strip() for call in session.execute_query.call_args_list
+    ]
+
+
+@pytest.fixture(autouse=True)
+def patch_tile_registry():
+    """
+    Patch TileRegistry which is not the subject of these tests
+    """
+    with patch("featurebyte.sql.tile_generate.TileRegistry.execute", new_callable=AsyncMock):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_tile_generate__no_cumulative_tiles():
+    """
+    Test cumulative tile table is not maintained by default
+    """
+    session = get_mock_session(missing_tables=[])
+    await get_tile_generate(session, cumulative_value_column_names=[]).execute()
+    assert not any("CUMULATIVE" in query for query in get_executed_queries(session))
+
+
+@pytest.mark.asyncio
+async def test_tile_generate__create_cumulative_tile_table():
+    """
+    Test cumulative tile table is created from the tile table when it does not exist
+    """
+    session = get_mock_session(missing_tables=["TILE_ID1_CUMULATIVE_avg_1234"])
+    await get_tile_generate(
+        session, cumulative_value_column_names=["count_value_avg_1234", "sum_value_avg_1234"]
+    ).execute()
+    create_query = get_executed_queries(session)[-1]
+    assert create_query.startswith("CREATE TABLE TILE_ID1_CUMULATIVE_avg_1234 AS")
+    assert (
+        'coalesce(sum(a.sum_value_avg_1234) over (partition by a."cust_id" order by a.index '
+        "rows between unbounded preceding and current row), 0) as sum_value_avg_1234"
+    ) in create_query
+    assert "from TILE_ID1 a" in create_query
+    assert "left join" not in create_query
+
+
+@pytest.mark.asyncio
+async def test_tile_generate__update_cumulative_tile_table():
+    """
+    Test cumulative tile table is updated starting from the first tile index of the run
+    """
+    session = get_mock_session(missing_tables=[])
+    await get_tile_generate(
+        session, cumulative_value_column_names=["count_value_avg_1234", "sum_value_avg_1234"]
+    ).execute()
+    queries = get_executed_queries(session)
+    assert queries[-3].startswith("select min(index) as MIN_INDEX from (select index, cust_id")
+    assert queries[-2] == "delete from TILE_ID1_CUMULATIVE_avg_1234 where index >= 1000"
+    insert_query = queries[-1]
+    assert insert_query.startswith(
+        'insert into TILE_ID1_CUMULATIVE_avg_1234 (index, "cust_id", count_value_avg_1234, '
+        "sum_value_avg_1234, CUMULATIVE_TILE_COUNT)"
+    )
+    assert (
+        "coalesce(b.sum_value_avg_1234, 0) + coalesce(sum(a.sum_value_avg_1234) over "
+        '(partition by a."cust_id" order by a.index rows between unbounded preceding and current '
+        "row), 0) as sum_value_avg_1234"
+    ) in insert_query
+    assert 'on EQUAL_NULL(a."cust_id", b."cust_id")' in insert_query
+    assert "where index < 1000" in insert_query
+    assert "where a.index >= 1000" in insert_query